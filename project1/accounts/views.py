@@ -6,6 +6,8 @@ from django.contrib.auth.views import LoginView, LogoutView
 from django.contrib.auth.decorators import login_required
 from django.utils.decorators import method_decorator
 from .forms import SignUpForm, ProfileUpdateForm
+from learning.summaries import summary_for
+from project1.routers import reads_from_replica
 
 class CustomLoginView(LoginView):
     template_name = 'accounts/login.html'
@@ -34,8 +36,9 @@ def signup(request):
     return render(request, 'accounts/signup.html', {'form': form})
 
 @login_required
+@reads_from_replica
 def profile(request):
-    return render(request, 'accounts/profile.html')
+    return render(request, 'accounts/profile.html', {'summary': summary_for(request.user)})
 
 @login_required
 def settings_view(request):
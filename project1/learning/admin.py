@@ -1,5 +1,6 @@
 from django.contrib import admin
-from .models import (LevelDefinition, Lesson, Quiz, Question, Choice, QuizAttempt, Task, TaskSubmission, UserProgress)
+from .models import (LevelDefinition, Lesson, Quiz, Question, Choice, QuizAttempt, Task, TaskSubmission, UserProgress, PointsLedger, LearnerSummary, ScormPackage)
+from .review import review_submissions
 
 class ChoiceInline(admin.TabularInline):
     model = Choice
@@ -24,9 +25,10 @@ class QuestionAdmin(admin.ModelAdmin):
 @admin.register(Lesson)
 class LessonAdmin(admin.ModelAdmin):
     prepopulated_fields = {"slug": ("title",)}
-    list_display = ('title', 'eco_points', 'is_published', 'created_at')
+    list_display = ('title', 'eco_points', 'is_published', 'publish_at', 'unpublish_at', 'scorm', 'created_at')
     list_filter = ('is_published',)
     search_fields = ('title', 'short_description')
+    readonly_fields = ('scorm_error',)
 
 @admin.register(LevelDefinition)
 class LevelDefinitionAdmin(admin.ModelAdmin):
@@ -40,9 +42,20 @@ class TaskAdmin(admin.ModelAdmin):
 
 @admin.register(TaskSubmission)
 class TaskSubmissionAdmin(admin.ModelAdmin):
-    list_display = ('task', 'user', 'status', 'submitted_at', 'awarded_points')
-    list_filter = ('status', 'task')
+    list_display = ('task', 'user', 'status', 'photo_state', 'submitted_at', 'awarded_points')
+    list_filter = ('status', 'photo_state', 'task')
     search_fields = ('user__username', 'task__title')
+    actions = ('approve_selected', 'reject_selected')
+
+    @admin.action(description='Approve selected pending submissions')
+    def approve_selected(self, request, queryset):
+        count = review_submissions(queryset.values_list('pk', flat=True), approve=True)
+        self.message_user(request, f'{count} submission(s) approved.')
+
+    @admin.action(description='Reject selected pending submissions')
+    def reject_selected(self, request, queryset):
+        count = review_submissions(queryset.values_list('pk', flat=True), approve=False)
+        self.message_user(request, f'{count} submission(s) rejected.')
 
 @admin.register(QuizAttempt)
 class QuizAttemptAdmin(admin.ModelAdmin):
@@ -52,3 +65,24 @@ class QuizAttemptAdmin(admin.ModelAdmin):
 @admin.register(UserProgress)
 class UserProgressAdmin(admin.ModelAdmin):
     list_display = ('user', 'total_points', 'current_level', 'updated_at')
+
+
+@admin.register(PointsLedger)
+class PointsLedgerAdmin(admin.ModelAdmin):
+    list_display = ('user', 'source_type', 'source_id', 'delta', 'created_at')
+    list_filter = ('source_type',)
+    search_fields = ('user__username',)
+
+
+@admin.register(LearnerSummary)
+class LearnerSummaryAdmin(admin.ModelAdmin):
+    list_display = ('user', 'lessons_completed', 'quiz_attempts', 'tasks_approved', 'last_activity_at')
+    search_fields = ('user__username',)
+    readonly_fields = ('updated_at',)
+
+
+@admin.register(ScormPackage)
+class ScormPackageAdmin(admin.ModelAdmin):
+    list_display = ('__str__', 'version', 'launch_path', 'file_count', 'total_size', 'created_at')
+    search_fields = ('title', 'sha256')
+    readonly_fields = ('sha256', 'items', 'file_count', 'total_size', 'created_at')
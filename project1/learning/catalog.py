@@ -0,0 +1,72 @@
+from django.db.models import Exists, OuterRef, Prefetch, Subquery
+
+from .models import Lesson, Quiz, QuizAttempt
+
+PAGE_SIZE = 24
+
+# Columns the catalog cards need; html_content can be megabytes per lesson
+CARD_FIELDS = ('id', 'title', 'slug', 'short_description', 'cover_image', 'eco_points')
+
+
+def _completed_attempts(user):
+    return QuizAttempt.objects.filter(user=user, completed_at__isnull=False)
+
+
+def catalog_queryset(user):
+    """Published lessons as card projections, annotated with the user's
+    ``best_score`` (highest completed quiz score, or None) and ``completed``."""
+    attempts = _completed_attempts(user).filter(quiz__lesson=OuterRef('pk'))
+    return (
+        Lesson.objects.filter(is_published=True)
+        .only(*CARD_FIELDS)
+        .annotate(
+            best_score=Subquery(attempts.order_by('-score_percent').values('score_percent')[:1]),
+            completed=Exists(attempts),
+        )
+        .order_by('id')
+    )
+
+
+def _page_queryset(user, after, limit):
+    lessons = catalog_queryset(user)
+    if after:
+        lessons = lessons.filter(pk__gt=after)
+    return lessons[:limit + 1]
+
+
+def _split_page(page, limit):
+    next_after = page[limit - 1].pk if len(page) > limit else None
+    return page[:limit], next_after
+
+
+def catalog_page(user, after=None, limit=PAGE_SIZE):
+    """One page of the catalog after lesson id ``after``.
+
+    Fetches a single extra row to learn whether another page exists, so a page
+    is one query however large the catalog grows. Returns ``(lessons, next_after)``.
+    """
+    return _split_page(list(_page_queryset(user, after, limit)), limit)
+
+
+async def acatalog_page(user, after=None, limit=PAGE_SIZE):
+    """catalog_page for async views."""
+    return _split_page([lesson async for lesson in _page_queryset(user, after, limit)], limit)
+
+
+def quizzes_with_last_attempt(user):
+    """Quizzes annotated with the user's latest completed ``last_score`` and ``last_points``."""
+    latest = _completed_attempts(user).filter(quiz=OuterRef('pk')).order_by('-completed_at')
+    return Quiz.objects.annotate(
+        last_score=Subquery(latest.values('score_percent')[:1]),
+        last_points=Subquery(latest.values('earned_points')[:1]),
+    ).order_by('id')
+
+
+def lesson_detail_queryset(user):
+    """Published lessons with their quizzes prefetched via
+    quizzes_with_last_attempt (two queries)."""
+    return (
+        Lesson.objects.filter(is_published=True)
+        .select_related('scorm')
+        .prefetch_related(Prefetch('quizzes', queryset=quizzes_with_last_attempt(user)))
+    )
@@ -1,5 +1,5 @@
 from django import forms
-from .models import Lesson
+from .models import Lesson, TaskSubmission
 from django.utils.text import slugify
 
 
@@ -15,11 +15,15 @@ class LessonForm(forms.ModelForm):
             'video_url',
             'resource_file',
             'eco_points',
-            'is_published'
+            'is_published',
+            'publish_at',
+            'unpublish_at',
         ]
         widgets = {
             'short_description': forms.Textarea(attrs={'rows': 3, 'class': 'form-control'}),
             'html_content': forms.Textarea(attrs={'rows': 8, 'class': 'form-control monospace'}),
+            'publish_at': forms.DateTimeInput(attrs={'type': 'datetime-local', 'class': 'form-control'}, format='%Y-%m-%dT%H:%M'),
+            'unpublish_at': forms.DateTimeInput(attrs={'type': 'datetime-local', 'class': 'form-control'}, format='%Y-%m-%dT%H:%M'),
         }
 
     def __init__(self, *args, **kwargs):
@@ -35,6 +39,13 @@ class LessonForm(forms.ModelForm):
             self.fields['resource_file'].widget.attrs.update({'class': 'form-control'})
         self.fields['is_published'].widget.attrs.update({'class': 'form-check-input'})
 
+    def clean(self):
+        cleaned = super().clean()
+        publish_at, unpublish_at = cleaned.get('publish_at'), cleaned.get('unpublish_at')
+        if publish_at and unpublish_at and unpublish_at <= publish_at:
+            self.add_error('unpublish_at', 'Must be later than the publish time.')
+        return cleaned
+
     def save(self, commit=True):
         instance = super().save(commit=False)
         if not instance.slug:
@@ -67,3 +78,33 @@ class LessonForm(forms.ModelForm):
                 vid = m.group('id')
                 return f'https://www.youtube.com/embed/{vid}'
         return url
+
+
+class TaskSubmissionForm(forms.ModelForm):
+    # A plain FileField: decoding the image here would hold the request while
+    # Pillow reads it. The background job verifies and re-encodes it instead.
+    photo = forms.FileField(required=False, widget=forms.ClearableFileInput(attrs={'class': 'form-control', 'accept': 'image/*'}))
+
+    PHOTO_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.webp', '.gif')
+
+    class Meta:
+        model = TaskSubmission
+        fields = ['photo', 'notes']
+        widgets = {
+            'notes': forms.Textarea(attrs={'rows': 3, 'class': 'form-control'}),
+        }
+
+    def __init__(self, *args, task=None, upload_too_large=False, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.task = task
+        self.upload_too_large = upload_too_large
+
+    def clean_photo(self):
+        photo = self.cleaned_data.get('photo')
+        if self.upload_too_large:
+            raise forms.ValidationError('The photo is too large. Please upload a smaller image.')
+        if photo and not photo.name.lower().endswith(self.PHOTO_EXTENSIONS):
+            raise forms.ValidationError('Please upload a JPEG, PNG, WebP or GIF image.')
+        if not photo and self.task is not None and self.task.requires_photo:
+            raise forms.ValidationError('This task requires a photo.')
+        return photo
@@ -0,0 +1,92 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import partial
+
+from django.core.cache import cache
+from django.db import transaction
+
+from .models import Question
+from .versioning import bump_version, get_version
+
+# Answer keys are cached per quiz under a version number that is bumped by
+# signals whenever the quiz, one of its questions or one of its choices changes.
+ANSWER_KEY_TTL = 60 * 60 * 24
+
+_deferred = ContextVar('answer_key_invalidation_deferred', default=False)
+
+
+def answer_key_version(quiz_id):
+    return get_version(f'answer_key:{quiz_id}')
+
+
+def invalidate_answer_key(quiz_id):
+    """Bump the answer key version so the next grading rebuilds it.
+
+    The bump waits for the current transaction to commit; bumped earlier, a
+    concurrent grading could cache the old key under the new version.
+    """
+    transaction.on_commit(partial(bump_version, f'answer_key:{quiz_id}'))
+
+
+@contextmanager
+def deferred_invalidation():
+    """Skip per-row signal invalidation; the caller invalidates once when done."""
+    token = _deferred.set(True)
+    try:
+        yield
+    finally:
+        _deferred.reset(token)
+
+
+def invalidation_deferred():
+    return _deferred.get()
+
+
+def build_answer_key(quiz_id):
+    """Return {question_id: frozenset(correct_choice_ids)} for every question of the quiz."""
+    key = {}
+    rows = Question.objects.filter(quiz_id=quiz_id).values_list('id', 'choices__id', 'choices__is_correct')
+    for question_id, choice_id, is_correct in rows:
+        correct = key.setdefault(question_id, set())
+        if is_correct:
+            correct.add(choice_id)
+    return {question_id: frozenset(ids) for question_id, ids in key.items()}
+
+
+def get_answer_key(quiz_id):
+    cache_key = f'learning:answer_key:{quiz_id}:v{answer_key_version(quiz_id)}'
+    answer_key = cache.get(cache_key)
+    if answer_key is None:
+        answer_key = build_answer_key(quiz_id)
+        cache.set(cache_key, answer_key, ANSWER_KEY_TTL)
+    return answer_key
+
+
+def grade(answer_key, answers):
+    """Grade a submission against an answer key.
+
+    ``answers`` maps question ids to the selected choice id (as submitted,
+    usually strings). Returns a ``(correct, total)`` tuple.
+    """
+    correct = 0
+    for question_id, correct_ids in answer_key.items():
+        selected = answers.get(question_id)
+        if not selected:
+            continue
+        try:
+            selected = int(selected)
+        except (TypeError, ValueError):
+            continue
+        if selected in correct_ids:
+            correct += 1
+    return correct, len(answer_key)
+
+
+def answers_from_post(answer_key, data):
+    """Pull ``question_<id>`` fields out of a POST QueryDict for the keyed questions."""
+    return {question_id: data.get(f'question_{question_id}') for question_id in answer_key}
+
+
+def grade_submission(quiz, data):
+    answer_key = get_answer_key(quiz.pk)
+    return grade(answer_key, answers_from_post(answer_key, data))
@@ -0,0 +1,199 @@
+from datetime import datetime, timedelta
+from functools import partial
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import F, Q, Sum
+from django.utils import timezone
+
+from .models import LeaderboardEntry, PointsLedger
+
+BOARDS = (LeaderboardEntry.BOARD_GLOBAL, LeaderboardEntry.BOARD_WEEKLY, LeaderboardEntry.BOARD_MONTHLY)
+PAGE_SIZE = 25
+
+
+def period_key(board, when=None):
+    """Period identifier of ``board`` containing ``when`` (defaults to now)."""
+    if board == LeaderboardEntry.BOARD_GLOBAL:
+        return ''
+    day = timezone.localdate(when) if when else timezone.localdate()
+    if board == LeaderboardEntry.BOARD_WEEKLY:
+        year, week, _ = day.isocalendar()
+        return f'{year}-W{week:02d}'
+    if board == LeaderboardEntry.BOARD_MONTHLY:
+        return f'{day.year}-{day.month:02d}'
+    raise ValueError(f'Unknown leaderboard: {board}')
+
+
+def period_bounds(board, period):
+    """Aware (start, end) datetimes covered by a period, or (None, None) for all time."""
+    if board == LeaderboardEntry.BOARD_GLOBAL:
+        return None, None
+    if board == LeaderboardEntry.BOARD_WEEKLY:
+        start = datetime.strptime(f'{period}-1', '%G-W%V-%u')
+        end = start + timedelta(days=7)
+    else:
+        start = datetime.strptime(period, '%Y-%m')
+        end = (start + timedelta(days=32)).replace(day=1)
+    return timezone.make_aware(start), timezone.make_aware(end)
+
+
+# With REDIS_URL set, every board period is mirrored into a Redis sorted set
+# so rank_of() costs O(log n) whatever the rank. The mirror follows committed
+# awards only; rebuild_board() (the rebuild_leaderboards command) reloads it
+# from the database, e.g. after Redis is first configured.
+_redis = None
+
+
+def rank_store():
+    """Redis client holding the sorted sets, or None without REDIS_URL."""
+    global _redis
+    if _redis is None and getattr(settings, 'REDIS_URL', None):
+        import redis
+        _redis = redis.Redis.from_url(settings.REDIS_URL)
+    return _redis
+
+
+def _zkey(board, period):
+    return f'learning:leaderboard:{board}:{period}'
+
+
+def _mirror_award(keys, user_id, delta):
+    with rank_store().pipeline(transaction=False) as pipe:
+        for board, period in keys:
+            pipe.zincrby(_zkey(board, period), delta, user_id)
+        pipe.execute()
+
+
+def _mirror_board(board, period, entries, chunk_size):
+    store, key = rank_store(), _zkey(board, period)
+    staging = f'{key}:rebuild'
+    store.delete(staging)
+    for start in range(0, len(entries), chunk_size):
+        store.zadd(staging, dict(entries[start:start + chunk_size]))
+    if entries:
+        store.rename(staging, key)
+    else:
+        store.delete(key)
+
+
+def record_award(user_id, delta, when=None):
+    """Add ``delta`` to the user's entry on every board for the period containing ``when``.
+
+    Existing entries are bumped with a single UPDATE; rows only need inserting
+    the first time a user scores in a new week or month.
+    """
+    keys = {(board, period_key(board, when)) for board in BOARDS}
+    match = Q()
+    for board, period in keys:
+        match |= Q(board=board, period=period)
+    if rank_store() is not None:
+        transaction.on_commit(partial(_mirror_award, keys, user_id, delta))
+    entries = LeaderboardEntry.objects.filter(match, user_id=user_id)
+    if entries.update(points=F('points') + delta, updated_at=timezone.now()) == len(keys):
+        return
+    existing = set(entries.values_list('board', 'period'))
+    for board, period in keys - existing:
+        try:
+            with transaction.atomic():
+                LeaderboardEntry.objects.create(board=board, period=period, user_id=user_id, points=delta)
+        except IntegrityError:
+            # Another request created the row first; fall back to incrementing it
+            LeaderboardEntry.objects.filter(board=board, period=period, user_id=user_id).update(
+                points=F('points') + delta, updated_at=timezone.now(),
+            )
+
+
+def board_entries(board, period=None):
+    if period is None:
+        period = period_key(board)
+    return LeaderboardEntry.objects.filter(board=board, period=period)
+
+
+def rank_of(user, board, period=None):
+    """Return ``(rank, points)`` for the user, or ``None`` if they have not scored.
+
+    Ties share a rank. With Redis this is a ZSCORE and a ZCOUNT on the board's
+    sorted set, O(log n) in the board size. Otherwise it counts the entries
+    scoring higher through the (board, period, points) index: an index-only
+    range scan, O(rank), so it is cheap near the top and slows towards the
+    bottom of a large board.
+    """
+    if period is None:
+        period = period_key(board)
+    user_id = getattr(user, 'pk', user)
+    store = rank_store()
+    if store is not None:
+        key = _zkey(board, period)
+        points = store.zscore(key, user_id)
+        if points is not None:
+            return store.zcount(key, f'({points}', '+inf') + 1, int(points)
+    entries = board_entries(board, period)
+    points = entries.filter(user_id=user_id).values_list('points', flat=True).first()
+    if points is None:
+        return None
+    return entries.filter(points__gt=points).count() + 1, points
+
+
+def encode_cursor(entry):
+    return f'{entry.points}:{entry.user_id}'
+
+
+def decode_cursor(cursor):
+    try:
+        points, user_id = cursor.split(':')
+        return int(points), int(user_id)
+    except (AttributeError, ValueError):
+        return None
+
+
+def leaderboard_page(board, period=None, after=None, limit=PAGE_SIZE):
+    """One keyset-paginated page ordered by points, then user id.
+
+    Returns ``(entries, next_cursor)``; each entry carries a ``rank`` attribute.
+    """
+    entries = board_entries(board, period)
+    cursor = decode_cursor(after) if after else None
+    page = entries.select_related('user').order_by('-points', 'user_id')
+    if cursor:
+        points, user_id = cursor
+        page = page.filter(Q(points__lt=points) | Q(points=points, user_id__gt=user_id))
+    rows = list(page[:limit + 1])
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    if rows:
+        first = rows[0]
+        rank = entries.filter(points__gt=first.points).count() + 1
+        # Rows tied with the first one that were already shown on earlier pages
+        offset = rank + entries.filter(points=first.points, user_id__lt=first.user_id).count()
+        for position, entry in enumerate(rows):
+            if position and entry.points != rows[position - 1].points:
+                rank = offset + position
+            entry.rank = rank
+    return rows, (encode_cursor(rows[-1]) if has_more else None)
+
+
+def rebuild_board(board, period=None, chunk_size=1000):
+    """Recompute one board period from the points ledger, replacing its entries."""
+    if period is None:
+        period = period_key(board)
+    start, end = period_bounds(board, period)
+    ledger = PointsLedger.objects.all()
+    if start is not None:
+        ledger = ledger.filter(created_at__gte=start, created_at__lt=end)
+    totals = ledger.values('user_id').annotate(points=Sum('delta')).order_by('user_id')
+    created = 0
+    with transaction.atomic():
+        board_entries(board, period).delete()
+        batch = []
+        for row in totals.iterator(chunk_size=chunk_size):
+            batch.append(LeaderboardEntry(board=board, period=period, user_id=row['user_id'], points=row['points']))
+            if len(batch) >= chunk_size:
+                created += len(LeaderboardEntry.objects.bulk_create(batch))
+                batch = []
+        if batch:
+            created += len(LeaderboardEntry.objects.bulk_create(batch))
+        if rank_store() is not None:
+            mirrored = list(board_entries(board, period).values_list('user_id', 'points'))
+            transaction.on_commit(partial(_mirror_board, board, period, mirrored, chunk_size))
+    return created
@@ -0,0 +1,109 @@
+import threading
+import time
+from bisect import bisect_right
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import BigIntegerField, Case, Value, When
+from django.db.models.lookups import GreaterThanOrEqual
+
+from .models import LevelDefinition
+from .versioning import aget_version, bump_version, get_version
+
+VERSION_NAME = 'levels'
+
+
+class LevelIndex:
+    """Sorted required_points thresholds with the matching levels, resolved by bisection."""
+
+    def __init__(self, levels):
+        self.levels = sorted(levels, key=lambda level: level.required_points)
+        self.thresholds = [level.required_points for level in self.levels]
+        self.ids = [level.pk for level in self.levels]
+        self.by_id = {level.pk: level for level in self.levels}
+
+    def level_for(self, total_points):
+        idx = bisect_right(self.thresholds, total_points)
+        return self.levels[idx - 1] if idx else None
+
+    def level_id_for(self, total_points):
+        idx = bisect_right(self.thresholds, total_points)
+        return self.ids[idx - 1] if idx else None
+
+    def get(self, level_id):
+        return self.by_id.get(level_id)
+
+    def expression(self, total):
+        """CASE expression resolving the level id for ``total`` inside an UPDATE."""
+        whens = [
+            When(GreaterThanOrEqual(total, Value(required)), then=Value(level_id))
+            for required, level_id in zip(reversed(self.thresholds), reversed(self.ids))
+        ]
+        return Case(*whens, default=Value(None), output_field=BigIntegerField())
+
+
+_lock = threading.Lock()
+_index = None
+_index_version = None
+_checked_at = 0.0
+
+
+def check_interval():
+    """Seconds a process trusts its index before re-reading the shared version;
+    level edits reach other processes within this long."""
+    return getattr(settings, 'LEVEL_INDEX_CHECK_SECONDS', 5)
+
+
+def _needs_check(now):
+    return _index is None or now - _checked_at >= check_interval()
+
+
+def get_level_index():
+    """Process-local index, rebuilt when another process bumps the version key.
+
+    The version lives in the shared cache, which may be a database table, so
+    it is read at most once per check_interval(); in between no query is made.
+    """
+    global _index, _index_version, _checked_at
+    now = time.monotonic()
+    if _needs_check(now):
+        version = get_version(VERSION_NAME)
+        with _lock:
+            if _index is None or _index_version != version:
+                _index = LevelIndex(LevelDefinition.objects.all())
+                _index_version = version
+            _checked_at = now
+    return _index
+
+
+async def aget_level_index():
+    """get_level_index for async views; a rebuild reads through the async ORM."""
+    global _index, _index_version, _checked_at
+    now = time.monotonic()
+    if _needs_check(now):
+        version = await aget_version(VERSION_NAME)
+        if _index is None or _index_version != version:
+            levels = [level async for level in LevelDefinition.objects.all()]
+            with _lock:
+                _index = LevelIndex(levels)
+                _index_version = version
+        _checked_at = now
+    return _index
+
+
+def forget_level_index():
+    """Drop this process's index so the next lookup rebuilds it."""
+    global _index
+    _index = None
+
+
+def _reset_level_index():
+    bump_version(VERSION_NAME)
+    forget_level_index()
+
+
+def invalidate_level_index():
+    """Make every process rebuild its index once the current transaction
+    commits; bumped earlier, another worker could rebuild from the old
+    thresholds and keep them under the new version."""
+    transaction.on_commit(_reset_level_index)
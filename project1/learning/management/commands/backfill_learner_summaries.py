@@ -0,0 +1,74 @@
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.db.models import Count, Max, Q
+from learning.models import LearnerSummary, QuizAttempt, TaskSubmission
+
+SUMMARY_FIELDS = ['lessons_completed', 'quiz_attempts', 'best_scores', 'tasks_approved', 'last_activity_at']
+
+
+class Command(BaseCommand):
+    help = 'Rebuild LearnerSummary rows from quiz attempts and task submissions'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=1000,
+            help='Number of users to summarize per transaction',
+        )
+
+    def handle(self, *args, **options):
+        chunk_size = options['chunk_size']
+        if chunk_size < 1:
+            raise CommandError('--chunk-size must be positive')
+        users = get_user_model().objects.order_by('pk').values_list('pk', flat=True)
+        written = 0
+        last_pk = 0
+        while True:
+            user_ids = list(users.filter(pk__gt=last_pk)[:chunk_size])
+            if not user_ids:
+                break
+            last_pk = user_ids[-1]
+            with transaction.atomic():
+                written += len(LearnerSummary.objects.bulk_create(
+                    self.summarize(user_ids),
+                    update_conflicts=True,
+                    unique_fields=['user'],
+                    update_fields=SUMMARY_FIELDS,
+                ))
+            self.stdout.write(f'  summarized users up to id {last_pk}')
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt {written} learner summar{"y" if written == 1 else "ies"}'))
+
+    def summarize(self, user_ids):
+        summaries = {user_id: LearnerSummary(user_id=user_id, best_scores={}) for user_id in user_ids}
+        completed = QuizAttempt.objects.filter(user_id__in=user_ids, completed_at__isnull=False)
+
+        per_quiz = completed.values_list('user_id', 'quiz_id').annotate(
+            best=Max('score_percent'), attempts=Count('id'), last=Max('completed_at'),
+        ).order_by()
+        for user_id, quiz_id, best, attempts, last in per_quiz:
+            summary = summaries[user_id]
+            summary.best_scores[str(quiz_id)] = float(best or 0)
+            summary.quiz_attempts += attempts
+            self.touch(summary, last)
+
+        lessons = completed.values_list('user_id').annotate(lessons=Count('quiz__lesson', distinct=True)).order_by()
+        for user_id, count in lessons:
+            summaries[user_id].lessons_completed = count
+
+        tasks = (
+            TaskSubmission.objects.filter(user_id__in=user_ids)
+            .values_list('user_id')
+            .annotate(approved=Count('id', filter=Q(status='approved')), last=Max('submitted_at'))
+            .order_by()
+        )
+        for user_id, approved, last in tasks:
+            summaries[user_id].tasks_approved = approved
+            self.touch(summaries[user_id], last)
+        return list(summaries.values())
+
+    @staticmethod
+    def touch(summary, when):
+        if when and (summary.last_activity_at is None or when > summary.last_activity_at):
+            summary.last_activity_at = when
@@ -0,0 +1,43 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from mriic.caching import SHARED_CACHE_ALIAS, is_process_local, shared_cache
+from learning.quiz_sessions import UPDATE_BATCH_SIZE, close_expired_attempts
+
+
+class Command(BaseCommand):
+    help = 'Grade and close quiz attempts whose deadline has passed'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--loop',
+            action='store_true',
+            help='Keep running, sweeping every --interval seconds',
+        )
+        parser.add_argument(
+            '--interval',
+            type=float,
+            default=30,
+            help='Seconds between sweeps with --loop',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=UPDATE_BATCH_SIZE,
+            help='Attempts closed per transaction',
+        )
+
+    def handle(self, *args, **options):
+        if is_process_local(shared_cache()):
+            # Autosaves made by the web workers are invisible from here
+            raise CommandError(
+                f'The {SHARED_CACHE_ALIAS!r} cache is local to this process; configure a shared backend '
+                '(database or Redis) so autosaved answers can be graded'
+            )
+        while True:
+            closed = close_expired_attempts(batch_size=options['batch_size'])
+            if closed or not options['loop']:
+                self.stdout.write(self.style.SUCCESS(f'Closed {closed} expired attempt(s)'))
+            if not options['loop']:
+                return
+            time.sleep(options['interval'])
@@ -0,0 +1,42 @@
+from django.core.management.base import BaseCommand
+from learning import scorm
+from learning.models import Lesson
+
+
+class Command(BaseCommand):
+    help = 'Extract and index uploaded SCORM packages into the content-addressed cache'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--lesson',
+            action='append',
+            help='Only ingest the package of this lesson slug (repeatable)',
+        )
+        parser.add_argument(
+            '--force',
+            action='store_true',
+            help='Re-ingest lessons that are already linked to an extracted package',
+        )
+
+    def handle(self, *args, **options):
+        lessons = Lesson.objects.exclude(scorm_package='').exclude(scorm_package__isnull=True).only('pk', 'slug', 'scorm_package')
+        if options['lesson']:
+            lessons = lessons.filter(slug__in=options['lesson'])
+        if not options['force']:
+            lessons = lessons.filter(scorm__isnull=True)
+        ingested = failed = 0
+        packages = set()
+        for lesson in lessons.iterator():
+            try:
+                package = scorm.ingest(lesson)
+            except (OSError, scorm.PackageError) as exc:
+                failed += 1
+                scorm.record_failure(lesson.pk, exc)
+                self.stderr.write(f'{lesson.slug}: {exc}')
+                continue
+            ingested += 1
+            packages.add(package.pk)
+            self.stdout.write(f'{lesson.slug}: {package.sha256[:12]} ({package.file_count} files)')
+        self.stdout.write(self.style.SUCCESS(
+            f'Ingested {ingested} lesson(s) into {len(packages)} package(s); {failed} failed'
+        ))
@@ -1,36 +1,81 @@
+import time
+
 from django.core.management.base import BaseCommand
-from learning.models import Lesson
+from django.utils import timezone
+from learning.publishing import (BATCH_SIZE, REPORT_FIELDS, due_to_publish, due_to_unpublish, next_due, run_due,
+                                 window_closed)
 
 
 class Command(BaseCommand):
-    help = 'Publish all available lessons'
+    help = 'Publish and unpublish lessons whose publish_at / unpublish_at has passed'
 
     def add_arguments(self, parser):
         parser.add_argument(
-            '--unpublish',
+            '--loop',
+            action='store_true',
+            help='Keep running, waking at the next scheduled time or every --interval seconds',
+        )
+        parser.add_argument(
+            '--interval',
+            type=float,
+            default=60,
+            help='Longest sleep between runs with --loop, in seconds',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=BATCH_SIZE,
+            help='Lessons flipped per UPDATE',
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='List the lessons that are due without changing them',
+        )
+        parser.add_argument(
+            '--quiet',
             action='store_true',
-            help='Unpublish all lessons instead',
+            help='Print totals only, not one line per lesson',
         )
 
     def handle(self, *args, **options):
-        unpublish = options.get('unpublish', False)
-        
-        if unpublish:
-            # Unpublish all lessons
-            count = Lesson.objects.filter(is_published=True).update(is_published=False)
-            self.stdout.write(
-                self.style.SUCCESS(f'Successfully unpublished {count} lesson(s)')
-            )
-        else:
-            # Publish all lessons
-            count = Lesson.objects.filter(is_published=False).update(is_published=True)
-            self.stdout.write(
-                self.style.SUCCESS(f'Successfully published {count} lesson(s)')
-            )
-            
-            # Show all published lessons
-            all_lessons = Lesson.objects.all()
-            self.stdout.write('\nPublished Lessons:')
-            for lesson in all_lessons:
-                status = '✓ Published' if lesson.is_published else '✗ Draft'
-                self.stdout.write(f'  - {lesson.title} ({status})')
+        report = None if options['quiet'] else self.report
+        if options['dry_run']:
+            self.dry_run(options['batch_size'], report)
+            return
+        while True:
+            published, unpublished = run_due(batch_size=options['batch_size'], report=report)
+            if published or unpublished or not options['loop']:
+                self.stdout.write(
+                    self.style.SUCCESS(f'Published {published} and unpublished {unpublished} lesson(s)')
+                )
+            if not options['loop']:
+                return
+            upcoming = next_due()
+            delay = options['interval']
+            if upcoming is not None:
+                delay = min(delay, max((upcoming - timezone.now()).total_seconds(), 0))
+            time.sleep(delay)
+
+    def dry_run(self, batch_size, report):
+        now = timezone.now()
+        counts = {}
+        for action, due in (('published', due_to_publish), ('unpublished', due_to_unpublish)):
+            counts[action] = 0
+            rows = due(now).values_list(*REPORT_FIELDS).iterator(chunk_size=batch_size)
+            for row in rows:
+                if action == 'published' and window_closed(row, now):
+                    if report:
+                        report('expired', row)
+                    continue
+                counts[action] += 1
+                if report:
+                    report(f'would be {action}', row)
+        self.stdout.write(
+            self.style.SUCCESS(f"{counts['published']} lesson(s) due to publish, {counts['unpublished']} due to unpublish")
+        )
+
+    def report(self, action, row):
+        pk, slug, title, publish_at, unpublish_at = row
+        when = unpublish_at if action.endswith('unpublished') else publish_at
+        self.stdout.write(f'  {action}: {title} ({slug}) scheduled {timezone.localtime(when):%Y-%m-%d %H:%M}')
@@ -0,0 +1,272 @@
+import csv
+import json
+import sys
+from itertools import islice
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.db.models import Prefetch
+from learning.grading import deferred_invalidation, invalidate_answer_key
+from learning.models import Choice, Lesson, Question, Quiz
+
+CSV_FIELDS = [
+    'lesson_slug', 'lesson_title', 'quiz_title', 'quiz_points',
+    'question_order', 'question_type', 'question_text', 'choices', 'correct',
+]
+CHOICE_SEPARATOR = '|'
+QUESTION_TYPES = [value for value, _ in Question.QUIZ_TYPES]
+
+
+def _from_csv_row(row):
+    """Convert a spreadsheet row into the record shape used by JSON Lines files.
+
+    ``choices`` holds the choice texts separated by ``|`` and ``correct`` the
+    1-based positions of the correct ones, e.g. ``Paper|Glass|Plastic`` / ``1|3``.
+    """
+    texts = [text.strip() for text in (row.get('choices') or '').split(CHOICE_SEPARATOR) if text.strip()]
+    correct = {int(n) for n in (row.get('correct') or '').split(CHOICE_SEPARATOR) if n.strip().isdigit()}
+    return {
+        'lesson_slug': row.get('lesson_slug'),
+        'lesson_title': row.get('lesson_title'),
+        'quiz_title': row.get('quiz_title'),
+        'quiz_points': row.get('quiz_points'),
+        'question_order': row.get('question_order'),
+        'question_type': row.get('question_type'),
+        'question_text': row.get('question_text'),
+        'choices': [{'text': text, 'is_correct': position in correct} for position, text in enumerate(texts, start=1)],
+    }
+
+
+def _clean_record(line_no, record):
+    """Check one imported record and normalise its numeric fields and choices
+    in place; errors name the line (or CSV row) they come from."""
+    if not isinstance(record, dict):
+        raise CommandError(f'Line {line_no}: expected an object, got {record!r}')
+    if not record.get('lesson_slug') or not record.get('quiz_title') or not record.get('question_text'):
+        raise CommandError(f'Line {line_no}: record is missing lesson_slug, quiz_title or question_text')
+    for field, default in (('question_order', 0), ('quiz_points', 100)):
+        value = record.get(field)
+        try:
+            record[field] = int(value) if value not in (None, '') else default
+        except (TypeError, ValueError):
+            raise CommandError(f'Line {line_no}: {field} must be a whole number, got {value!r}')
+        if record[field] < 0:
+            raise CommandError(f'Line {line_no}: {field} must not be negative, got {value!r}')
+    record['question_type'] = record.get('question_type') or 'MCQ'
+    if record['question_type'] not in QUESTION_TYPES:
+        raise CommandError(
+            f"Line {line_no}: question_type must be one of {', '.join(QUESTION_TYPES)}, got {record['question_type']!r}"
+        )
+    choices = record.get('choices') or []
+    if not isinstance(choices, list) or not all(
+        isinstance(choice, dict) and isinstance(choice.get('text'), str) and choice['text'].strip() for choice in choices
+    ):
+        raise CommandError(f'Line {line_no}: choices must be a list of objects, each with a non-empty text')
+    record['choices'] = choices
+    return record
+
+
+def _to_csv_row(record):
+    choices = record['choices']
+    return {
+        **{key: record[key] for key in CSV_FIELDS[:7]},
+        'choices': CHOICE_SEPARATOR.join(choice['text'] for choice in choices),
+        'correct': CHOICE_SEPARATOR.join(str(position) for position, choice in enumerate(choices, start=1) if choice['is_correct']),
+    }
+
+
+class Command(BaseCommand):
+    help = 'Stream quiz questions in or out as JSON Lines or CSV (one record per question)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('action', choices=['import', 'export'])
+        parser.add_argument('path', help="File to read or write; '-' for stdin/stdout")
+        parser.add_argument(
+            '--format',
+            choices=['jsonl', 'csv'],
+            help='File format; inferred from the file extension when omitted',
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=2000,
+            help='Questions per bulk insert/transaction on import, or per fetch on export',
+        )
+        parser.add_argument(
+            '--lesson',
+            action='append',
+            help='Only export quizzes of this lesson slug (repeatable)',
+        )
+        parser.add_argument(
+            '--replace',
+            action='store_true',
+            help='On import, delete the existing questions of every quiz named in the file first',
+        )
+
+    def handle(self, *args, **options):
+        fmt = options['format'] or ('csv' if options['path'].endswith('.csv') else 'jsonl')
+        if options['chunk_size'] < 1:
+            raise CommandError('--chunk-size must be positive')
+        if options['action'] == 'import':
+            self.import_records(options['path'], fmt, options['chunk_size'], options['replace'])
+        else:
+            self.export_records(options['path'], fmt, options['chunk_size'], options['lesson'])
+
+    # Import -------------------------------------------------------------
+
+    def read_records(self, handle, fmt):
+        if fmt == 'csv':
+            reader = csv.DictReader(handle)
+            for row in reader:
+                yield _clean_record(reader.line_num, _from_csv_row(row))
+            return
+        for line_no, line in enumerate(handle, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as exc:
+                raise CommandError(f'Line {line_no}: invalid JSON ({exc})')
+            yield _clean_record(line_no, record)
+
+    def import_records(self, path, fmt, chunk_size, replace):
+        handle = sys.stdin if path == '-' else open(path, newline='', encoding='utf-8')
+        self.lessons = {}
+        self.quizzes = {}
+        self.replaced = set()
+        questions = choices = 0
+        try:
+            records = self.read_records(handle, fmt)
+            while True:
+                chunk = list(islice(records, chunk_size))
+                if not chunk:
+                    break
+                with transaction.atomic(), deferred_invalidation():
+                    q_count, c_count = self.import_chunk(chunk, replace)
+                    # Each chunk commits on its own, so its quizzes are
+                    # invalidated with it, even if a later chunk fails
+                    for key in {(record['lesson_slug'], record['quiz_title']) for record in chunk}:
+                        invalidate_answer_key(self.quizzes[key].pk)
+                questions += q_count
+                choices += c_count
+        finally:
+            if handle is not sys.stdin:
+                handle.close()
+        self.stdout.write(
+            self.style.SUCCESS(f'Imported {questions} question(s) and {choices} choice(s) into {len(self.quizzes)} quiz(zes)')
+        )
+
+    def import_chunk(self, chunk, replace):
+        self.resolve_lessons(chunk)
+        self.resolve_quizzes(chunk, replace)
+
+        questions = []
+        for record in chunk:
+            quiz = self.quizzes[(record['lesson_slug'], record['quiz_title'])]
+            questions.append(Question(
+                quiz=quiz,
+                text=record['question_text'],
+                question_type=record['question_type'],
+                order=record['question_order'],
+            ))
+        Question.objects.bulk_create(questions)
+        choices = [
+            Choice(question=question, text=choice['text'], is_correct=bool(choice.get('is_correct')))
+            for question, record in zip(questions, chunk)
+            for choice in record['choices']
+        ]
+        Choice.objects.bulk_create(choices)
+        return len(questions), len(choices)
+
+    def resolve_lessons(self, chunk):
+        wanted = {record['lesson_slug']: record for record in chunk if record['lesson_slug'] not in self.lessons}
+        if not wanted:
+            return
+        self.lessons.update(Lesson.objects.filter(slug__in=wanted).only('pk', 'slug').in_bulk(field_name='slug'))
+        missing = [
+            Lesson(
+                slug=slug,
+                title=record.get('lesson_title') or slug,
+                short_description='',
+                is_published=False,
+            )
+            for slug, record in wanted.items() if slug not in self.lessons
+        ]
+        if missing:
+            Lesson.objects.bulk_create(missing)
+            self.lessons.update(Lesson.objects.filter(slug__in=[lesson.slug for lesson in missing]).only('pk', 'slug').in_bulk(field_name='slug'))
+
+    def resolve_quizzes(self, chunk, replace):
+        wanted = {}
+        for record in chunk:
+            key = (record['lesson_slug'], record['quiz_title'])
+            if key not in self.quizzes:
+                wanted.setdefault(key, record)
+        if wanted:
+            lesson_ids = {self.lessons[slug].pk: slug for slug, _ in wanted}
+            for quiz in Quiz.objects.filter(lesson_id__in=lesson_ids, title__in={title for _, title in wanted}):
+                key = (lesson_ids[quiz.lesson_id], quiz.title)
+                if key in wanted:
+                    self.quizzes.setdefault(key, quiz)
+            missing = [
+                Quiz(
+                    lesson=self.lessons[slug],
+                    title=title,
+                    eco_points=record['quiz_points'],
+                )
+                for (slug, title), record in wanted.items() if (slug, title) not in self.quizzes
+            ]
+            for quiz in Quiz.objects.bulk_create(missing):
+                self.quizzes[(quiz.lesson.slug, quiz.title)] = quiz
+                # Freshly created quizzes have nothing to replace
+                self.replaced.add(quiz.pk)
+        if replace:
+            stale = [quiz.pk for quiz in self.quizzes.values() if quiz.pk not in self.replaced]
+            if stale:
+                Question.objects.filter(quiz_id__in=stale).delete()
+                self.replaced.update(stale)
+
+    # Export -------------------------------------------------------------
+
+    def iter_records(self, chunk_size, lesson_slugs):
+        questions = (
+            Question.objects.select_related('quiz__lesson')
+            .defer('quiz__lesson__html_content', 'quiz__lesson__short_description')
+            .prefetch_related(Prefetch('choices', queryset=Choice.objects.order_by('id')))
+            .order_by('quiz__lesson_id', 'quiz_id', 'order', 'id')
+        )
+        if lesson_slugs:
+            questions = questions.filter(quiz__lesson__slug__in=lesson_slugs)
+        for question in questions.iterator(chunk_size=chunk_size):
+            quiz = question.quiz
+            yield {
+                'lesson_slug': quiz.lesson.slug,
+                'lesson_title': quiz.lesson.title,
+                'quiz_title': quiz.title,
+                'quiz_points': quiz.eco_points,
+                'question_order': question.order,
+                'question_type': question.question_type,
+                'question_text': question.text,
+                'choices': [{'text': choice.text, 'is_correct': choice.is_correct} for choice in question.choices.all()],
+            }
+
+    def export_records(self, path, fmt, chunk_size, lesson_slugs):
+        handle = sys.stdout if path == '-' else open(path, 'w', newline='', encoding='utf-8')
+        count = 0
+        try:
+            if fmt == 'csv':
+                writer = csv.DictWriter(handle, fieldnames=CSV_FIELDS)
+                writer.writeheader()
+                for record in self.iter_records(chunk_size, lesson_slugs):
+                    writer.writerow(_to_csv_row(record))
+                    count += 1
+            else:
+                for record in self.iter_records(chunk_size, lesson_slugs):
+                    handle.write(json.dumps(record, ensure_ascii=False) + '\n')
+                    count += 1
+        finally:
+            if handle is not sys.stdout:
+                handle.close()
+        if path != '-':
+            self.stdout.write(self.style.SUCCESS(f'Exported {count} question(s) to {path}'))
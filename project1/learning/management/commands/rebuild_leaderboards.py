@@ -0,0 +1,38 @@
+from django.core.management.base import BaseCommand, CommandError
+from learning.leaderboards import BOARDS, period_key, rebuild_board
+
+
+class Command(BaseCommand):
+    help = 'Rebuild leaderboards from the points ledger to repair drift'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--board',
+            choices=BOARDS,
+            action='append',
+            help='Board to rebuild (repeatable); defaults to all boards',
+        )
+        parser.add_argument(
+            '--period',
+            help='Period to rebuild, e.g. 2025-W38 or 2025-09; defaults to the current one',
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=1000,
+            help='Rows streamed and inserted per batch',
+        )
+
+    def handle(self, *args, **options):
+        boards = options['board'] or BOARDS
+        if options['period'] and len(boards) != 1:
+            raise CommandError('--period needs exactly one --board')
+        for board in boards:
+            period = options['period'] or period_key(board)
+            try:
+                count = rebuild_board(board, period, chunk_size=options['chunk_size'])
+            except ValueError as exc:
+                raise CommandError(f'Invalid period {period!r} for {board}: {exc}')
+            self.stdout.write(
+                self.style.SUCCESS(f'Rebuilt {board} leaderboard {period or "(all time)"}: {count} entr{"y" if count == 1 else "ies"}')
+            )
@@ -0,0 +1,80 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Sum
+from learning.levels import get_level_index
+from learning.models import PointsLedger, UserProgress
+
+
+class Command(BaseCommand):
+    help = 'Recompute UserProgress totals and levels from the points ledger'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=1000,
+            help='Number of users to reconcile per transaction',
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Report drift without writing any changes',
+        )
+
+    def handle(self, *args, **options):
+        chunk_size = options['chunk_size']
+        dry_run = options['dry_run']
+        level_index = get_level_index()
+
+        # Users who have ledger entries but no progress row yet
+        missing = (
+            PointsLedger.objects.filter(user__progress__isnull=True)
+            .values_list('user_id', flat=True)
+            .distinct()
+        )
+        created = 0
+        if not dry_run:
+            created = len(UserProgress.objects.bulk_create(
+                [UserProgress(user_id=user_id) for user_id in missing.iterator(chunk_size=chunk_size)],
+                batch_size=chunk_size,
+                ignore_conflicts=True,
+            ))
+
+        checked = fixed = 0
+        last_pk = 0
+        while True:
+            # The chunk's progress rows stay locked from reading the sums to
+            # writing them back; an award landing meanwhile waits and then
+            # applies its increment on top
+            with transaction.atomic():
+                chunk = list(
+                    UserProgress.objects.select_for_update()
+                    .filter(pk__gt=last_pk)
+                    .order_by('pk')
+                    .only('pk', 'user_id', 'total_points', 'current_level')[:chunk_size]
+                )
+                if not chunk:
+                    break
+                last_pk = chunk[-1].pk
+                sums = dict(
+                    PointsLedger.objects.filter(user_id__in=[p.user_id for p in chunk])
+                    .values_list('user')
+                    .annotate(total=Sum('delta'))
+                )
+                stale = []
+                for progress in chunk:
+                    total = max(sums.get(progress.user_id) or 0, 0)
+                    level_id = level_index.level_id_for(total)
+                    if progress.total_points != total or progress.current_level_id != level_id:
+                        progress.total_points = total
+                        progress.current_level_id = level_id
+                        stale.append(progress)
+                checked += len(chunk)
+                fixed += len(stale)
+                if stale and not dry_run:
+                    UserProgress.objects.bulk_update(stale, ['total_points', 'current_level'])
+
+        verb = 'Would fix' if dry_run else 'Fixed'
+        self.stdout.write(
+            self.style.SUCCESS(f'Checked {checked} user(s); {verb} {fixed}; created {created} missing progress row(s)')
+        )
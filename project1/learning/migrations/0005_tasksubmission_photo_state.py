@@ -0,0 +1,18 @@
+# Generated by Django 5.2.6 on 2026-10-18 11:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('learning', '0004_leaderboardentry'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='tasksubmission',
+            name='photo_state',
+            field=models.CharField(choices=[('none', 'No Photo'), ('processing', 'Processing'), ('ready', 'Ready'), ('rejected', 'Rejected')], default='none', max_length=12),
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.2.6 on 2026-10-18 11:15
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('learning', '0006_learnersummary'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ScormPackage',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('sha256', models.CharField(max_length=64, unique=True)),
+                ('title', models.CharField(blank=True, max_length=255)),
+                ('version', models.CharField(blank=True, help_text='SCORM schema version from the manifest', max_length=20)),
+                ('launch_path', models.CharField(blank=True, max_length=500)),
+                ('items', models.JSONField(blank=True, default=list, help_text='Table of contents: title and path of each launchable item')),
+                ('file_count', models.PositiveIntegerField(default=0)),
+                ('total_size', models.PositiveBigIntegerField(default=0)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+        migrations.AddField(
+            model_name='lesson',
+            name='scorm',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='lessons', to='learning.scormpackage'),
+        ),
+    ]
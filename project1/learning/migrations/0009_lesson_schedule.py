@@ -0,0 +1,31 @@
+# Generated by Django 5.2.6 on 2026-10-18 11:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('learning', '0008_hot_path_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='lesson',
+            name='publish_at',
+            field=models.DateTimeField(blank=True, help_text='Publish automatically at this time', null=True),
+        ),
+        migrations.AddField(
+            model_name='lesson',
+            name='unpublish_at',
+            field=models.DateTimeField(blank=True, help_text='Unpublish automatically at this time', null=True),
+        ),
+        migrations.AddIndex(
+            model_name='lesson',
+            index=models.Index(condition=models.Q(('is_published', False), ('publish_at__isnull', False)), fields=['publish_at'], name='lesson_publish_due_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='lesson',
+            index=models.Index(condition=models.Q(('is_published', True), ('unpublish_at__isnull', False)), fields=['unpublish_at'], name='lesson_unpublish_due_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.6 on 2026-10-18 11:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('learning', '0010_quizattempt_session'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='lesson',
+            name='scorm_error',
+            field=models.CharField(blank=True, editable=False, help_text='Why the uploaded package could not be extracted', max_length=255),
+        ),
+    ]
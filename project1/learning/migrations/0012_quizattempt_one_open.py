@@ -0,0 +1,33 @@
+# Generated by Django 5.2.6 on 2026-10-18 11:57
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+def drop_duplicate_open_attempts(apps, schema_editor):
+    # Keep the newest open session per learner and quiz; the older ones were
+    # never graded and their autosaves were already replaced by the newest
+    QuizAttempt = apps.get_model('learning', 'QuizAttempt')
+    open_attempts = QuizAttempt.objects.filter(completed_at__isnull=True, deadline__isnull=False)
+    seen, duplicates = set(), []
+    for pk, user_id, quiz_id in open_attempts.order_by('-started_at', '-pk').values_list('pk', 'user_id', 'quiz_id'):
+        if (user_id, quiz_id) in seen:
+            duplicates.append(pk)
+        seen.add((user_id, quiz_id))
+    QuizAttempt.objects.filter(pk__in=duplicates).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('learning', '0011_lesson_scorm_error'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(drop_duplicate_open_attempts, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='quizattempt',
+            constraint=models.UniqueConstraint(condition=models.Q(('completed_at__isnull', True), ('deadline__isnull', False)), fields=('user', 'quiz'), name='quizattempt_one_open_uniq'),
+        ),
+    ]
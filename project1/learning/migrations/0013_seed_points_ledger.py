@@ -0,0 +1,41 @@
+from django.db import migrations
+from django.db.models import Sum
+
+BATCH_SIZE = 1000
+
+
+def seed_ledger(apps, schema_editor):
+    # Points earned before the ledger existed only live in UserProgress. Write
+    # one adjustment per user for whatever the ledger does not account for, so
+    # reconcile_points keeps those totals instead of resetting them to zero
+    UserProgress = apps.get_model('learning', 'UserProgress')
+    PointsLedger = apps.get_model('learning', 'PointsLedger')
+    last_pk = 0
+    while True:
+        chunk = list(
+            UserProgress.objects.filter(pk__gt=last_pk, total_points__gt=0)
+            .order_by('pk').values_list('pk', 'user_id', 'total_points')[:BATCH_SIZE]
+        )
+        if not chunk:
+            break
+        last_pk = chunk[-1][0]
+        sums = dict(
+            PointsLedger.objects.filter(user_id__in=[user_id for _, user_id, _ in chunk])
+            .values_list('user').annotate(total=Sum('delta'))
+        )
+        PointsLedger.objects.bulk_create([
+            PointsLedger(user_id=user_id, source_type='adjustment', delta=total - (sums.get(user_id) or 0))
+            for _, user_id, total in chunk
+            if total > (sums.get(user_id) or 0)
+        ])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('learning', '0012_quizattempt_one_open'),
+    ]
+
+    operations = [
+        migrations.RunPython(seed_ledger, migrations.RunPython.noop),
+    ]
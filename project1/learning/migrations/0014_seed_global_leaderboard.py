@@ -0,0 +1,31 @@
+from django.db import migrations
+from django.db.models import Sum
+
+BATCH_SIZE = 1000
+
+
+def seed_global_board(apps, schema_editor):
+    # The all-time board was only fed by awards made after it existed. Load it
+    # from the ledger, which 0013 seeded with the pre-ledger totals
+    LeaderboardEntry = apps.get_model('learning', 'LeaderboardEntry')
+    PointsLedger = apps.get_model('learning', 'PointsLedger')
+    LeaderboardEntry.objects.filter(board='global', period='').delete()
+    totals = PointsLedger.objects.values_list('user_id').annotate(points=Sum('delta')).order_by('user_id')
+    batch = []
+    for user_id, points in totals.iterator(chunk_size=BATCH_SIZE):
+        batch.append(LeaderboardEntry(board='global', period='', user_id=user_id, points=points))
+        if len(batch) >= BATCH_SIZE:
+            LeaderboardEntry.objects.bulk_create(batch)
+            batch = []
+    LeaderboardEntry.objects.bulk_create(batch)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('learning', '0013_seed_points_ledger'),
+    ]
+
+    operations = [
+        migrations.RunPython(seed_global_board, migrations.RunPython.noop),
+    ]
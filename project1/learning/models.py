@@ -1,4 +1,4 @@
-from django.db import models
+from django.db import models, transaction
 from django.contrib.auth import get_user_model
 from django.utils import timezone
 from django.core.validators import MinValueValidator, MaxValueValidator
@@ -17,22 +17,58 @@ class LevelDefinition(models.Model):
     def __str__(self):
         return f"Level {self.number}: {self.name}"    
 
+class ScormPackage(models.Model):
+    """An extracted SCORM package, shared by every lesson that uploaded the same zip."""
+    sha256 = models.CharField(max_length=64, unique=True)
+    title = models.CharField(max_length=255, blank=True)
+    version = models.CharField(max_length=20, blank=True, help_text='SCORM schema version from the manifest')
+    launch_path = models.CharField(max_length=500, blank=True)
+    items = models.JSONField(default=list, blank=True, help_text='Table of contents: title and path of each launchable item')
+    file_count = models.PositiveIntegerField(default=0)
+    total_size = models.PositiveBigIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return self.title or self.sha256[:12]
+
 class Lesson(models.Model):
     title = models.CharField(max_length=200)
     slug = models.SlugField(unique=True)
     short_description = models.TextField()
     html_content = models.TextField(blank=True, help_text='Inline HTML module (fallback if no SCORM)')
     scorm_package = models.FileField(upload_to='scorm/', blank=True, null=True)
+    scorm = models.ForeignKey(ScormPackage, null=True, blank=True, editable=False, related_name='lessons', on_delete=models.SET_NULL)
+    scorm_error = models.CharField(max_length=255, blank=True, editable=False, help_text='Why the uploaded package could not be extracted')
     cover_image = models.ImageField(upload_to='lessons/covers/', blank=True, null=True)
     video_url = models.URLField(blank=True, help_text='Optional embedded video URL (YouTube, etc.)')
     resource_file = models.FileField(upload_to='lessons/resources/', blank=True, null=True)
     eco_points = models.PositiveIntegerField(default=50)
     is_published = models.BooleanField(default=True)
+    publish_at = models.DateTimeField(null=True, blank=True, help_text='Publish automatically at this time')
+    unpublish_at = models.DateTimeField(null=True, blank=True, help_text='Unpublish automatically at this time')
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            # Partial for the same reason as task_active_idx; rows come out in id
+            # order, so catalog pages need no sort
+            models.Index(fields=['id'], condition=models.Q(is_published=True), name='lesson_published_idx'),
+            # The publisher's due-lesson lookups; only pending schedules are indexed
+            models.Index(fields=['publish_at'], condition=models.Q(is_published=False, publish_at__isnull=False),
+                         name='lesson_publish_due_idx'),
+            models.Index(fields=['unpublish_at'], condition=models.Q(is_published=True, unpublish_at__isnull=False),
+                         name='lesson_unpublish_due_idx'),
+        ]
+
     def __str__(self):
         return self.title
 
+    def clean(self):
+        # A lesson scheduled for later stays hidden until the publisher picks it
+        # up; runs for LessonForm and the admin alike
+        if self.publish_at and self.publish_at > timezone.now():
+            self.is_published = False
+
 class Quiz(models.Model):
     lesson = models.ForeignKey(Lesson, related_name='quizzes', on_delete=models.CASCADE)
     title = models.CharField(max_length=200)
@@ -71,19 +107,38 @@ class QuizAttempt(models.Model):
     user = models.ForeignKey(User, on_delete=models.CASCADE)
     quiz = models.ForeignKey(Quiz, on_delete=models.CASCADE)
     started_at = models.DateTimeField(auto_now_add=True)
+    deadline = models.DateTimeField(null=True, blank=True)
     completed_at = models.DateTimeField(null=True, blank=True)
     score_percent = models.DecimalField(max_digits=5, decimal_places=2, null=True, blank=True)
     earned_points = models.IntegerField(default=0)
+    # {question_id: choice_id}; written once when the attempt is closed
+    answers = models.JSONField(default=dict, blank=True)
 
     class Meta:
         unique_together = ('user', 'quiz', 'started_at')
         ordering = ['-started_at']
+        indexes = [
+            models.Index(fields=['user', 'quiz', 'completed_at'], name='quizattempt_user_done_idx'),
+            # Open timed sessions, for the expiry sweeper
+            models.Index(fields=['deadline'], condition=models.Q(completed_at__isnull=True, deadline__isnull=False),
+                         name='quizattempt_open_idx'),
+        ]
+        constraints = [
+            # One open timed session per learner and quiz; see quiz_sessions._create_attempt
+            models.UniqueConstraint(fields=['user', 'quiz'], condition=models.Q(completed_at__isnull=True, deadline__isnull=False),
+                                    name='quizattempt_one_open_uniq'),
+        ]
 
     def mark_complete(self, score_percent, earned_points):
+        from .summaries import record_quiz_attempt
+        was_complete = self.completed_at is not None
         self.score_percent = score_percent
         self.earned_points = earned_points
         self.completed_at = timezone.now()
-        self.save()
+        with transaction.atomic():
+            self.save()
+            if not was_complete:
+                record_quiz_attempt(self)
 
 class Task(models.Model):
     title = models.CharField(max_length=200)
@@ -92,6 +147,14 @@ class Task(models.Model):
     requires_photo = models.BooleanField(default=True)
     is_active = models.BooleanField(default=True)
 
+    class Meta:
+        indexes = [
+            # Only active tasks are ever listed. A partial index stays small and
+            # the planner picks it, which it would not do for an index on a
+            # low-cardinality boolean column
+            models.Index(fields=['id'], condition=models.Q(is_active=True), name='task_active_idx'),
+        ]
+
     def __str__(self):
         return self.title
 
@@ -101,9 +164,16 @@ class TaskSubmission(models.Model):
         ('approved', 'Approved'),
         ('rejected', 'Rejected'),
     )
+    PHOTO_STATES = (
+        ('none', 'No Photo'),
+        ('processing', 'Processing'),
+        ('ready', 'Ready'),
+        ('rejected', 'Rejected'),
+    )
     task = models.ForeignKey(Task, related_name='submissions', on_delete=models.CASCADE)
     user = models.ForeignKey(User, related_name='task_submissions', on_delete=models.CASCADE)
     photo = models.ImageField(upload_to='tasks/', blank=True, null=True)
+    photo_state = models.CharField(max_length=12, choices=PHOTO_STATES, default='none')
     notes = models.TextField(blank=True)
     submitted_at = models.DateTimeField(auto_now_add=True)
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending')
@@ -112,11 +182,22 @@ class TaskSubmission(models.Model):
 
     class Meta:
         ordering = ['-submitted_at']
+        indexes = [
+            models.Index(fields=['status', 'submitted_at'], name='tasksubmission_status_idx'),
+        ]
 
     def approve(self, points=None):
-        self.status = 'approved'
-        self.awarded_points = points if points is not None else self.task.eco_points
-        self.save()
+        from .points import award_points
+        from .summaries import record_tasks_approved
+        already_approved = self.status == 'approved'
+        with transaction.atomic():
+            self.status = 'approved'
+            self.awarded_points = points if points is not None else self.task.eco_points
+            self.save()
+            if not already_approved:
+                record_tasks_approved({self.user_id: 1})
+                if self.awarded_points:
+                    award_points(self.user_id, self.awarded_points, PointsLedger.SOURCE_TASK, self.pk)
 
 class UserProgress(models.Model):
     user = models.OneToOneField(User, on_delete=models.CASCADE, related_name='progress')
@@ -125,15 +206,91 @@ class UserProgress(models.Model):
     updated_at = models.DateTimeField(auto_now=True)
 
     def recalc_level(self):
-        level = LevelDefinition.objects.filter(required_points__lte=self.total_points).order_by('-required_points').first()
+        from .levels import get_level_index
+        level = get_level_index().level_for(self.total_points)
         self.current_level = level
-        self.save()
+        self.save(update_fields=['current_level', 'updated_at'])
         return level
 
-    def add_points(self, amount):
-        self.total_points += amount
-        self.save()
-        self.recalc_level()
+    def add_points(self, amount, source_type='adjustment', source_id=None):
+        from .points import award_points
+        award_points(self.user_id, amount, source_type, source_id)
+        self.refresh_from_db(fields=['total_points', 'current_level', 'updated_at'])
 
     def __str__(self):
         return f"Progress {self.user.username}: {self.total_points} pts"
+
+
+class PointsLedger(models.Model):
+    """Append-only record of every eco-point award; UserProgress totals are derived from it."""
+    SOURCE_QUIZ = 'quiz'
+    SOURCE_TASK = 'task'
+    SOURCE_GAME = 'game'
+    SOURCE_ADJUSTMENT = 'adjustment'
+    SOURCE_CHOICES = (
+        (SOURCE_QUIZ, 'Quiz Attempt'),
+        (SOURCE_TASK, 'Task Submission'),
+        (SOURCE_GAME, 'Game Score'),
+        (SOURCE_ADJUSTMENT, 'Manual Adjustment'),
+    )
+    user = models.ForeignKey(User, related_name='points_ledger', on_delete=models.CASCADE)
+    source_type = models.CharField(max_length=20, choices=SOURCE_CHOICES)
+    source_id = models.PositiveBigIntegerField(null=True, blank=True)
+    delta = models.IntegerField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ['-created_at']
+
+    def __str__(self):
+        return f"{self.delta:+d} pts to {self.user_id} ({self.source_type})"
+
+
+class LeaderboardEntry(models.Model):
+    """Running points total for one user on one board period, updated as points are awarded."""
+    BOARD_GLOBAL = 'global'
+    BOARD_WEEKLY = 'weekly'
+    BOARD_MONTHLY = 'monthly'
+    BOARD_CHOICES = (
+        (BOARD_GLOBAL, 'All Time'),
+        (BOARD_WEEKLY, 'This Week'),
+        (BOARD_MONTHLY, 'This Month'),
+    )
+    board = models.CharField(max_length=10, choices=BOARD_CHOICES)
+    period = models.CharField(max_length=10, blank=True, help_text='ISO week (2025-W38) or month (2025-09); blank for all time')
+    user = models.ForeignKey(User, related_name='leaderboard_entries', on_delete=models.CASCADE)
+    points = models.IntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        unique_together = ('board', 'period', 'user')
+        indexes = [
+            models.Index(fields=['board', 'period', '-points', 'user'], name='leaderboard_rank_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.board} {self.period or 'all'}: {self.user_id} ({self.points} pts)"
+
+
+class LearnerSummary(models.Model):
+    """Denormalized per-user learning stats, kept current by learning.summaries."""
+    user = models.OneToOneField(User, on_delete=models.CASCADE, related_name='learner_summary')
+    lessons_completed = models.PositiveIntegerField(default=0)
+    quiz_attempts = models.PositiveIntegerField(default=0)
+    best_scores = models.JSONField(default=dict, blank=True, help_text='Best completed score per quiz id')
+    tasks_approved = models.PositiveIntegerField(default=0)
+    last_activity_at = models.DateTimeField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    @property
+    def quizzes_taken(self):
+        return len(self.best_scores)
+
+    @property
+    def average_best_score(self):
+        if not self.best_scores:
+            return None
+        return sum(self.best_scores.values()) / len(self.best_scores)
+
+    def __str__(self):
+        return f"Summary {self.user_id}: {self.lessons_completed} lessons, {self.tasks_approved} tasks"
@@ -0,0 +1,58 @@
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .leaderboards import record_award
+from .levels import get_level_index
+from .models import PointsLedger, UserProgress
+
+
+def apply_delta(user_id, delta):
+    """Increment a user's total and resolve their level in a single UPDATE."""
+    changes = {
+        'total_points': F('total_points') + delta,
+        'current_level': get_level_index().expression(F('total_points') + delta),
+        'updated_at': timezone.now(),
+    }
+    if not UserProgress.objects.filter(user_id=user_id).update(**changes):
+        UserProgress.objects.get_or_create(user_id=user_id)
+        UserProgress.objects.filter(user_id=user_id).update(**changes)
+
+
+def award_points(user, delta, source_type, source_id=None):
+    """Record a ledger entry and apply it to the user's progress atomically.
+
+    ``user`` may be a User instance or a primary key. Returns the ledger entry.
+    """
+    user_id = getattr(user, 'pk', user)
+    with transaction.atomic():
+        entry = PointsLedger.objects.create(user_id=user_id, source_type=source_type, source_id=source_id, delta=delta)
+        apply_delta(user_id, delta)
+        record_award(user_id, delta, entry.created_at)
+    return entry
+
+
+def award_points_bulk(awards):
+    """Record many awards at once.
+
+    ``awards`` is an iterable of ``(user_id, delta, source_type, source_id)``.
+    Ledger rows are inserted with one bulk_create and each user's progress and
+    leaderboard entries receive a single aggregated increment.
+    """
+    entries = [
+        PointsLedger(user_id=user_id, delta=delta, source_type=source_type, source_id=source_id)
+        for user_id, delta, source_type, source_id in awards
+    ]
+    if not entries:
+        return []
+    totals = {}
+    for entry in entries:
+        totals[entry.user_id] = totals.get(entry.user_id, 0) + entry.delta
+    with transaction.atomic():
+        PointsLedger.objects.bulk_create(entries)
+        now = timezone.now()
+        for user_id, delta in totals.items():
+            if delta:
+                apply_delta(user_id, delta)
+                record_award(user_id, delta, now)
+    return entries
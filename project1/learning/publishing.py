@@ -0,0 +1,85 @@
+# Scheduled publishing. Lessons carry an optional publish_at/unpublish_at; the
+# publish_lessons command flips whatever is due in batches. A schedule is
+# cleared once applied, so a lesson a member of staff later toggles by hand
+# is not flipped back on the next run.
+from django.db import transaction
+from django.utils import timezone
+from mriic.caching import invalidate_pages
+
+from .models import Lesson
+
+BATCH_SIZE = 500
+REPORT_FIELDS = ('pk', 'slug', 'title', 'publish_at', 'unpublish_at')
+
+
+def due_to_publish(now):
+    return Lesson.objects.filter(is_published=False, publish_at__lte=now).order_by('publish_at', 'pk')
+
+
+def due_to_unpublish(now):
+    return Lesson.objects.filter(is_published=True, unpublish_at__lte=now).order_by('unpublish_at', 'pk')
+
+
+def next_due():
+    """Earliest pending publish_at or unpublish_at, or None."""
+    times = [
+        Lesson.objects.filter(is_published=False, publish_at__isnull=False)
+        .order_by('publish_at').values_list('publish_at', flat=True).first(),
+        Lesson.objects.filter(is_published=True, unpublish_at__isnull=False)
+        .order_by('unpublish_at').values_list('unpublish_at', flat=True).first(),
+    ]
+    times = [when for when in times if when is not None]
+    return min(times) if times else None
+
+
+def window_closed(row, now):
+    """True for a due publish whose unpublish_at has passed as well; such a
+    schedule is dropped instead of publishing the lesson for no time at all."""
+    return row[4] is not None and row[4] <= now
+
+
+def _publish_batch(rows, now):
+    ids = [row[0] for row in rows]
+    expired = [row[0] for row in rows if window_closed(row, now)]
+    published = Lesson.objects.filter(pk__in=ids, is_published=False).exclude(pk__in=expired).update(
+        is_published=True, publish_at=None,
+    )
+    if expired:
+        Lesson.objects.filter(pk__in=expired, is_published=False).update(publish_at=None, unpublish_at=None)
+    return published
+
+
+def _unpublish_batch(rows, now):
+    return Lesson.objects.filter(pk__in=[row[0] for row in rows], is_published=True).update(
+        is_published=False, unpublish_at=None,
+    )
+
+
+def run_due(now=None, batch_size=BATCH_SIZE, report=None):
+    """Apply every schedule due at ``now``; returns ``(published, unpublished)``.
+
+    Due rows are read through the partial schedule indexes ``batch_size`` at
+    a time and flipped with one UPDATE per batch. ``report(action, row)`` is
+    called for each lesson with ``row`` as REPORT_FIELDS and ``action`` one of
+    published, unpublished or expired. Cached pages are invalidated once at
+    the end if anything changed.
+    """
+    now = now or timezone.now()
+    counts = {}
+    for action, due, flip in (
+        ('published', due_to_publish, _publish_batch),
+        ('unpublished', due_to_unpublish, _unpublish_batch),
+    ):
+        counts[action] = 0
+        while True:
+            with transaction.atomic():
+                rows = list(due(now).values_list(*REPORT_FIELDS)[:batch_size])
+                if not rows:
+                    break
+                counts[action] += flip(rows, now)
+            if report:
+                for row in rows:
+                    report('expired' if flip is _publish_batch and window_closed(row, now) else action, row)
+    if counts['published'] or counts['unpublished']:
+        transaction.on_commit(invalidate_pages)
+    return counts['published'], counts['unpublished']
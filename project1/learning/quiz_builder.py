@@ -0,0 +1,119 @@
+from django.db import transaction
+
+from .grading import deferred_invalidation, invalidate_answer_key
+from .models import Choice, Question
+
+TF_CHOICES = ('True', 'False')
+
+
+def _int_or_none(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def parse_builder_post(data):
+    """Turn the quiz builder's ``q<n>_*`` fields into a list of question dicts."""
+    questions = []
+    total_questions = _int_or_none(data.get('total_questions')) or 0
+    for idx in range(1, total_questions + 1):
+        text = data.get(f'q{idx}_text')
+        if not text:
+            continue
+        q_type = data.get(f'q{idx}_type') or 'MCQ'
+        if q_type == 'TF':
+            correct_val = data.get(f'q{idx}_tf_correct') == 'true'
+            choices = [
+                {'id': None, 'text': 'True', 'is_correct': correct_val},
+                {'id': None, 'text': 'False', 'is_correct': not correct_val},
+            ]
+        else:
+            choices = []
+            choice_count = _int_or_none(data.get(f'q{idx}_choice_count')) or 0
+            for c in range(1, choice_count + 1):
+                c_text = data.get(f'q{idx}_choice{c}_text')
+                if c_text:
+                    choices.append({
+                        'id': _int_or_none(data.get(f'q{idx}_choice{c}_id')),
+                        'text': c_text,
+                        'is_correct': data.get(f'q{idx}_choice{c}_correct') == 'on',
+                    })
+        questions.append({
+            'id': _int_or_none(data.get(f'q{idx}_id')),
+            'text': text,
+            'type': q_type,
+            'order': idx,
+            'choices': choices,
+        })
+    return questions
+
+
+def _match_choices(question, submitted, existing):
+    """Pair submitted choices with existing rows of the same question.
+
+    Choices are matched by id when the form sent one; True/False choices,
+    which the form renders without ids, are matched by their fixed text.
+    """
+    by_id = {choice.pk: choice for choice in existing}
+    by_text = {choice.text: choice for choice in existing if choice.text in TF_CHOICES}
+    matched = []
+    for item in submitted:
+        choice = by_id.pop(item['id'], None) if item['id'] else None
+        if choice is None and question.question_type == 'TF':
+            choice = by_text.get(item['text'])
+            if choice is not None and choice.pk in by_id:
+                del by_id[choice.pk]
+            else:
+                choice = None
+        matched.append((item, choice))
+    return matched, list(by_id)
+
+
+def save_quiz_questions(quiz, submitted):
+    """Diff ``submitted`` against the quiz's stored questions and apply it in bulk.
+
+    Existing questions and choices keep their ids; the whole save costs a
+    handful of bulk_create/bulk_update/delete statements regardless of size.
+    """
+    with transaction.atomic(), deferred_invalidation():
+        existing = {question.pk: question for question in quiz.questions.prefetch_related('choices')}
+        new_questions, changed_questions, pairs = [], [], []
+        for item in submitted:
+            question = existing.pop(item['id'], None) if item['id'] else None
+            if question is None:
+                question = Question(quiz=quiz, text=item['text'], question_type=item['type'], order=item['order'])
+                new_questions.append(question)
+                current_choices = []
+            else:
+                current_choices = list(question.choices.all())
+                if (question.text, question.question_type, question.order) != (item['text'], item['type'], item['order']):
+                    question.text = item['text']
+                    question.question_type = item['type']
+                    question.order = item['order']
+                    changed_questions.append(question)
+            pairs.append((question, item['choices'], current_choices))
+
+        if existing:
+            Question.objects.filter(pk__in=list(existing)).delete()
+        Question.objects.bulk_create(new_questions)
+        Question.objects.bulk_update(changed_questions, ['text', 'question_type', 'order'])
+
+        new_choices, changed_choices, stale_choices = [], [], []
+        for question, submitted_choices, current_choices in pairs:
+            matched, unmatched = _match_choices(question, submitted_choices, current_choices)
+            stale_choices.extend(unmatched)
+            for item, choice in matched:
+                if choice is None:
+                    new_choices.append(Choice(question=question, text=item['text'], is_correct=item['is_correct']))
+                elif (choice.text, choice.is_correct) != (item['text'], item['is_correct']):
+                    choice.text = item['text']
+                    choice.is_correct = item['is_correct']
+                    changed_choices.append(choice)
+
+        if stale_choices:
+            Choice.objects.filter(pk__in=stale_choices).delete()
+        Choice.objects.bulk_create(new_choices)
+        Choice.objects.bulk_update(changed_choices, ['text', 'is_correct'])
+    # Bulk operations skip model signals, so the answer key is invalidated here
+    invalidate_answer_key(quiz.pk)
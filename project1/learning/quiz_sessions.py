@@ -0,0 +1,265 @@
+# Server-side quiz sessions. Opening a quiz creates a QuizAttempt with a
+# deadline (the quiz's time limit, or QUIZ_UNTIMED_SESSION_SECONDS). Answers
+# picked while it is open are autosaved to the cache only; the attempt row is
+# written once, when the learner submits or the sweeper closes it after the
+# deadline. Autosaves live in the "shared" cache so the sweeper, a separate
+# process, can grade them. A learner has at most one open attempt per quiz.
+from datetime import timedelta
+from functools import partial
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+from mriic.caching import shared_cache
+
+from .grading import answers_from_post, get_answer_key, grade
+from .models import PointsLedger, QuizAttempt
+from .points import award_points, award_points_bulk
+from .summaries import record_quiz_attempt
+
+UPDATE_BATCH_SIZE = 500
+# Autosaves outlive the deadline by this long so the sweeper can still grade them
+SESSION_MARGIN = 60 * 60
+
+
+def submit_grace():
+    """Slack after the deadline for submits and autosaves still in flight."""
+    return timedelta(seconds=getattr(settings, 'QUIZ_SUBMIT_GRACE_SECONDS', 10))
+
+
+def session_key(user_id, quiz_id):
+    return f'learning:quiz_session:{user_id}:{quiz_id}'
+
+
+def _session(attempt, answers, now):
+    """``(key, value, timeout)`` of the cache entry for an open attempt."""
+    timeout = max((attempt.deadline - now).total_seconds(), 0) + submit_grace().total_seconds() + SESSION_MARGIN
+    value = {'attempt': attempt.pk, 'deadline': attempt.deadline.timestamp(), 'answers': answers}
+    return session_key(attempt.user_id, attempt.quiz_id), value, timeout
+
+
+def _store(attempt, answers, now):
+    shared_cache().set(*_session(attempt, answers, now))
+
+
+def _answers(quiz_id, data):
+    """``{question_id: choice}`` from POST data, limited to the quiz's questions."""
+    return {question_id: value for question_id, value in answers_from_post(get_answer_key(quiz_id), data).items() if value}
+
+
+def _session_answers(session, attempt_id):
+    return session['answers'] if session and session['attempt'] == attempt_id else {}
+
+
+def saved_answers(attempt):
+    return _session_answers(shared_cache().get(session_key(attempt.user_id, attempt.quiz_id)), attempt.pk)
+
+
+async def asaved_answers(attempt):
+    return _session_answers(await shared_cache().aget(session_key(attempt.user_id, attempt.quiz_id)), attempt.pk)
+
+
+def _open_attempts(user, quiz):
+    return (
+        QuizAttempt.objects.filter(user=user, quiz=quiz, completed_at__isnull=True, deadline__isnull=False)
+        .order_by('-started_at')
+    )
+
+
+def _with_quiz(attempt, quiz):
+    if attempt is not None:
+        attempt.quiz = quiz
+    return attempt
+
+
+def open_attempt(user, quiz):
+    return _with_quiz(_open_attempts(user, quiz).first(), quiz)
+
+
+def _score(attempt, answers):
+    correct, total = grade(get_answer_key(attempt.quiz_id), answers)
+    score_percent = round((correct / total) * 100, 2) if total else 0
+    return score_percent, int(attempt.quiz.eco_points * (score_percent / 100))
+
+
+def _stored(answers):
+    return {str(question_id): value for question_id, value in answers.items()}
+
+
+def start_attempt(user, quiz, now=None):
+    """Resume the user's open attempt on ``quiz`` or open a new one.
+
+    An attempt found past its deadline is closed first with whatever was
+    autosaved. Returns ``(attempt, answers)``.
+    """
+    now = now or timezone.now()
+    attempt = open_attempt(user, quiz)
+    if attempt is not None and _expired(attempt, now):
+        close_attempt(attempt, saved_answers(attempt), attempt.deadline)
+        attempt = None
+    if attempt is None:
+        attempt = _create_attempt(user, quiz, now)
+    return attempt, _resume(attempt, now)
+
+
+async def astart_attempt(user, quiz, now=None):
+    """start_attempt for async views. Closing an expired attempt is
+    transactional, which the async ORM cannot do, so that runs in a thread."""
+    now = now or timezone.now()
+    attempt = _with_quiz(await _open_attempts(user, quiz).afirst(), quiz)
+    if attempt is not None and _expired(attempt, now):
+        await sync_to_async(close_attempt)(attempt, await asaved_answers(attempt), attempt.deadline)
+        attempt = None
+    if attempt is None:
+        attempt = await sync_to_async(_create_attempt)(user, quiz, now)
+    session = await shared_cache().aget(session_key(attempt.user_id, attempt.quiz_id))
+    if session is None or session['attempt'] != attempt.pk:
+        await shared_cache().aset(*_session(attempt, {}, now))
+    return attempt, _session_answers(session, attempt.pk)
+
+
+def _create_attempt(user, quiz, now):
+    """Open a new attempt, or return the one a concurrent request (a double
+    click, a second tab) opened first; quizattempt_one_open_uniq allows one."""
+    while True:
+        try:
+            with transaction.atomic():
+                return QuizAttempt.objects.create(user=user, quiz=quiz, deadline=_deadline(quiz, now))
+        except IntegrityError:
+            attempt = open_attempt(user, quiz)
+            if attempt is not None:
+                return attempt
+
+
+def _expired(attempt, now):
+    return attempt.deadline + submit_grace() < now
+
+
+def _deadline(quiz, now):
+    limit = quiz.time_limit_seconds or getattr(settings, 'QUIZ_UNTIMED_SESSION_SECONDS', 24 * 60 * 60)
+    return now + timedelta(seconds=limit)
+
+
+def _resume(attempt, now):
+    """The session's autosaved answers, (re)creating its cache entry if needed."""
+    session = shared_cache().get(session_key(attempt.user_id, attempt.quiz_id))
+    if session is None or session['attempt'] != attempt.pk:
+        # A new session, or the autosave was evicted and goes on without it
+        _store(attempt, {}, now)
+    return _session_answers(session, attempt.pk)
+
+
+def autosave_answers(user_id, quiz_id, data, now=None):
+    """Replace the autosaved answers of an open session with those in ``data``.
+
+    Touches only the cache. Returns the seconds left before the deadline, or
+    None when there is no session or it has run out.
+    """
+    now = now or timezone.now()
+    key = session_key(user_id, quiz_id)
+    session = shared_cache().get(key)
+    if session is None:
+        return None
+    grace = submit_grace().total_seconds()
+    remaining = session['deadline'] - now.timestamp()
+    if remaining + grace < 0:
+        return None
+    session['answers'] = _answers(quiz_id, data)
+    shared_cache().set(key, session, max(remaining, 0) + grace + SESSION_MARGIN)
+    return max(remaining, 0)
+
+
+def close_attempt(attempt, answers, completed_at):
+    """Grade and close one open attempt with a single UPDATE, then credit it.
+
+    Returns False if the attempt was already closed (a double submit, or the
+    sweeper got there first).
+    """
+    score_percent, earned = _score(attempt, answers)
+    with transaction.atomic():
+        closed = QuizAttempt.objects.filter(pk=attempt.pk, completed_at__isnull=True).update(
+            answers=_stored(answers), score_percent=score_percent, earned_points=earned, completed_at=completed_at,
+        )
+        if not closed:
+            return False
+        attempt.answers = _stored(answers)
+        attempt.score_percent = score_percent
+        attempt.earned_points = earned
+        attempt.completed_at = completed_at
+        award_points(attempt.user_id, earned, PointsLedger.SOURCE_QUIZ, attempt.pk)
+        record_quiz_attempt(attempt)
+        transaction.on_commit(partial(shared_cache().delete, session_key(attempt.user_id, attempt.quiz_id)))
+    return True
+
+
+def submit_attempt(user, quiz, data, now=None):
+    """Close the user's open attempt with the submitted answers over the
+    autosaved ones. A submit later than the deadline plus grace is graded on
+    the autosaved answers alone.
+
+    Returns ``(attempt, late)``; ``attempt`` is None when no session was open.
+    """
+    now = now or timezone.now()
+    attempt = open_attempt(user, quiz)
+    if attempt is None:
+        return None, False
+    return _submit(attempt, data, now)
+
+
+async def asubmit_attempt(user, quiz, data, now=None):
+    """submit_attempt for async views: the session is looked up with the async
+    ORM and only the transactional close runs in a thread."""
+    now = now or timezone.now()
+    attempt = _with_quiz(await _open_attempts(user, quiz).afirst(), quiz)
+    if attempt is None:
+        return None, False
+    return await sync_to_async(_submit)(attempt, data, now)
+
+
+def _submit(attempt, data, now):
+    answers = saved_answers(attempt)
+    late = now > attempt.deadline + submit_grace()
+    if not late:
+        answers = {**answers, **_answers(attempt.quiz_id, data)}
+    if not close_attempt(attempt, answers, min(now, attempt.deadline)):
+        return None, False
+    return attempt, late
+
+
+def close_expired_attempts(now=None, batch_size=UPDATE_BATCH_SIZE):
+    """Close every attempt past its deadline plus grace, grading what was
+    autosaved. Each batch is locked, graded, written with one bulk_update and
+    credited with one ledger insert. Returns the number closed."""
+    now = now or timezone.now()
+    cutoff = now - submit_grace()
+    closed = 0
+    while True:
+        with transaction.atomic():
+            attempts = list(
+                QuizAttempt.objects.select_for_update(of=('self',))
+                .filter(completed_at__isnull=True, deadline__lte=cutoff)
+                .select_related('quiz')
+                .order_by('deadline')[:batch_size]
+            )
+            if not attempts:
+                break
+            keys = {attempt.pk: session_key(attempt.user_id, attempt.quiz_id) for attempt in attempts}
+            sessions = shared_cache().get_many(keys.values())
+            for attempt in attempts:
+                answers = _session_answers(sessions.get(keys[attempt.pk]), attempt.pk)
+                attempt.score_percent, attempt.earned_points = _score(attempt, answers)
+                attempt.answers = _stored(answers)
+                attempt.completed_at = attempt.deadline
+            QuizAttempt.objects.bulk_update(
+                attempts, ['answers', 'score_percent', 'earned_points', 'completed_at'], batch_size=batch_size
+            )
+            award_points_bulk(
+                (attempt.user_id, attempt.earned_points, PointsLedger.SOURCE_QUIZ, attempt.pk) for attempt in attempts
+            )
+            for attempt in attempts:
+                record_quiz_attempt(attempt)
+            stale = [key for pk, key in keys.items() if key in sessions and sessions[key]['attempt'] == pk]
+            transaction.on_commit(partial(shared_cache().delete_many, stale))
+        closed += len(attempts)
+    return closed
@@ -0,0 +1,60 @@
+from django.db import transaction
+
+from .models import PointsLedger, TaskSubmission
+from .points import award_points_bulk
+from .summaries import record_tasks_approved
+
+QUEUE_PAGE_SIZE = 200
+UPDATE_BATCH_SIZE = 500
+
+
+def review_submissions(submission_ids, approve, reviewer_notes=''):
+    """Approve or reject pending submissions in one transaction.
+
+    Only submissions still pending are touched, so re-running a review (or two
+    moderators clearing the same page) never credits points twice. Approved
+    submissions award their task's points with one ledger insert and one
+    aggregated increment per user. Returns the number of submissions reviewed.
+    """
+    with transaction.atomic():
+        submissions = list(
+            TaskSubmission.objects.select_for_update(of=('self',))
+            .filter(pk__in=list(submission_ids), status='pending')
+            .select_related('task')
+            .only('id', 'user_id', 'status', 'awarded_points', 'reviewer_notes', 'task__eco_points')
+        )
+        if not submissions:
+            return 0
+        for submission in submissions:
+            submission.status = 'approved' if approve else 'rejected'
+            submission.awarded_points = submission.task.eco_points if approve else 0
+            if reviewer_notes:
+                submission.reviewer_notes = reviewer_notes
+        TaskSubmission.objects.bulk_update(
+            submissions, ['status', 'awarded_points', 'reviewer_notes'], batch_size=UPDATE_BATCH_SIZE
+        )
+        if approve:
+            award_points_bulk(
+                (submission.user_id, submission.awarded_points, PointsLedger.SOURCE_TASK, submission.pk)
+                for submission in submissions if submission.awarded_points
+            )
+            approved = {}
+            for submission in submissions:
+                approved[submission.user_id] = approved.get(submission.user_id, 0) + 1
+            record_tasks_approved(approved)
+    return len(submissions)
+
+
+def pending_queue(after=None, limit=QUEUE_PAGE_SIZE):
+    """Oldest-first page of pending submissions, keyed on id for cheap paging."""
+    submissions = (
+        TaskSubmission.objects.filter(status='pending')
+        .select_related('task', 'user')
+        .only('id', 'photo', 'photo_state', 'notes', 'submitted_at', 'task__title', 'task__eco_points', 'user__username')
+        .order_by('id')
+    )
+    if after:
+        submissions = submissions.filter(pk__gt=after)
+    page = list(submissions[:limit + 1])
+    next_after = page[limit - 1].pk if len(page) > limit else None
+    return page[:limit], next_after
@@ -0,0 +1,213 @@
+# SCORM packages are unpacked once into SCORM_CACHE_DIR/<sha256 of the zip>/,
+# so identical uploads share one directory and asset requests never touch the
+# zip. The parsed imsmanifest.xml is kept next to the files as .package.json
+# and mirrored onto a ScormPackage row.
+import hashlib
+import json
+import logging
+import os
+import posixpath
+import shutil
+import threading
+import xml.etree.ElementTree as ET
+import zipfile
+from functools import partial
+from pathlib import Path
+
+from django.conf import settings
+from django.db import connections, transaction
+from mriic import images
+
+from .models import Lesson, ScormPackage
+
+INDEX_NAME = '.package.json'
+MANIFEST_NAME = 'imsmanifest.xml'
+XML_BASE = '{http://www.w3.org/XML/1998/namespace}base'
+CHUNK_SIZE = 1024 * 1024
+
+logger = logging.getLogger(__name__)
+
+
+class PackageError(ValueError):
+    pass
+
+
+def cache_root():
+    return Path(getattr(settings, 'SCORM_CACHE_DIR', Path(settings.MEDIA_ROOT) / 'scorm_cache'))
+
+
+def file_digest(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as handle:
+        for chunk in iter(lambda: handle.read(CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _join_href(*parts):
+    path = posixpath.normpath(posixpath.join(*[part for part in parts if part]))
+    if path.startswith(('../', '/')) or path == '..':
+        raise PackageError(f'Manifest points outside the package: {path}')
+    return path
+
+
+def parse_manifest(content):
+    """Index an imsmanifest.xml: title, schema version, launch path and the
+    launchable items of the default organization, in document order."""
+    try:
+        root = ET.fromstring(content)
+    except ET.ParseError as exc:
+        raise PackageError(f'Invalid {MANIFEST_NAME}: {exc}')
+    resources_el = root.find('{*}resources')
+    resources = {}
+    if resources_el is not None:
+        for resource in resources_el.iterfind('{*}resource'):
+            if resource.get('href'):
+                resources[resource.get('identifier')] = _join_href(
+                    resources_el.get(XML_BASE), resource.get(XML_BASE), resource.get('href').split('?')[0]
+                )
+    organizations = root.find('{*}organizations')
+    candidates = list(organizations.iterfind('{*}organization')) if organizations is not None else []
+    default = organizations.get('default') if organizations is not None else None
+    organization = next((org for org in candidates if org.get('identifier') == default), candidates[0] if candidates else None)
+    items = []
+    if organization is not None:
+        for item in organization.iterfind('.//{*}item'):
+            path = resources.get(item.get('identifierref'))
+            if path:
+                items.append({'title': (item.findtext('{*}title') or '').strip(), 'path': path})
+    launch_path = items[0]['path'] if items else next(iter(resources.values()), '')
+    if not launch_path:
+        raise PackageError('The manifest does not reference any launchable resource')
+    return {
+        'title': ((organization.findtext('{*}title') if organization is not None else '') or '').strip(),
+        'version': (root.findtext('{*}metadata/{*}schemaversion') or '').strip(),
+        'launch_path': launch_path,
+        'items': items,
+    }
+
+
+def _extract(archive, target, max_bytes, max_files):
+    members = [member for member in archive.infolist() if not member.is_dir()]
+    if len(members) > max_files:
+        raise PackageError(f'Package has {len(members)} files; the limit is {max_files}')
+    written = 0
+    for member in members:
+        name = posixpath.normpath(member.filename.replace('\\', '/'))
+        if name.startswith(('../', '/')) or name == '..' or ':' in name or posixpath.basename(name) == INDEX_NAME:
+            raise PackageError(f'Unsafe path in package: {member.filename}')
+        dest = os.path.join(target, *name.split('/'))
+        os.makedirs(os.path.dirname(dest), exist_ok=True)
+        with archive.open(member) as src, open(dest, 'wb') as dst:
+            # Sizes in the zip directory can lie, so count what is actually inflated
+            for chunk in iter(lambda: src.read(CHUNK_SIZE), b''):
+                written += len(chunk)
+                if written > max_bytes:
+                    raise PackageError(f'Package unpacks to more than {max_bytes} bytes')
+                dst.write(chunk)
+    return len(members), written
+
+
+def extract_package(zip_path, cache_dir, max_bytes, max_files):
+    """Unpack and index a package unless its hash is already cached; runs in a
+    pool worker, so it takes plain arguments. Returns ``(sha256, index)``."""
+    digest = file_digest(zip_path)
+    target = os.path.join(cache_dir, digest)
+    index_path = os.path.join(target, INDEX_NAME)
+    if not os.path.exists(index_path):
+        tmp = f'{target}.{os.getpid()}.tmp'
+        shutil.rmtree(tmp, ignore_errors=True)
+        try:
+            try:
+                archive = zipfile.ZipFile(zip_path)
+            except zipfile.BadZipFile as exc:
+                raise PackageError(f'Not a zip file: {exc}')
+            with archive:
+                file_count, total_size = _extract(archive, tmp, max_bytes, max_files)
+            manifest = os.path.join(tmp, MANIFEST_NAME)
+            if not os.path.isfile(manifest):
+                raise PackageError(f'{MANIFEST_NAME} is missing from the package root')
+            with open(manifest, 'rb') as handle:
+                index = parse_manifest(handle.read())
+            if not os.path.isfile(os.path.join(tmp, *index['launch_path'].split('/'))):
+                raise PackageError(f"Launch file {index['launch_path']} is missing from the package")
+            index.update(file_count=file_count, total_size=total_size)
+            with open(os.path.join(tmp, INDEX_NAME), 'w') as handle:
+                json.dump(index, handle)
+            try:
+                os.rename(tmp, target)
+            except OSError:
+                # Another worker finished the same package first
+                if not os.path.exists(index_path):
+                    raise
+        finally:
+            shutil.rmtree(tmp, ignore_errors=True)
+    with open(index_path) as handle:
+        return digest, json.load(handle)
+
+
+def job_args(lesson):
+    return (
+        lesson.scorm_package.path,
+        str(cache_root()),
+        getattr(settings, 'SCORM_MAX_UNPACKED_BYTES', 500 * 1024 * 1024),
+        getattr(settings, 'SCORM_MAX_FILES', 10000),
+    )
+
+
+def store_package(lesson_id, digest, index):
+    package, _ = ScormPackage.objects.get_or_create(sha256=digest, defaults={
+        'title': index['title'][:255],
+        'version': index['version'][:20],
+        'launch_path': index['launch_path'][:500],
+        'items': index['items'],
+        'file_count': index['file_count'],
+        'total_size': index['total_size'],
+    })
+    Lesson.objects.filter(pk=lesson_id).update(scorm=package, scorm_error='')
+    return package
+
+
+def record_failure(lesson_id, exc):
+    """Remember why the lesson's package failed, so saving the lesson again
+    does not queue the same broken file; a new upload clears it."""
+    Lesson.objects.filter(pk=lesson_id).update(scorm_error=(str(exc) or type(exc).__name__)[:255])
+
+
+def ingest(lesson):
+    """Extract (or reuse) the lesson's package in this process and link it."""
+    digest, index = extract_package(*job_args(lesson))
+    return store_package(lesson.pk, digest, index)
+
+
+def _package_extracted(lesson_id, submitter, future):
+    try:
+        try:
+            digest, index = future.result()
+        except Exception as exc:  # a broken package leaves the lesson without SCORM content
+            logger.exception('Could not extract the SCORM package of lesson %s', lesson_id)
+            record_failure(lesson_id, exc)
+            return
+        store_package(lesson_id, digest, index)
+    finally:
+        if threading.get_ident() != submitter:
+            connections.close_all()
+
+
+def schedule(lesson):
+    """Queue extraction on the shared worker pool once the lesson is committed."""
+    def submit():
+        future = images.get_executor().submit(extract_package, *job_args(lesson))
+        future.add_done_callback(partial(_package_extracted, lesson.pk, threading.get_ident()))
+    transaction.on_commit(submit)
+
+
+def asset_path(digest, path):
+    """Absolute path of a file inside an extracted package, or None."""
+    if len(digest) != 64 or not all(c in '0123456789abcdef' for c in digest):
+        return None
+    name = posixpath.normpath(path)
+    if name.startswith(('../', '/')) or name == '..' or posixpath.basename(name) == INDEX_NAME:
+        return None
+    full = cache_root() / digest / name
+    return full if full.is_file() else None
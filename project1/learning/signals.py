@@ -0,0 +1,66 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+from mriic import images
+from mriic.caching import invalidate_pages
+
+from . import scorm
+
+from .grading import invalidate_answer_key, invalidation_deferred
+from .levels import invalidate_level_index
+from .models import Choice, LevelDefinition, Lesson, Question, Quiz
+
+
+@receiver([post_save, post_delete], sender=Quiz)
+def quiz_changed(sender, instance, **kwargs):
+    if invalidation_deferred():
+        return
+    invalidate_answer_key(instance.pk)
+
+
+@receiver([post_save, post_delete], sender=Question)
+def question_changed(sender, instance, **kwargs):
+    if invalidation_deferred():
+        return
+    invalidate_answer_key(instance.quiz_id)
+
+
+@receiver([post_save, post_delete], sender=Choice)
+def choice_changed(sender, instance, **kwargs):
+    if invalidation_deferred():
+        return
+    quiz_id = Question.objects.filter(pk=instance.question_id).values_list('quiz_id', flat=True).first()
+    if quiz_id is not None:
+        invalidate_answer_key(quiz_id)
+
+
+@receiver([post_save, post_delete], sender=LevelDefinition)
+def level_changed(sender, instance, **kwargs):
+    invalidate_level_index()
+
+
+def _schedule_derivatives(image):
+    if image and not images.manifest.get(images.key_for(image)):
+        transaction.on_commit(lambda: images.schedule(image.name))
+
+
+@receiver(pre_save, sender=Lesson)
+def lesson_saving(sender, instance, **kwargs):
+    # A new or cleared upload detaches the lesson from its extracted package
+    # and forgets why the previous one failed
+    if not instance.scorm_package or not instance.scorm_package._committed:
+        instance.scorm = None
+        instance.scorm_error = ''
+
+
+@receiver(post_save, sender=Lesson)
+def lesson_saved(sender, instance, **kwargs):
+    _schedule_derivatives(instance.cover_image)
+    if instance.scorm_package and instance.scorm_id is None and not instance.scorm_error:
+        scorm.schedule(instance)
+    transaction.on_commit(invalidate_pages)
+
+
+@receiver(post_delete, sender=Lesson)
+def lesson_deleted(sender, instance, **kwargs):
+    transaction.on_commit(invalidate_pages)
@@ -0,0 +1,126 @@
+import mimetypes
+import os
+import re
+from urllib.parse import quote
+
+from django.conf import settings
+from django.http import FileResponse, HttpResponse, StreamingHttpResponse
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import content_disposition_header, http_date, quote_etag
+
+CHUNK_SIZE = 64 * 1024
+RANGE_RE = re.compile(r'^bytes=(?P<start>\d*)-(?P<end>\d*)$')
+
+
+def file_etag(stat, salt=''):
+    """Strong validator from size and mtime, enough for files replaced atomically."""
+    return quote_etag(f'{salt}{stat.st_size:x}-{stat.st_mtime_ns:x}')
+
+
+def parse_range(header, size):
+    """Return ``(start, end)`` for a single ``bytes=`` range, ``None`` to send
+    the whole file, or ``False`` when the range cannot be satisfied."""
+    match = RANGE_RE.match(header.strip())
+    if not match or (not match['start'] and not match['end']):
+        # Multi-range and malformed requests get the full body (RFC 9110 allows it)
+        return None
+    if match['start'] and match['end'] and int(match['end']) < int(match['start']):
+        # Syntactically invalid, so the header is ignored (RFC 9110 §14.2)
+        return None
+    if size == 0:
+        # No byte of an empty file can be selected, not even by a suffix range
+        return False
+    if not match['start']:
+        length = int(match['end'])
+        if length == 0:
+            return False
+        return max(size - length, 0), size - 1
+    start = int(match['start'])
+    end = min(int(match['end']), size - 1) if match['end'] else size - 1
+    if start >= size:
+        return False
+    return start, end
+
+
+def _read_range(handle, start, end):
+    with handle:
+        handle.seek(start)
+        remaining = end - start + 1
+        while remaining > 0:
+            chunk = handle.read(min(CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+
+
+def serve_file(request, path, etag=None, content_type=None, filename=None, as_attachment=False):
+    """Stream a file from disk with conditional GET and single-range support.
+
+    Answers 304/412 from If-None-Match / If-Modified-Since, 206 for a satisfiable
+    Range (honouring If-Range) and 416 otherwise. Full bodies go through
+    FileResponse so the server can use sendfile. Callers add Cache-Control.
+    """
+    stat = os.stat(path)
+    etag = etag or file_etag(stat)
+    response = get_conditional_response(request, etag=etag, last_modified=int(stat.st_mtime))
+    if response is None:
+        content_type = content_type or mimetypes.guess_type(path)[0] or 'application/octet-stream'
+        byte_range = None
+        range_header = request.headers.get('Range')
+        if range_header and request.method in ('GET', 'HEAD'):
+            if_range = request.headers.get('If-Range')
+            if not if_range or if_range == etag or if_range == http_date(int(stat.st_mtime)):
+                byte_range = parse_range(range_header, stat.st_size)
+        if byte_range is False:
+            response = HttpResponse(status=416)
+            response['Content-Range'] = f'bytes */{stat.st_size}'
+        elif byte_range:
+            start, end = byte_range
+            response = StreamingHttpResponse(_read_range(open(path, 'rb'), start, end), status=206, content_type=content_type)
+            response['Content-Range'] = f'bytes {start}-{end}/{stat.st_size}'
+            response['Content-Length'] = str(end - start + 1)
+        else:
+            response = FileResponse(open(path, 'rb'), content_type=content_type, as_attachment=as_attachment, filename=filename)
+        if filename and byte_range:
+            response['Content-Disposition'] = content_disposition_header(as_attachment, filename)
+    response['Accept-Ranges'] = 'bytes'
+    response['ETag'] = etag
+    response['Last-Modified'] = http_date(int(stat.st_mtime))
+    return response
+
+
+def send_file(request, path, name=None, etag=None, content_type=None, filename=None, as_attachment=False):
+    """Like serve_file, but hand the transfer to the front proxy when
+    SENDFILE_BACKEND is set, so no worker is held while large files stream.
+
+    ``nginx`` answers with X-Accel-Redirect to SENDFILE_URL_PREFIX + ``name``
+    (the storage name under an ``internal`` location); ``apache`` and
+    ``lighttpd`` answer with X-Sendfile and the absolute path. The proxy then
+    serves ranges itself. Conditional requests are still answered here.
+    """
+    backend = getattr(settings, 'SENDFILE_BACKEND', None)
+    if not backend:
+        return serve_file(request, path, etag=etag, content_type=content_type, filename=filename, as_attachment=as_attachment)
+    stat = os.stat(path)
+    etag = etag or file_etag(stat)
+    response = get_conditional_response(request, etag=etag, last_modified=int(stat.st_mtime))
+    if response is None:
+        response = HttpResponse(content_type=content_type or mimetypes.guess_type(path)[0] or 'application/octet-stream')
+        if backend == 'nginx':
+            response['X-Accel-Redirect'] = settings.SENDFILE_URL_PREFIX.rstrip('/') + '/' + quote(name.lstrip('/'))
+        else:
+            response['X-Sendfile'] = str(path)
+        if filename or as_attachment:
+            response['Content-Disposition'] = content_disposition_header(as_attachment, filename or os.path.basename(path))
+    response['Accept-Ranges'] = 'bytes'
+    response['ETag'] = etag
+    response['Last-Modified'] = http_date(int(stat.st_mtime))
+    return response
+
+
+def cache_forever(response, private=False):
+    """Far-future caching for content-addressed URLs."""
+    visibility = {'private': True} if private else {'public': True}
+    patch_cache_control(response, max_age=60 * 60 * 24 * 365, immutable=True, **visibility)
+    return response
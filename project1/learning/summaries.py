@@ -0,0 +1,66 @@
+from django.db import transaction
+from django.db.models import F, Q
+
+from .models import LearnerSummary, QuizAttempt
+
+
+def _touch(user_id, when):
+    """Move last_activity_at forward to ``when`` without reading the row."""
+    LearnerSummary.objects.filter(user_id=user_id).filter(
+        Q(last_activity_at__lt=when) | Q(last_activity_at__isnull=True)
+    ).update(last_activity_at=when)
+
+
+def record_quiz_attempt(attempt):
+    """Fold a completed attempt into its user's summary.
+
+    Counters are bumped in SQL, best_scores is read and written under a row
+    lock, and the lesson counts as newly completed when this is the user's
+    first completed attempt on any of its quizzes.
+    """
+    if attempt.completed_at is None:
+        return
+    with transaction.atomic():
+        LearnerSummary.objects.get_or_create(user_id=attempt.user_id)
+        summary = LearnerSummary.objects.select_for_update().only('best_scores').get(user_id=attempt.user_id)
+        first_in_lesson = not (
+            QuizAttempt.objects.filter(
+                user_id=attempt.user_id,
+                quiz__lesson_id=attempt.quiz.lesson_id,
+                completed_at__isnull=False,
+            ).exclude(pk=attempt.pk).exists()
+        )
+        changes = {'quiz_attempts': F('quiz_attempts') + 1}
+        if first_in_lesson:
+            changes['lessons_completed'] = F('lessons_completed') + 1
+        score = float(attempt.score_percent or 0)
+        quiz_key = str(attempt.quiz_id)
+        if score > summary.best_scores.get(quiz_key, -1):
+            changes['best_scores'] = {**summary.best_scores, quiz_key: score}
+        LearnerSummary.objects.filter(pk=summary.pk).update(**changes)
+        _touch(attempt.user_id, attempt.completed_at)
+
+
+def record_tasks_approved(counts):
+    """Add approved task counts, given as ``{user_id: count}``."""
+    with transaction.atomic():
+        LearnerSummary.objects.bulk_create(
+            [LearnerSummary(user_id=user_id) for user_id in counts], ignore_conflicts=True
+        )
+        for user_id, count in counts.items():
+            LearnerSummary.objects.filter(user_id=user_id).update(tasks_approved=F('tasks_approved') + count)
+
+
+def record_task_submitted(submission):
+    LearnerSummary.objects.get_or_create(user_id=submission.user_id)
+    _touch(submission.user_id, submission.submitted_at)
+
+
+def summary_for(user):
+    """The user's summary row, or an unsaved empty one for new learners."""
+    return LearnerSummary.objects.filter(user=user).first() or LearnerSummary(user=user)
+
+
+async def asummary_for(user):
+    """summary_for for async views."""
+    return await LearnerSummary.objects.filter(user=user).afirst() or LearnerSummary(user=user)
@@ -1,3 +1,900 @@
-from django.test import TestCase
+import json
+import os
+import random
+import re
+import tempfile
+import threading
+import time
+import zipfile
+from concurrent.futures import Future
+from datetime import timedelta
+from importlib import import_module
+from io import BytesIO, StringIO
+from unittest import mock, skipUnless
 
-# Create your tests here.
+from django.apps import apps
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.core.management import CommandError, call_command
+from django.http import QueryDict
+from django.db import connection
+from django.test import RequestFactory, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from mriic.caching import cache_version, invalidate_pages
+from PIL import Image
+
+from . import scorm
+from .catalog import acatalog_page, catalog_page, catalog_queryset, quizzes_with_last_attempt
+from .forms import LessonForm
+from .grading import get_answer_key
+from .leaderboards import BOARDS, leaderboard_page, period_key, rank_of, rank_store, rebuild_board
+from .levels import forget_level_index, get_level_index
+from .models import (Choice, LeaderboardEntry, LearnerSummary, Lesson, LevelDefinition, PointsLedger, Question, Quiz,
+                     QuizAttempt, Task, TaskSubmission, UserProgress)
+from .points import award_points, award_points_bulk
+from .quiz_builder import parse_builder_post, save_quiz_questions
+from .quiz_sessions import (_create_attempt, autosave_answers, close_expired_attempts, saved_answers, start_attempt,
+                            submit_attempt)
+from .publishing import due_to_publish, due_to_unpublish, run_due
+from .review import pending_queue, review_submissions
+from .streaming import parse_range, serve_file
+from .summaries import record_quiz_attempt, record_task_submitted, record_tasks_approved
+from .uploads import _photo_processed, process_photo
+from .versioning import bump_version
+
+User = get_user_model()
+
+
+@skipUnless(connection.vendor == 'sqlite', 'Plans are read with SQLite EXPLAIN QUERY PLAN')
+class HotQueryPlanTests(TestCase):
+    """Every hot query must reach its rows through an index, never a full table scan.
+
+    The tables are seeded at roughly production proportions and ANALYZEd so
+    the planner sees realistic statistics before the plans are checked.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        rng = random.Random(20)
+        now = timezone.now()
+        users = User.objects.bulk_create([User(username=f'learner{n}') for n in range(300)])
+        lessons = Lesson.objects.bulk_create([
+            Lesson(title=f'Lesson {n}', slug=f'lesson-{n}', short_description='', html_content='<p>…</p>' * 50,
+                   is_published=n % 10 != 0,
+                   publish_at=now + timedelta(days=n % 30 - 5) if n % 10 == 0 else None,
+                   unpublish_at=now + timedelta(days=n % 60 - 5) if n % 50 == 1 else None)
+            for n in range(1500)
+        ])
+        quizzes = Quiz.objects.bulk_create([Quiz(lesson=lesson, title=f'Quiz {lesson.pk}') for lesson in lessons])
+        QuizAttempt.objects.bulk_create([
+            QuizAttempt(
+                user=rng.choice(users),
+                quiz=rng.choice(quizzes),
+                score_percent=rng.randint(0, 100),
+                completed_at=None if n % 7 == 0 else now - timedelta(minutes=n),
+            )
+            for n in range(20000)
+        ], batch_size=2000)
+        # Campaign tasks are archived once they end; few stay active
+        tasks = Task.objects.bulk_create([
+            Task(title=f'Task {n}', description='', is_active=n % 20 == 0) for n in range(2000)
+        ])
+        submissions = TaskSubmission.objects.bulk_create([
+            TaskSubmission(
+                task=rng.choice(tasks),
+                user=rng.choice(users),
+                status='pending' if n % 25 == 0 else rng.choice(['approved', 'rejected']),
+            )
+            for n in range(10000)
+        ], batch_size=2000)
+        for n, submission in enumerate(submissions):
+            submission.submitted_at = now - timedelta(minutes=n)
+        TaskSubmission.objects.bulk_update(submissions, ['submitted_at'], batch_size=2000)
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE')
+        cls.user = users[0]
+
+    def plan(self, queryset):
+        """``(parent, detail)`` rows of the query plan; parent 0 is the outer query."""
+        with connection.cursor() as cursor:
+            sql, params = queryset.query.sql_with_params()
+            cursor.execute(f'EXPLAIN QUERY PLAN {sql}', params)
+            return [(row[1], row[-1]) for row in cursor.fetchall()]
+
+    def assertNoTableScan(self, queryset, table, index=None, bounded=False):
+        """Fail if ``table`` is read by a full scan rather than an index search.
+
+        With ``bounded``, a scan of the outer table is accepted when it walks
+        the primary key in the requested order, so LIMIT stops it early.
+        """
+        plan = self.plan(queryset)
+        text = '\n'.join(detail for _, detail in plan)
+        scans = [
+            (parent, detail) for parent, detail in plan
+            if re.match(rf'SCAN {table}\b', detail) and 'INDEX' not in detail
+        ]
+        if bounded and queryset.query.high_mark is not None:
+            sorted_outer = any(parent == 0 and 'TEMP B-TREE' in detail for parent, detail in plan)
+            if not sorted_outer:
+                scans = [(parent, detail) for parent, detail in scans if parent != 0]
+        self.assertEqual(scans, [], f'{table} is scanned:\n{text}')
+        if index:
+            self.assertIn(index, text, f'{index} is not used:\n{text}')
+        return text
+
+    def test_catalog_first_page_reads_in_id_order(self):
+        # Most lessons are published, so SQLite may walk the primary key and stop
+        # after 25 rows instead of using lesson_published_idx; either is cheap
+        page = catalog_queryset(self.user)[:25]
+        self.assertNoTableScan(page, 'learning_lesson', bounded=True)
+        self.assertNoTableScan(page, 'learning_quizattempt', 'quizattempt_user_done_idx')
+
+    def test_catalog_later_page_seeks_on_id(self):
+        page = catalog_queryset(self.user).filter(pk__gt=1000)[:25]
+        self.assertNoTableScan(page, 'learning_lesson')
+        self.assertNoTableScan(page, 'learning_quizattempt', 'quizattempt_user_done_idx')
+
+    def test_lesson_detail_attempt_lookup_uses_index(self):
+        lesson = Lesson.objects.filter(is_published=True).first()
+        quizzes = quizzes_with_last_attempt(self.user).filter(lesson=lesson)
+        self.assertNoTableScan(quizzes, 'learning_quiz')
+        self.assertNoTableScan(quizzes, 'learning_quizattempt', 'quizattempt_user_done_idx')
+
+    def test_latest_completed_attempt_uses_attempt_index(self):
+        quiz = Quiz.objects.first()
+        attempts = QuizAttempt.objects.filter(
+            user=self.user, quiz=quiz, completed_at__isnull=False,
+        ).order_by('-completed_at')[:1]
+        self.assertNoTableScan(attempts, 'learning_quizattempt', 'quizattempt_user_done_idx')
+
+    def test_submission_status_filter_uses_index(self):
+        pending = TaskSubmission.objects.filter(status='pending').order_by('-submitted_at')[:100]
+        self.assertNoTableScan(pending, 'learning_tasksubmission', 'tasksubmission_status_idx')
+
+    def test_review_queue_uses_status_index(self):
+        queue = (
+            TaskSubmission.objects.filter(status='pending', pk__gt=0)
+            .select_related('task', 'user').order_by('id')[:200]
+        )
+        self.assertNoTableScan(queue, 'learning_tasksubmission')
+        submissions, _ = pending_queue()
+        self.assertTrue(submissions)
+
+    def test_active_tasks_use_index(self):
+        self.assertNoTableScan(Task.objects.filter(is_active=True), 'learning_task', 'task_active_idx')
+
+    def test_publisher_finds_due_lessons_by_index(self):
+        now = timezone.now()
+        self.assertNoTableScan(due_to_publish(now)[:500], 'learning_lesson', 'lesson_publish_due_idx')
+        self.assertNoTableScan(due_to_unpublish(now)[:500], 'learning_lesson', 'lesson_unpublish_due_idx')
+
+
+def make_quiz(questions=2, **quiz_fields):
+    """A published lesson with one quiz of MCQ questions; choice "right" is correct."""
+    lesson = Lesson.objects.create(title='Soil', slug=f'soil-{Lesson.objects.count()}', short_description='')
+    quiz = Quiz.objects.create(lesson=lesson, title='Soil quiz', **quiz_fields)
+    for n in range(questions):
+        question = Question.objects.create(quiz=quiz, text=f'Question {n}', order=n)
+        Choice.objects.bulk_create([
+            Choice(question=question, text='right', is_correct=True),
+            Choice(question=question, text='wrong'),
+        ])
+    return quiz
+
+
+def correct_answers(quiz):
+    return {
+        f'question_{question_id}': str(choice_id)
+        for question_id, choice_id in Question.objects.filter(quiz=quiz, choices__is_correct=True)
+        .values_list('pk', 'choices__pk')
+    }
+
+
+class AnswerKeyTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.quiz = make_quiz()
+        self.question = self.quiz.questions.first()
+        self.right, self.wrong = self.question.choices.order_by('pk')
+
+    def test_choice_edit_invalidates_answer_key_after_commit(self):
+        self.assertEqual(get_answer_key(self.quiz.pk)[self.question.pk], {self.right.pk})
+        with self.captureOnCommitCallbacks(execute=True):
+            self.wrong.is_correct = True
+            self.wrong.save()
+            # Not yet committed: other requests must keep the old key
+            self.assertEqual(get_answer_key(self.quiz.pk)[self.question.pk], {self.right.pk})
+        self.assertEqual(get_answer_key(self.quiz.pk)[self.question.pk], {self.right.pk, self.wrong.pk})
+
+    def test_question_delete_invalidates_answer_key(self):
+        self.assertEqual(len(get_answer_key(self.quiz.pk)), 2)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.question.delete()
+        self.assertEqual(set(get_answer_key(self.quiz.pk)), set(self.quiz.questions.values_list('pk', flat=True)))
+
+    def test_rolled_back_edit_keeps_answer_key(self):
+        get_answer_key(self.quiz.pk)
+        with self.captureOnCommitCallbacks() as callbacks:
+            self.wrong.is_correct = True
+            self.wrong.save()
+        self.assertTrue(callbacks)
+        self.assertEqual(get_answer_key(self.quiz.pk)[self.question.pk], {self.right.pk})
+
+
+class CatalogTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user, cls.other = User.objects.bulk_create([User(username='learner'), User(username='other')])
+        cls.lessons = Lesson.objects.bulk_create([
+            Lesson(title=f'Lesson {n}', slug=f'lesson-{n}', short_description='', html_content='<p>' * 1000)
+            for n in range(5)
+        ])
+        Lesson.objects.create(title='Draft', slug='draft', short_description='', is_published=False)
+        quiz = Quiz.objects.create(lesson=cls.lessons[0], title='Soil quiz')
+        now = timezone.now()
+        QuizAttempt.objects.bulk_create([
+            QuizAttempt(user=cls.user, quiz=quiz, started_at=now, completed_at=now, score_percent=40),
+            QuizAttempt(user=cls.user, quiz=quiz, started_at=now + timedelta(seconds=1), completed_at=now,
+                        score_percent=90),
+            QuizAttempt(user=cls.user, quiz=quiz, started_at=now + timedelta(seconds=2)),
+            QuizAttempt(user=cls.other, quiz=quiz, started_at=now, completed_at=now, score_percent=100),
+        ])
+
+    def test_cards_carry_the_viewers_best_score_and_skip_the_body(self):
+        with self.assertNumQueries(1):
+            lessons = list(catalog_queryset(self.user))
+        self.assertEqual([lesson.pk for lesson in lessons], [lesson.pk for lesson in self.lessons])
+        self.assertEqual((lessons[0].best_score, lessons[0].completed), (90, True))
+        self.assertEqual((lessons[1].best_score, lessons[1].completed), (None, False))
+        self.assertIn('html_content', lessons[0].get_deferred_fields())
+        other = catalog_queryset(self.other).get(pk=self.lessons[0].pk)
+        self.assertEqual((other.best_score, other.completed), (100, True))
+
+    def test_pages_follow_the_keyset_in_one_query_each(self):
+        seen, after = [], None
+        for expected_next in (self.lessons[1].pk, self.lessons[3].pk, None):
+            with self.assertNumQueries(1):
+                page, after = catalog_page(self.user, after=after, limit=2)
+            self.assertEqual(after, expected_next)
+            seen += [lesson.pk for lesson in page]
+        self.assertEqual(seen, [lesson.pk for lesson in self.lessons])
+
+    async def test_async_page_matches_the_sync_page(self):
+        page, after = await acatalog_page(self.user, after=self.lessons[0].pk, limit=3)
+        self.assertEqual([lesson.pk for lesson in page], [lesson.pk for lesson in self.lessons[1:4]])
+        self.assertEqual(after, self.lessons[3].pk)
+
+
+class PointsTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.seedling, cls.sprout, cls.tree = LevelDefinition.objects.bulk_create([
+            LevelDefinition(number=1, name='Seedling', required_points=0),
+            LevelDefinition(number=2, name='Sprout', required_points=100),
+            LevelDefinition(number=3, name='Tree', required_points=250),
+        ])
+        cls.alice, cls.bob = User.objects.bulk_create([User(username='alice'), User(username='bob')])
+        # bulk_create sends no signals; rebuild the index around these levels
+        cls.addClassCleanup(forget_level_index)
+
+    def setUp(self):
+        forget_level_index()
+
+    def progress(self, user):
+        return UserProgress.objects.get(user=user)
+
+    def test_bulk_award_aggregates_per_user(self):
+        award_points_bulk([
+            (self.alice.pk, 60, PointsLedger.SOURCE_QUIZ, 1),
+            (self.alice.pk, 60, PointsLedger.SOURCE_QUIZ, 2),
+            (self.bob.pk, 300, PointsLedger.SOURCE_QUIZ, 3),
+        ])
+        self.assertEqual(PointsLedger.objects.count(), 3)
+        alice, bob = self.progress(self.alice), self.progress(self.bob)
+        self.assertEqual((alice.total_points, alice.current_level_id), (120, self.sprout.pk))
+        self.assertEqual((bob.total_points, bob.current_level_id), (300, self.tree.pk))
+        self.assertEqual(
+            LeaderboardEntry.objects.get(user=self.alice, board=LeaderboardEntry.BOARD_GLOBAL).points, 120,
+        )
+
+    def test_increment_ignores_stale_instances(self):
+        award_points(self.alice, 90, PointsLedger.SOURCE_QUIZ)
+        stale = self.progress(self.alice)
+        award_points_bulk([(self.alice.pk, 20, PointsLedger.SOURCE_QUIZ, None)])
+        award_points(self.alice, 10, PointsLedger.SOURCE_QUIZ)
+        # The level and total were computed from the row, not from this copy
+        self.assertEqual(stale.total_points, 90)
+        progress = self.progress(self.alice)
+        self.assertEqual((progress.total_points, progress.current_level_id), (120, self.sprout.pk))
+        self.assertEqual(sum(PointsLedger.objects.filter(user=self.alice).values_list('delta', flat=True)), 120)
+
+    def test_negative_delta_drops_level(self):
+        award_points(self.bob, 260, PointsLedger.SOURCE_QUIZ)
+        award_points_bulk([(self.bob.pk, -200, PointsLedger.SOURCE_ADJUSTMENT, None)])
+        progress = self.progress(self.bob)
+        self.assertEqual((progress.total_points, progress.current_level_id), (60, self.seedling.pk))
+
+    def test_level_edit_rebuilds_index_after_commit(self):
+        self.assertEqual(get_level_index().level_id_for(200), self.sprout.pk)
+        with self.captureOnCommitCallbacks(execute=True):
+            grove = LevelDefinition.objects.create(number=4, name='Grove', required_points=200)
+            self.assertEqual(get_level_index().level_id_for(200), self.sprout.pk)
+        self.assertEqual(get_level_index().level_id_for(200), grove.pk)
+        award_points(self.alice, 210, PointsLedger.SOURCE_QUIZ)
+        self.assertEqual(self.progress(self.alice).current_level_id, grove.pk)
+
+    def test_level_lookups_read_the_shared_version_once_per_interval(self):
+        get_level_index()
+        with self.assertNumQueries(0):
+            for total in (0, 150, 300):
+                get_level_index().level_id_for(total)
+        # Another process edits the levels; this one notices after the interval
+        LevelDefinition.objects.filter(pk=self.tree.pk).update(required_points=150)
+        bump_version('levels')
+        self.assertEqual(get_level_index().level_id_for(200), self.sprout.pk)
+        with mock.patch('learning.levels.time.monotonic', return_value=time.monotonic() + 60):
+            self.assertEqual(get_level_index().level_id_for(200), self.tree.pk)
+
+    def test_empty_bulk_award_writes_nothing(self):
+        with self.assertNumQueries(0):
+            self.assertEqual(award_points_bulk([]), [])
+
+    def test_reconcile_recomputes_drifted_totals_from_the_ledger(self):
+        award_points(self.alice, 120, PointsLedger.SOURCE_QUIZ)
+        UserProgress.objects.filter(user=self.alice).update(total_points=5, current_level=None)
+        call_command('reconcile_points', stdout=StringIO())
+        progress = self.progress(self.alice)
+        self.assertEqual((progress.total_points, progress.current_level_id), (120, self.sprout.pk))
+
+    def test_pre_ledger_totals_are_seeded_as_adjustments(self):
+        seed_ledger = import_module('learning.migrations.0013_seed_points_ledger').seed_ledger
+        award_points(self.alice, 50, PointsLedger.SOURCE_QUIZ)
+        UserProgress.objects.filter(user=self.alice).update(total_points=170)
+        UserProgress.objects.create(user=self.bob, total_points=300)
+        seed_ledger(apps, None)
+        adjustments = PointsLedger.objects.filter(source_type=PointsLedger.SOURCE_ADJUSTMENT)
+        self.assertEqual(dict(adjustments.values_list('user', 'delta')), {self.alice.pk: 120, self.bob.pk: 300})
+        call_command('reconcile_points', stdout=StringIO())
+        self.assertEqual((self.progress(self.alice).total_points, self.progress(self.bob).total_points), (170, 300))
+
+
+class LeaderboardRankTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.users = User.objects.bulk_create([User(username=f'ranked{n}') for n in range(5)])
+        LeaderboardEntry.objects.bulk_create([
+            LeaderboardEntry(board=LeaderboardEntry.BOARD_GLOBAL, period='', user=user, points=points)
+            for user, points in zip(cls.users, (300, 200, 200, 200, 50))
+        ])
+
+    def test_ties_share_a_rank(self):
+        ranks = [rank_of(user, LeaderboardEntry.BOARD_GLOBAL) for user in self.users]
+        self.assertEqual(ranks, [(1, 300), (2, 200), (2, 200), (2, 200), (5, 50)])
+
+    def test_unranked_user(self):
+        outsider = User.objects.create(username='outsider')
+        self.assertIsNone(rank_of(outsider, LeaderboardEntry.BOARD_GLOBAL))
+        self.assertIsNone(rank_of(self.users[0], LeaderboardEntry.BOARD_WEEKLY))
+
+    def test_pages_agree_with_rank_of_across_a_tie(self):
+        first, cursor = leaderboard_page(LeaderboardEntry.BOARD_GLOBAL, limit=2)
+        second, cursor = leaderboard_page(LeaderboardEntry.BOARD_GLOBAL, after=cursor, limit=2)
+        third, cursor = leaderboard_page(LeaderboardEntry.BOARD_GLOBAL, after=cursor, limit=2)
+        self.assertIsNone(cursor)
+        for entry in first + second + third:
+            self.assertEqual(entry.rank, rank_of(entry.user_id, LeaderboardEntry.BOARD_GLOBAL)[0])
+
+    def test_global_board_is_seeded_from_the_ledger(self):
+        seed_global_board = import_module('learning.migrations.0014_seed_global_leaderboard').seed_global_board
+        PointsLedger.objects.bulk_create([
+            PointsLedger(user=self.users[4], source_type=PointsLedger.SOURCE_ADJUSTMENT, delta=400),
+            PointsLedger(user=self.users[0], source_type=PointsLedger.SOURCE_QUIZ, delta=100),
+        ])
+        seed_global_board(apps, None)
+        self.assertEqual(rank_of(self.users[4], LeaderboardEntry.BOARD_GLOBAL), (1, 400))
+        self.assertEqual(rank_of(self.users[0], LeaderboardEntry.BOARD_GLOBAL), (2, 100))
+        self.assertIsNone(rank_of(self.users[1], LeaderboardEntry.BOARD_GLOBAL))
+
+
+@skipUnless(settings.REDIS_URL, 'Set REDIS_URL to test the sorted-set ranks')
+class RedisRankTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.users = User.objects.bulk_create([User(username=f'ranked{n}') for n in range(4)])
+
+    def setUp(self):
+        self.clear_sorted_sets()
+        self.addCleanup(self.clear_sorted_sets)
+
+    def clear_sorted_sets(self):
+        rank_store().delete(*(f'learning:leaderboard:{board}:{period_key(board)}' for board in BOARDS))
+
+    def test_ranks_follow_committed_awards(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            award_points_bulk([(user.pk, points, PointsLedger.SOURCE_QUIZ, None)
+                               for user, points in zip(self.users, (300, 200, 200, 50))])
+        with self.assertNumQueries(0):
+            ranks = [rank_of(user, LeaderboardEntry.BOARD_WEEKLY) for user in self.users]
+        self.assertEqual(ranks, [(1, 300), (2, 200), (2, 200), (4, 50)])
+        with self.captureOnCommitCallbacks():
+            award_points(self.users[3], 500, PointsLedger.SOURCE_QUIZ)
+        self.assertEqual(rank_of(self.users[3], LeaderboardEntry.BOARD_GLOBAL), (4, 50))
+
+    def test_rebuild_reloads_the_sorted_set(self):
+        award_points_bulk([(self.users[0].pk, 120, PointsLedger.SOURCE_QUIZ, None)])
+        with self.captureOnCommitCallbacks(execute=True):
+            rebuild_board(LeaderboardEntry.BOARD_GLOBAL)
+        with self.assertNumQueries(0):
+            self.assertEqual(rank_of(self.users[0], LeaderboardEntry.BOARD_GLOBAL), (1, 120))
+
+
+class QuizBuilderSaveTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.quiz = make_quiz(questions=3)
+        self.kept, self.edited, self.dropped = self.quiz.questions.order_by('order')
+
+    def post(self, fields):
+        data = QueryDict(mutable=True)
+        data.update(fields)
+        return parse_builder_post(data)
+
+    def test_create_update_and_delete_in_one_save(self):
+        kept_right, kept_wrong = self.kept.choices.order_by('pk')
+        edited_right, edited_wrong = self.edited.choices.order_by('pk')
+        get_answer_key(self.quiz.pk)
+        submitted = self.post({
+            'total_questions': '3',
+            # Unchanged
+            'q1_id': self.kept.pk, 'q1_text': 'Question 0', 'q1_type': 'MCQ', 'q1_choice_count': '2',
+            'q1_choice1_id': kept_right.pk, 'q1_choice1_text': 'right', 'q1_choice1_correct': 'on',
+            'q1_choice2_id': kept_wrong.pk, 'q1_choice2_text': 'wrong',
+            # Reworded, correct answer moved, one choice dropped and one added
+            'q2_id': self.edited.pk, 'q2_text': 'Question 1, reworded', 'q2_type': 'MCQ', 'q2_choice_count': '2',
+            'q2_choice1_id': edited_wrong.pk, 'q2_choice1_text': 'now right', 'q2_choice1_correct': 'on',
+            'q2_choice2_text': 'new wrong',
+            # New; the third stored question is left out and so deleted
+            'q3_text': 'Is compost soil?', 'q3_type': 'TF', 'q3_tf_correct': 'true',
+        })
+        with self.captureOnCommitCallbacks(execute=True):
+            save_quiz_questions(self.quiz, submitted)
+
+        questions = list(self.quiz.questions.order_by('order'))
+        self.assertEqual([q.pk for q in questions[:2]], [self.kept.pk, self.edited.pk])
+        self.assertFalse(Question.objects.filter(pk=self.dropped.pk).exists())
+        self.assertEqual(questions[1].text, 'Question 1, reworded')
+        self.assertEqual(set(self.kept.choices.values_list('pk', flat=True)), {kept_right.pk, kept_wrong.pk})
+        edited = dict(self.edited.choices.values_list('text', 'is_correct'))
+        self.assertEqual(edited, {'now right': True, 'new wrong': False})
+        self.assertFalse(Choice.objects.filter(pk=edited_right.pk).exists())
+        self.assertEqual(dict(questions[2].choices.values_list('text', 'is_correct')), {'True': True, 'False': False})
+
+        answer_key = get_answer_key(self.quiz.pk)
+        self.assertEqual(answer_key[self.edited.pk], {edited_wrong.pk})
+        self.assertEqual(len(answer_key), 3)
+
+    def test_resave_keeps_true_false_choices(self):
+        fields = {'total_questions': '1', 'q1_text': 'Is compost soil?', 'q1_type': 'TF', 'q1_tf_correct': 'true'}
+        save_quiz_questions(self.quiz, self.post(fields))
+        question = self.quiz.questions.get()
+        choice_ids = set(question.choices.values_list('pk', flat=True))
+        fields.update({'q1_id': question.pk, 'q1_tf_correct': 'false'})
+        save_quiz_questions(self.quiz, self.post(fields))
+        self.assertEqual(set(question.choices.values_list('pk', flat=True)), choice_ids)
+        self.assertEqual(question.choices.get(is_correct=True).text, 'False')
+
+
+MANIFEST = b"""<?xml version="1.0"?>
+<manifest xmlns="http://www.imsglobal.org/xsd/imscp_v1p1">
+  <organizations default="org"><organization identifier="org"><title>Soil</title>
+    <item identifier="i1" identifierref="r1"><title>Start</title></item>
+  </organization></organizations>
+  <resources><resource identifier="r1" href="%s"/></resources>
+</manifest>"""
+
+
+class QuizBankImportTests(TestCase):
+    def import_lines(self, records, **options):
+        with tempfile.NamedTemporaryFile('w', suffix='.jsonl', delete=False) as handle:
+            handle.write('\n'.join(record if isinstance(record, str) else json.dumps(record) for record in records))
+        self.addCleanup(os.remove, handle.name)
+        call_command('quiz_bank', 'import', handle.name, stdout=StringIO(), **options)
+
+    def record(self, text, **fields):
+        return {'lesson_slug': 'soil-0', 'quiz_title': 'Soil quiz', 'question_text': text,
+                'choices': [{'text': 'right', 'is_correct': True}, {'text': 'wrong'}], **fields}
+
+    def test_bad_choices_name_the_line(self):
+        for choices in ('a|b', ['a', 'b'], [{'text': ''}], [{'is_correct': True}]):
+            with self.subTest(choices=choices):
+                with self.assertRaisesMessage(CommandError, 'Line 2: choices must be a list of objects'):
+                    self.import_lines([self.record('Q1'), self.record('Q2', choices=choices)])
+
+    def test_committed_chunks_invalidate_their_answer_keys_when_a_later_one_fails(self):
+        quiz = make_quiz(questions=1)
+        self.assertEqual(len(get_answer_key(quiz.pk)), 1)
+        with self.captureOnCommitCallbacks(execute=True):
+            with self.assertRaisesMessage(CommandError, 'Line 2:'):
+                self.import_lines([self.record('Replacement'), self.record('Q2', question_order='x')],
+                                  chunk_size=1, replace=True)
+        self.assertEqual(list(quiz.questions.values_list('text', flat=True)), ['Replacement'])
+        self.assertEqual(set(get_answer_key(quiz.pk)), set(quiz.questions.values_list('pk', flat=True)))
+
+
+class ScormPackageTests(TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.cache_dir = os.path.join(self.tmp.name, 'cache')
+
+    def package(self, files):
+        path = os.path.join(self.tmp.name, f'package{len(os.listdir(self.tmp.name))}.zip')
+        with zipfile.ZipFile(path, 'w') as archive:
+            for name, content in files.items():
+                archive.writestr(name, content)
+        return path
+
+    def extract(self, path):
+        return scorm.extract_package(path, self.cache_dir, 10 * 1024 * 1024, 100)
+
+    def test_valid_package_is_indexed(self):
+        digest, index = self.extract(self.package({'imsmanifest.xml': MANIFEST % b'index.html', 'index.html': b'<p>'}))
+        self.assertEqual(index['launch_path'], 'index.html')
+        self.assertTrue(os.path.isfile(os.path.join(self.cache_dir, digest, 'index.html')))
+
+    def test_path_traversal_is_rejected(self):
+        for name in ('../escaped.html', 'lessons/../../escaped.html', '/escaped.html', '..\\escaped.html',
+                     'c:/escaped.html', scorm.INDEX_NAME):
+            with self.subTest(name=name):
+                path = self.package({'imsmanifest.xml': MANIFEST % b'index.html', 'index.html': b'<p>', name: b'x'})
+                with self.assertRaises(scorm.PackageError):
+                    self.extract(path)
+                self.assertFalse(os.path.exists(os.path.join(self.tmp.name, 'escaped.html')))
+                self.assertEqual(os.listdir(self.cache_dir) if os.path.exists(self.cache_dir) else [], [])
+
+    def test_manifest_pointing_outside_is_rejected(self):
+        path = self.package({'imsmanifest.xml': MANIFEST % b'../../etc/passwd', 'index.html': b'<p>'})
+        with self.assertRaises(scorm.PackageError):
+            self.extract(path)
+
+    def test_asset_path_refuses_to_leave_the_package(self):
+        digest = 'a' * 64
+        self.assertIsNone(scorm.asset_path(digest, '../other/index.html'))
+        self.assertIsNone(scorm.asset_path(digest, scorm.INDEX_NAME))
+        self.assertIsNone(scorm.asset_path('../' + digest[3:], 'index.html'))
+
+    def test_failed_extraction_is_recorded_and_not_requeued(self):
+        lesson = Lesson.objects.create(title='Soil', slug='soil', short_description='', scorm_package='scorm/broken.zip')
+        future = Future()
+        future.set_exception(scorm.PackageError('Not a zip file'))
+        with self.assertLogs('learning.scorm', 'ERROR'):
+            scorm._package_extracted(lesson.pk, threading.get_ident(), future)
+        lesson.refresh_from_db()
+        self.assertEqual(lesson.scorm_error, 'Not a zip file')
+        with mock.patch.object(scorm, 'schedule') as schedule:
+            lesson.title = 'Soil basics'
+            lesson.save()
+        schedule.assert_not_called()
+
+
+class LearnerSummaryTests(TestCase):
+    def setUp(self):
+        self.alice, self.bob = User.objects.bulk_create([User(username='alice'), User(username='bob')])
+        self.quiz = make_quiz()
+        self.sibling = Quiz.objects.create(lesson=self.quiz.lesson, title='More soil')
+        self.other = make_quiz()
+
+    def complete(self, user, quiz, score):
+        attempt = QuizAttempt.objects.create(user=user, quiz=quiz)
+        attempt.mark_complete(score, 0)
+        return attempt
+
+    def summary(self, user):
+        return LearnerSummary.objects.get(user=user)
+
+    def test_quiz_attempts_bump_counters_and_keep_the_best_score(self):
+        self.complete(self.alice, self.quiz, 60)
+        self.complete(self.alice, self.quiz, 40)
+        summary = self.summary(self.alice)
+        self.assertEqual((summary.quiz_attempts, summary.lessons_completed), (2, 1))
+        self.assertEqual(summary.best_scores, {str(self.quiz.pk): 60})
+        # Another quiz of the same lesson is not a new lesson; a second lesson is
+        self.complete(self.alice, self.sibling, 80)
+        last = self.complete(self.alice, self.other, 100)
+        summary = self.summary(self.alice)
+        self.assertEqual((summary.quiz_attempts, summary.lessons_completed), (4, 2))
+        self.assertEqual(
+            summary.best_scores, {str(self.quiz.pk): 60, str(self.sibling.pk): 80, str(self.other.pk): 100},
+        )
+        self.assertEqual(summary.last_activity_at, last.completed_at)
+        self.assertFalse(LearnerSummary.objects.filter(user=self.bob).exists())
+
+    def test_open_attempts_are_not_counted(self):
+        record_quiz_attempt(QuizAttempt.objects.create(user=self.alice, quiz=self.quiz))
+        self.assertFalse(LearnerSummary.objects.exists())
+
+    def test_task_approvals_add_to_the_counter(self):
+        record_tasks_approved({self.alice.pk: 2, self.bob.pk: 1})
+        record_tasks_approved({self.alice.pk: 1})
+        self.assertEqual((self.summary(self.alice).tasks_approved, self.summary(self.bob).tasks_approved), (3, 1))
+
+    def test_backfill_reproduces_the_incremental_counters(self):
+        self.complete(self.alice, self.quiz, 60)
+        self.complete(self.alice, self.sibling, 70)
+        self.complete(self.bob, self.other, 30)
+        task = Task.objects.create(title='Plant', description='')
+        submissions = [TaskSubmission.objects.create(task=task, user=user) for user in (self.alice, self.bob, self.bob)]
+        for submission in submissions:
+            record_task_submitted(submission)
+        review_submissions([submission.pk for submission in submissions[:2]], True)
+        fields = ['user', 'lessons_completed', 'quiz_attempts', 'best_scores', 'tasks_approved', 'last_activity_at']
+        incremental = list(LearnerSummary.objects.order_by('user').values(*fields))
+        LearnerSummary.objects.all().delete()
+        call_command('backfill_learner_summaries', chunk_size=1, stdout=StringIO())
+        self.assertEqual(list(LearnerSummary.objects.order_by('user').values(*fields)), incremental)
+
+
+class TaskReviewTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.alice, cls.bob = User.objects.bulk_create([User(username='alice'), User(username='bob')])
+        cls.plant, cls.compost = Task.objects.bulk_create([
+            Task(title='Plant', description='', eco_points=150),
+            Task(title='Compost', description='', eco_points=40),
+        ])
+        cls.addClassCleanup(forget_level_index)
+
+    def setUp(self):
+        forget_level_index()
+
+    def submit(self, count, users=None):
+        users = users or [self.alice, self.bob]
+        return TaskSubmission.objects.bulk_create([
+            TaskSubmission(task=(self.plant, self.compost)[n % 2], user=users[n % len(users)]) for n in range(count)
+        ])
+
+    def credited(self, user):
+        entries = PointsLedger.objects.filter(user=user, source_type=PointsLedger.SOURCE_TASK)
+        return sum(entries.values_list('delta', flat=True))
+
+    def test_approval_credits_each_task_once(self):
+        plant, compost = self.submit(2, users=[self.alice])
+        self.assertEqual(review_submissions([plant.pk, compost.pk], True, 'Well done'), 2)
+        self.assertEqual(
+            sorted(PointsLedger.objects.filter(user=self.alice).values_list('source_id', 'delta')),
+            sorted([(plant.pk, 150), (compost.pk, 40)]),
+        )
+        self.assertEqual(UserProgress.objects.get(user=self.alice).total_points, 190)
+        self.assertEqual(LearnerSummary.objects.get(user=self.alice).tasks_approved, 2)
+        plant.refresh_from_db()
+        self.assertEqual((plant.status, plant.awarded_points, plant.reviewer_notes), ('approved', 150, 'Well done'))
+
+    def test_rejection_credits_nothing(self):
+        plant, compost = self.submit(2, users=[self.alice])
+        self.assertEqual(review_submissions([plant.pk, compost.pk], False), 2)
+        self.assertFalse(PointsLedger.objects.exists())
+        self.assertFalse(UserProgress.objects.filter(user=self.alice, total_points__gt=0).exists())
+        self.assertFalse(LearnerSummary.objects.filter(user=self.alice, tasks_approved__gt=0).exists())
+        reviewed = TaskSubmission.objects.order_by().values_list('status', 'awarded_points').distinct()
+        self.assertEqual(list(reviewed), [('rejected', 0)])
+
+    def test_re_review_does_not_double_credit(self):
+        ids = [submission.pk for submission in self.submit(4)]
+        self.assertEqual(review_submissions(ids[:3], True), 3)
+        # A second moderator clears the same page, then a stale rejection
+        self.assertEqual(review_submissions(ids, True), 1)
+        self.assertEqual(review_submissions(ids, False), 0)
+        self.assertEqual(PointsLedger.objects.count(), 4)
+        self.assertEqual((self.credited(self.alice), self.credited(self.bob)), (300, 80))
+        self.assertEqual(UserProgress.objects.get(user=self.alice).total_points, 300)
+        self.assertEqual(LearnerSummary.objects.get(user=self.bob).tasks_approved, 2)
+
+    def test_query_count_does_not_grow_with_the_number_of_tasks(self):
+        # Both learners already have progress, summary and board rows
+        review_submissions([submission.pk for submission in self.submit(2)], True)
+        counts = []
+        for size in (4, 40):
+            ids = [submission.pk for submission in self.submit(size)]
+            with CaptureQueriesContext(connection) as queries:
+                self.assertEqual(review_submissions(ids, True), size)
+            counts.append(len(queries))
+        self.assertEqual(counts[0], counts[1])
+        self.assertEqual(PointsLedger.objects.count(), 46)
+
+
+class TaskPhotoTests(TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        media = override_settings(MEDIA_ROOT=tmp.name)
+        media.enable()
+        self.addCleanup(media.disable)
+
+    def upload(self, name, color):
+        buffer = BytesIO()
+        Image.new('RGB', (64, 48), color).save(buffer, 'PNG')
+        return default_storage.save(name, ContentFile(buffer.getvalue()))
+
+    def test_processed_photo_never_overwrites_another_upload(self):
+        theirs = default_storage.save('tasks/shot.jpg', ContentFile(b'their photo'))
+        ours = self.upload('tasks/shot.png', 'green')
+        task = Task.objects.create(title='Plant', description='')
+        submission = TaskSubmission.objects.create(
+            task=task, user=User.objects.create(username='learner'), photo=ours, photo_state='processing',
+        )
+        future = Future()
+        future.set_result(process_photo(default_storage.path(ours), 32, 80))
+        with mock.patch('mriic.images.schedule') as schedule:
+            _photo_processed(submission.pk, ours, threading.get_ident(), future)
+        submission.refresh_from_db()
+        self.assertEqual(submission.photo_state, 'ready')
+        self.assertNotEqual(submission.photo.name, theirs)
+        self.assertTrue(submission.photo.name.endswith('.jpg'))
+        schedule.assert_called_once_with(submission.photo.name)
+        with default_storage.open(theirs) as handle:
+            self.assertEqual(handle.read(), b'their photo')
+        with Image.open(submission.photo.path) as image:
+            self.assertEqual((image.format, image.size), ('JPEG', (32, 24)))
+        self.assertFalse(default_storage.exists(ours))
+        self.assertEqual(len(os.listdir(os.path.dirname(submission.photo.path))), 2)
+
+
+class ParseRangeTests(TestCase):
+    def test_satisfiable_ranges(self):
+        self.assertEqual(parse_range('bytes=0-99', 1000), (0, 99))
+        self.assertEqual(parse_range('bytes=900-', 1000), (900, 999))
+        self.assertEqual(parse_range('bytes=900-5000', 1000), (900, 999))
+        self.assertEqual(parse_range('bytes=-100', 1000), (900, 999))
+        self.assertEqual(parse_range('bytes=-5000', 1000), (0, 999))
+        self.assertEqual(parse_range(' bytes=5-5 ', 1000), (5, 5))
+
+    def test_invalid_ranges_are_ignored(self):
+        for header in ('bytes=10-5', 'bytes=-', 'bytes=0-1,5-9', 'items=0-1', 'bytes=a-b', ''):
+            with self.subTest(header=header):
+                self.assertIsNone(parse_range(header, 1000))
+
+    def test_unsatisfiable_ranges(self):
+        self.assertIs(parse_range('bytes=1000-', 1000), False)
+        self.assertIs(parse_range('bytes=1000-2000', 1000), False)
+        self.assertIs(parse_range('bytes=-0', 1000), False)
+
+    def test_any_range_of_an_empty_file_is_unsatisfiable(self):
+        for header in ('bytes=0-', 'bytes=0-0', 'bytes=-1', 'bytes=-0'):
+            with self.subTest(header=header):
+                self.assertIs(parse_range(header, 0), False)
+        self.assertIsNone(parse_range('bytes=5-1', 0))
+
+    def test_served_ranges(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            empty, data = os.path.join(tmp, 'empty.txt'), os.path.join(tmp, 'data.txt')
+            open(empty, 'wb').close()
+            with open(data, 'wb') as handle:
+                handle.write(b'0123456789')
+            factory = RequestFactory()
+            response = serve_file(factory.get('/', HTTP_RANGE='bytes=-5'), empty)
+            self.assertEqual((response.status_code, response['Content-Range']), (416, 'bytes */0'))
+            response = serve_file(factory.get('/', HTTP_RANGE='bytes=7-3'), data)
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(b''.join(response.streaming_content), b'0123456789')
+            response = serve_file(factory.get('/', HTTP_RANGE='bytes=-3'), data)
+            self.assertEqual((response.status_code, response['Content-Range']), (206, 'bytes 7-9/10'))
+            self.assertEqual(b''.join(response.streaming_content), b'789')
+
+
+class ScheduledPublishTests(TestCase):
+    def lesson_form(self, **data):
+        return LessonForm(data={'title': 'Wetlands', 'short_description': 'Marshes', 'eco_points': 50,
+                                'is_published': 'on', **data})
+
+    def test_future_publish_at_saves_the_lesson_unpublished(self):
+        publish_at = timezone.now() + timedelta(days=1)
+        form = self.lesson_form(publish_at=publish_at.strftime('%Y-%m-%dT%H:%M'))
+        self.assertTrue(form.is_valid(), form.errors)
+        lesson = form.save()
+        self.assertFalse(lesson.is_published)
+        self.assertEqual(run_due(now=timezone.now()), (0, 0))
+        self.assertEqual(run_due(now=publish_at + timedelta(minutes=1)), (1, 0))
+        lesson.refresh_from_db()
+        self.assertTrue(lesson.is_published)
+
+    def test_past_publish_at_keeps_the_checkbox(self):
+        form = self.lesson_form(publish_at=(timezone.now() - timedelta(days=1)).strftime('%Y-%m-%dT%H:%M'))
+        self.assertTrue(form.is_valid(), form.errors)
+        self.assertTrue(form.save().is_published)
+
+    def test_publishing_invalidates_pages_through_the_shared_cache(self):
+        before = cache_version()
+        invalidate_pages()
+        self.assertNotEqual(cache_version(), before)
+
+
+class QuizSessionTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create(username='learner')
+        cls.quiz = make_quiz(questions=2, time_limit_seconds=60)
+        cls.answers = correct_answers(cls.quiz)
+        cls.first, cls.second = sorted(cls.answers.items())
+
+    def setUp(self):
+        self.now = timezone.now()
+
+    def test_open_attempt_is_reused(self):
+        attempt, _ = start_attempt(self.user, self.quiz, now=self.now)
+        self.assertEqual(attempt.deadline, self.now + timedelta(seconds=60))
+        autosave_answers(self.user.pk, self.quiz.pk, dict([self.first]))
+        again, answers = start_attempt(self.user, self.quiz, now=self.now + timedelta(seconds=5))
+        self.assertEqual(again.pk, attempt.pk)
+        self.assertEqual(len(answers), 1)
+        self.assertEqual(_create_attempt(self.user, self.quiz, self.now).pk, attempt.pk)
+        self.assertEqual(QuizAttempt.objects.filter(user=self.user).count(), 1)
+
+    def test_quiz_page_reuses_open_attempt(self):
+        self.client.force_login(self.user)
+        for _ in range(3):
+            self.assertEqual(self.client.get(reverse('learning:quiz_take', args=[self.quiz.pk])).status_code, 200)
+        self.assertEqual(QuizAttempt.objects.filter(user=self.user).count(), 1)
+
+    def test_expired_attempt_is_closed_before_a_new_one_opens(self):
+        attempt, _ = start_attempt(self.user, self.quiz, now=self.now - timedelta(minutes=5))
+        again, answers = start_attempt(self.user, self.quiz, now=self.now)
+        self.assertNotEqual(again.pk, attempt.pk)
+        self.assertEqual(answers, {})
+        attempt.refresh_from_db()
+        self.assertEqual(attempt.completed_at, attempt.deadline)
+
+    def test_submit_in_time_grades_the_posted_answers(self):
+        start_attempt(self.user, self.quiz, now=self.now)
+        attempt, late = submit_attempt(self.user, self.quiz, self.answers, now=self.now + timedelta(seconds=30))
+        self.assertFalse(late)
+        self.assertEqual((attempt.score_percent, attempt.earned_points), (100, 100))
+        self.assertEqual(submit_attempt(self.user, self.quiz, self.answers), (None, False))
+
+    def test_late_submit_grades_only_autosaved_answers(self):
+        start_attempt(self.user, self.quiz, now=self.now)
+        autosave_answers(self.user.pk, self.quiz.pk, dict([self.first]), now=self.now)
+        attempt, late = submit_attempt(self.user, self.quiz, self.answers, now=self.now + timedelta(minutes=5))
+        self.assertTrue(late)
+        self.assertEqual((attempt.score_percent, attempt.completed_at), (50, attempt.deadline))
+
+    def test_autosave_after_deadline_is_refused(self):
+        start_attempt(self.user, self.quiz, now=self.now)
+        self.assertIsNone(autosave_answers(self.user.pk, self.quiz.pk, QueryDict(), now=self.now + timedelta(minutes=5)))
+        self.assertIsNone(autosave_answers(self.user.pk, self.quiz.pk + 1, QueryDict(), now=self.now))
+
+    def test_sweeper_grades_autosaved_answers(self):
+        attempt, _ = start_attempt(self.user, self.quiz, now=self.now)
+        autosave_answers(self.user.pk, self.quiz.pk, self.answers, now=self.now)
+        self.assertEqual(close_expired_attempts(now=self.now + timedelta(seconds=30)), 0)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertEqual(close_expired_attempts(now=self.now + timedelta(minutes=5)), 1)
+        attempt.refresh_from_db()
+        self.assertEqual((attempt.score_percent, attempt.earned_points), (100, 100))
+        self.assertEqual(attempt.completed_at, attempt.deadline)
+        self.assertEqual(saved_answers(attempt), {})
+        self.assertEqual(UserProgress.objects.get(user=self.user).total_points, 100)
+
+    @override_settings(CACHES={
+        'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'},
+        'shared': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'shared'},
+    })
+    def test_sweeper_refuses_a_process_local_cache(self):
+        with self.assertRaisesMessage(CommandError, "'shared' cache is local to this process"):
+            call_command('close_expired_attempts')
+
+    def test_builder_rejects_a_bad_time_limit(self):
+        staff = User.objects.create(username='staff', is_staff=True)
+        self.client.force_login(staff)
+        url = reverse('learning:lesson_quiz_build', args=[self.quiz.lesson.slug])
+        for value in ('abc', '-5', '0'):
+            with self.subTest(value=value):
+                response = self.client.post(url, {'quiz_title': 'Renamed', 'time_limit_seconds': value})
+                self.assertRedirects(response, url, fetch_redirect_response=False)
+        self.client.post(url, {'quiz_title': 'Renamed', 'time_limit_seconds': '90'})
+        self.quiz.refresh_from_db()
+        self.assertEqual((self.quiz.title, self.quiz.time_limit_seconds), ('Renamed', 90))
@@ -0,0 +1,102 @@
+import os
+import threading
+from functools import partial
+
+from django.conf import settings
+from django.core.files import File
+from django.core.files.storage import default_storage
+from django.core.files.uploadhandler import FileUploadHandler, StopUpload
+from django.db import connections
+from mriic import images
+from PIL import Image, ImageOps
+
+from .models import TaskSubmission
+
+
+class SizeCappedUploadHandler(FileUploadHandler):
+    """Abort an upload as soon as it grows past ``max_bytes``.
+
+    Sits in front of TemporaryFileUploadHandler, which streams the accepted
+    chunks to a temporary file on disk. ``request.upload_too_large`` tells
+    the view why the file is missing.
+    """
+
+    def __init__(self, request=None, max_bytes=None):
+        super().__init__(request)
+        self.max_bytes = max_bytes or settings.TASK_PHOTO_MAX_BYTES
+        self.received = 0
+        self.oversized = False
+        request.upload_too_large = False
+
+    def handle_raw_input(self, input_data, META, content_length, boundary, encoding=None):
+        # A body far over the cap is refused on its first file chunk, before
+        # anything is written to disk
+        self.oversized = bool(content_length) and content_length > self.max_bytes + 64 * 1024
+
+    def receive_data_chunk(self, raw_data, start):
+        self.received += len(raw_data)
+        if self.oversized or self.received > self.max_bytes:
+            self.reject()
+        return raw_data
+
+    def file_complete(self, file_size):
+        return None
+
+    def reject(self):
+        self.request.upload_too_large = True
+        raise StopUpload(connection_reset=False)
+
+
+def process_photo(path, max_edge, quality):
+    """Verify, strip metadata from and downscale an uploaded photo; runs in a pool worker.
+
+    The image is re-encoded as JPEG without its EXIF block (GPS coordinates
+    included) after applying the orientation tag. The result is written next
+    to the upload under a private ``.part`` name, which is returned; storing
+    it is left to the web process and the storage API.
+    """
+    with Image.open(path) as image:
+        image.verify()
+    with Image.open(path) as image:
+        image = ImageOps.exif_transpose(image).convert('RGB')
+        image.thumbnail((max_edge, max_edge), Image.LANCZOS)
+        tmp = path + '.part'
+        image.save(tmp, 'JPEG', quality=quality, optimize=True, progressive=True)
+    return tmp
+
+
+def _photo_processed(submission_id, name, submitter, future):
+    try:
+        try:
+            tmp = future.result()
+        except Exception:
+            TaskSubmission.objects.filter(pk=submission_id).update(photo='', photo_state='rejected')
+            default_storage.delete(name)
+            return
+        # Another learner's upload may already own "<stem>.jpg"; the storage
+        # picks a free name instead of the JPEG overwriting it
+        try:
+            with open(tmp, 'rb') as handle:
+                stored = default_storage.save(os.path.splitext(name)[0] + '.jpg', File(handle))
+        finally:
+            os.remove(tmp)
+        default_storage.delete(name)
+        TaskSubmission.objects.filter(pk=submission_id).update(photo=stored, photo_state='ready')
+        images.schedule(stored)
+    finally:
+        # Usually runs on the executor's callback thread, which gets its own
+        # DB connection; leave the request thread's connection alone
+        if threading.get_ident() != submitter:
+            connections.close_all()
+
+
+def schedule_photo_processing(submission):
+    """Hand the stored photo to the worker pool; the request does not wait for it."""
+    future = images.get_executor().submit(
+        process_photo,
+        submission.photo.path,
+        settings.TASK_PHOTO_MAX_EDGE,
+        settings.TASK_PHOTO_QUALITY,
+    )
+    future.add_done_callback(partial(_photo_processed, submission.pk, submission.photo.name, threading.get_ident()))
+    return future
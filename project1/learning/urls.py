@@ -7,8 +7,14 @@ urlpatterns = [
     path('lessons/', views.lesson_list, name='lesson_list'),
     path('lessons/create/', views.lesson_create, name='lesson_create'),
     path('lessons/<slug:slug>/build-quiz/', views.lesson_quiz_build, name='lesson_quiz_build'),
+    path('lessons/<slug:slug>/resource/', views.lesson_resource, name='lesson_resource'),
     path('lessons/<slug:slug>/', views.lesson_detail, name='lesson_detail'),
+    path('scorm/<str:digest>/<path:path>', views.scorm_asset, name='scorm_asset'),
     path('quiz/<int:quiz_id>/', views.quiz_take, name='quiz_take'),
+    path('quiz/<int:quiz_id>/autosave/', views.quiz_autosave, name='quiz_autosave'),
     path('tasks/', views.task_list, name='task_list'),
+    path('tasks/review/', views.review_queue, name='review_queue'),
+    path('tasks/<int:task_id>/submit/', views.task_submit, name='task_submit'),
     path('progress/', views.progress_dashboard, name='progress'),
+    path('leaderboard/', views.leaderboard, name='leaderboard'),
 ]
\ No newline at end of file
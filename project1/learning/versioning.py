@@ -0,0 +1,42 @@
+import time
+
+from mriic.caching import shared_cache
+
+
+def _key(name):
+    return f'learning:version:{name}'
+
+
+def _fresh_version():
+    # Seed from the clock so an evicted version key never reuses a stale number
+    return int(time.time() * 1000)
+
+
+def get_version(name):
+    """Current version number for ``name``, shared by every process."""
+    cache = shared_cache()
+    version = cache.get(_key(name))
+    if version is None:
+        cache.add(_key(name), _fresh_version(), timeout=None)
+        version = cache.get(_key(name))
+    return version
+
+
+async def aget_version(name):
+    """get_version for async code; the shared cache may be a database table."""
+    cache = shared_cache()
+    version = await cache.aget(_key(name))
+    if version is None:
+        await cache.aadd(_key(name), _fresh_version(), timeout=None)
+        version = await cache.aget(_key(name))
+    return version
+
+
+def bump_version(name):
+    cache = shared_cache()
+    try:
+        return cache.incr(_key(name))
+    except ValueError:
+        version = _fresh_version()
+        cache.set(_key(name), version, timeout=None)
+        return version
@@ -1,66 +1,212 @@
-from django.shortcuts import render, get_object_or_404, redirect
+import os
+from django.shortcuts import render, get_object_or_404, aget_object_or_404, redirect
 from django.contrib.auth.decorators import login_required, user_passes_test
-from .models import Lesson, Quiz, Task, UserProgress, LevelDefinition, QuizAttempt
-from .models import Question, Choice
+from .models import Lesson, Quiz, Task, UserProgress, QuizAttempt
+from .models import Question, Choice, PointsLedger, LeaderboardEntry
+from django.db import transaction
 from django.utils import timezone
 from django.contrib import messages
-from .forms import LessonForm
+from django.core.files.uploadhandler import TemporaryFileUploadHandler
+from django.views.decorators.csrf import csrf_exempt, csrf_protect
+from django.views.decorators.clickjacking import xframe_options_sameorigin
+from django.views.decorators.http import require_POST, require_safe
+from django.http import Http404, JsonResponse
+from django.conf import settings
+from django.utils.cache import patch_cache_control
+from .forms import LessonForm, TaskSubmissionForm
+from .catalog import acatalog_page, lesson_detail_queryset
+from .quiz_builder import parse_builder_post, save_quiz_questions
+from .leaderboards import leaderboard_page, rank_of, period_key
+from .quiz_sessions import astart_attempt, asubmit_attempt, autosave_answers
+from .levels import aget_level_index
+from .review import pending_queue, review_submissions
+from .summaries import asummary_for, record_task_submitted
+from .uploads import SizeCappedUploadHandler, schedule_photo_processing
+from .scorm import asset_path
+from project1.routers import reads_from_replica
+from mriic.viewer import load_viewer
+from .streaming import cache_forever, send_file, serve_file
 
+@load_viewer
 @login_required
-def lesson_list(request):
-    lessons = Lesson.objects.filter(is_published=True).order_by('id')
+@reads_from_replica
+async def lesson_list(request):
+    after = request.GET.get('after')
+    lessons, next_after = await acatalog_page(request.user, after=int(after) if after and after.isdigit() else None)
     progress = getattr(request.user, 'progress', None)
-    return render(request, 'learning/lesson_list.html', {'lessons': lessons, 'progress': progress})
+    return render(request, 'learning/lesson_list.html', {'lessons': lessons, 'next_after': next_after, 'progress': progress})
 
+@load_viewer
 @login_required
-def lesson_detail(request, slug):
-    lesson = get_object_or_404(Lesson, slug=slug, is_published=True)
-    quiz = lesson.quizzes.first()
-    attempt = None
-    if quiz and request.user.is_authenticated:
-        attempt = QuizAttempt.objects.filter(user=request.user, quiz=quiz, completed_at__isnull=False).order_by('-completed_at').first()
-    return render(request, 'learning/lesson_detail.html', {
-        'lesson': lesson,
-        'quiz_attempt': attempt,
+@reads_from_replica
+async def lesson_detail(request, slug):
+    lesson = await aget_object_or_404(lesson_detail_queryset(request.user), slug=slug)
+    return render(request, 'learning/lesson_detail.html', {'lesson': lesson})
+
+@login_required
+@require_safe
+@reads_from_replica
+def lesson_resource(request, slug):
+    lesson = get_object_or_404(Lesson.objects.only('slug', 'resource_file', 'is_published'), slug=slug, is_published=True)
+    if not lesson.resource_file:
+        raise Http404('This lesson has no resource file')
+    try:
+        path = lesson.resource_file.path
+    except NotImplementedError:
+        # Remote storage serves its own URL, ranges included
+        return redirect(lesson.resource_file.url)
+    if not os.path.isfile(path):
+        raise Http404('Resource file is missing')
+    response = send_file(
+        request, path, name=lesson.resource_file.name,
+        filename=os.path.basename(lesson.resource_file.name),
+        as_attachment='download' in request.GET,
+    )
+    patch_cache_control(response, private=True, max_age=getattr(settings, 'RESOURCE_MAX_AGE', 3600))
+    return response
+
+@login_required
+@require_safe
+@xframe_options_sameorigin
+def scorm_asset(request, digest, path):
+    # Package URLs are content-addressed, so a file never changes under its URL
+    full_path = asset_path(digest, path)
+    if full_path is None:
+        raise Http404('No such package file')
+    return cache_forever(serve_file(request, full_path), private=True)
+
+@load_viewer
+@login_required
+@reads_from_replica
+async def progress_dashboard(request):
+    # load_viewer already fetched the row for the navbar
+    progress = getattr(request.user, 'progress', None)
+    if progress is None:
+        progress, created = await UserProgress.objects.aget_or_create(user=request.user)
+        request.user.progress = progress
+    level_index = await aget_level_index()
+    progress.current_level = level_index.get(progress.current_level_id)
+    levels = level_index.levels
+    return render(request, 'learning/progress.html', {
+        'progress': progress,
+        'levels': levels,
+        'summary': await asummary_for(request.user),
     })
 
 @login_required
-def progress_dashboard(request):
-    progress, created = UserProgress.objects.get_or_create(user=request.user)
-    levels = LevelDefinition.objects.all()
-    return render(request, 'learning/progress.html', {'progress': progress, 'levels': levels})
+@reads_from_replica
+def leaderboard(request):
+    board = request.GET.get('board') or LeaderboardEntry.BOARD_GLOBAL
+    if board not in dict(LeaderboardEntry.BOARD_CHOICES):
+        board = LeaderboardEntry.BOARD_GLOBAL
+    period = period_key(board)
+    entries, next_cursor = leaderboard_page(board, period, after=request.GET.get('after'))
+    return render(request, 'learning/leaderboard.html', {
+        'board': board,
+        'boards': LeaderboardEntry.BOARD_CHOICES,
+        'period': period,
+        'entries': entries,
+        'next_cursor': next_cursor,
+        'my_rank': rank_of(request.user, board, period),
+    })
 
+@load_viewer
 @login_required
-def task_list(request):
-    tasks = Task.objects.filter(is_active=True)
+async def task_list(request):
+    tasks = [task async for task in Task.objects.filter(is_active=True)]
     return render(request, 'learning/task_list.html', {'tasks': tasks})
 
-# Placeholder quiz taking (basic MCQ flow without timing yet)
+
+@login_required
+@csrf_exempt
+def task_submit(request, task_id):
+    # Upload handlers must be swapped before anything reads request.POST,
+    # including the CSRF check, so it is applied afterwards by the inner view
+    request.upload_handlers = [SizeCappedUploadHandler(request), TemporaryFileUploadHandler(request)]
+    return _task_submit(request, task_id)
+
+
+@csrf_protect
+def _task_submit(request, task_id):
+    task = get_object_or_404(Task, pk=task_id, is_active=True)
+    if request.method == 'POST':
+        form = TaskSubmissionForm(
+            request.POST, request.FILES, task=task,
+            upload_too_large=getattr(request, 'upload_too_large', False),
+        )
+        if form.is_valid():
+            submission = form.save(commit=False)
+            submission.task = task
+            submission.user = request.user
+            submission.photo_state = 'processing' if submission.photo else 'none'
+            with transaction.atomic():
+                submission.save()
+                record_task_submitted(submission)
+                if submission.photo:
+                    transaction.on_commit(lambda: schedule_photo_processing(submission))
+            messages.success(request, 'Submission received! It will be reviewed shortly.')
+            return redirect('learning:task_list')
+        messages.error(request, 'Please correct the errors below.')
+    else:
+        form = TaskSubmissionForm(task=task)
+    return render(request, 'learning/task_submit.html', {'task': task, 'form': form})
+
+# Quiz sessions are timed on the server; see learning.quiz_sessions
+@load_viewer
 @login_required
-def quiz_take(request, quiz_id):
-    quiz = get_object_or_404(Quiz, pk=quiz_id, is_active=True)
-    questions = quiz.questions.prefetch_related('choices')
+async def quiz_take(request, quiz_id):
+    quiz = await aget_object_or_404(Quiz.objects.select_related('lesson'), pk=quiz_id, is_active=True)
     if request.method == 'POST':
-        total = questions.count()
-        correct = 0
-        for q in questions:
-            selected = request.POST.get(f'question_{q.id}')
-            if selected and q.choices.filter(id=selected, is_correct=True).exists():
-                correct += 1
-        score_percent = (correct / total) * 100 if total else 0
-        earned = int(quiz.eco_points * (score_percent / 100))
-        attempt = QuizAttempt.objects.create(user=request.user, quiz=quiz, score_percent=score_percent, earned_points=earned, completed_at=timezone.now())
-        progress, _ = UserProgress.objects.get_or_create(user=request.user)
-        progress.add_points(earned)
-        messages.success(request, f'Quiz completed: {score_percent:.0f}% — {earned} eco-points earned!')
+        attempt, late = await asubmit_attempt(request.user, quiz, request.POST)
+        if attempt is None:
+            messages.error(request, 'This quiz was already submitted. Start it again to make a new attempt.')
+            return redirect('learning:quiz_take', quiz_id=quiz.pk)
+        if late:
+            messages.warning(request, 'Time ran out; only the answers saved before the deadline were graded.')
+        messages.success(request, f'Quiz completed: {attempt.score_percent:.0f}% — {attempt.earned_points} eco-points earned!')
         return redirect('learning:progress')
-    return render(request, 'learning/quiz_take.html', {'quiz': quiz, 'questions': questions})
+    attempt, answers = await astart_attempt(request.user, quiz)
+    return render(request, 'learning/quiz_take.html', {
+        'quiz': quiz,
+        'questions': [question async for question in quiz.questions.prefetch_related('choices')],
+        'selected': {str(value) for value in answers.values()},
+        'remaining': max(int((attempt.deadline - timezone.now()).total_seconds()), 0),
+    })
+
+
+@login_required
+@require_POST
+def quiz_autosave(request, quiz_id):
+    remaining = autosave_answers(request.user.pk, quiz_id, request.POST)
+    if remaining is None:
+        return JsonResponse({'error': 'No quiz in progress, or its time is up'}, status=409)
+    return JsonResponse({'remaining': int(remaining)})
 
 
 def staff_check(user):
     return user.is_authenticated and user.is_staff
 
 
+@login_required
+@user_passes_test(staff_check)
+def review_queue(request):
+    if request.method == 'POST':
+        action = request.POST.get('action')
+        ids = [pk for pk in request.POST.getlist('submission') if pk.isdigit()]
+        if action not in ('approve', 'reject') or not ids:
+            messages.error(request, 'Select at least one submission and an action.')
+        else:
+            count = review_submissions(ids, action == 'approve', request.POST.get('reviewer_notes', '').strip())
+            messages.success(request, f'{count} submission(s) {action}d.')
+        return redirect('learning:review_queue')
+    after = request.GET.get('after')
+    submissions, next_after = pending_queue(after=int(after) if after and after.isdigit() else None)
+    return render(request, 'learning/review_queue.html', {
+        'submissions': submissions,
+        'next_after': next_after,
+    })
+
+
 @login_required
 @user_passes_test(staff_check)
 def lesson_create(request):
@@ -84,35 +230,23 @@ def lesson_quiz_build(request, slug):
     quiz = lesson.quizzes.first()
     if request.method == 'POST':
         title = request.POST.get('quiz_title') or 'Lesson Quiz'
-        eco_points = int(request.POST.get('quiz_points') or 100)
-        time_limit = request.POST.get('time_limit_seconds') or None
+        eco_points = request.POST.get('quiz_points', '').strip() or '100'
+        time_limit = request.POST.get('time_limit_seconds', '').strip()
+        if not eco_points.isdigit():
+            messages.error(request, 'Eco-points must be a whole number of zero or more.')
+            return redirect('learning:lesson_quiz_build', slug=lesson.slug)
+        if time_limit and not (time_limit.isdigit() and int(time_limit) > 0):
+            messages.error(request, 'The time limit must be a whole number of seconds above zero, or left blank.')
+            return redirect('learning:lesson_quiz_build', slug=lesson.slug)
+        eco_points, time_limit = int(eco_points), int(time_limit) if time_limit else None
         if quiz is None:
-            quiz = Quiz.objects.create(lesson=lesson, title=title, eco_points=eco_points, time_limit_seconds=time_limit or None)
+            quiz = Quiz.objects.create(lesson=lesson, title=title, eco_points=eco_points, time_limit_seconds=time_limit)
         else:
             quiz.title = title
             quiz.eco_points = eco_points
-            quiz.time_limit_seconds = time_limit or None
+            quiz.time_limit_seconds = time_limit
             quiz.save()
-        # Clear existing questions for simplicity (could diff update later)
-        quiz.questions.all().delete()
-        total_questions = int(request.POST.get('total_questions') or 0)
-        for idx in range(1, total_questions + 1):
-            q_text = request.POST.get(f'q{idx}_text')
-            q_type = request.POST.get(f'q{idx}_type') or 'MCQ'
-            if not q_text:
-                continue
-            question = Question.objects.create(quiz=quiz, text=q_text, question_type=q_type, order=idx)
-            if q_type == 'TF':
-                correct_val = request.POST.get(f'q{idx}_tf_correct') == 'true'
-                Choice.objects.create(question=question, text='True', is_correct=correct_val)
-                Choice.objects.create(question=question, text='False', is_correct=not correct_val)
-            else:
-                choice_count = int(request.POST.get(f'q{idx}_choice_count') or 0)
-                for c in range(1, choice_count + 1):
-                    c_text = request.POST.get(f'q{idx}_choice{c}_text')
-                    is_correct = request.POST.get(f'q{idx}_choice{c}_correct') == 'on'
-                    if c_text:
-                        Choice.objects.create(question=question, text=c_text, is_correct=is_correct)
+        save_quiz_questions(quiz, parse_builder_post(request.POST))
         messages.success(request, 'Quiz saved successfully!')
         return redirect('learning:lesson_detail', slug=lesson.slug)
     existing_questions = []
@@ -122,7 +256,7 @@ def lesson_quiz_build(request, slug):
                 'id': q.id,
                 'text': q.text,
                 'type': q.question_type,
-                'choices': [{'text': c.text, 'is_correct': c.is_correct} for c in q.choices.all()]
+                'choices': [{'id': c.id, 'text': c.text, 'is_correct': c.is_correct} for c in q.choices.all()]
             })
     return render(request, 'learning/quiz_builder.html', {
         'lesson': lesson,
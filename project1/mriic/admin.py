@@ -1,3 +1,9 @@
 from django.contrib import admin
+from .models import GameScore
 
-# Register your models here.
+
+@admin.register(GameScore)
+class GameScoreAdmin(admin.ModelAdmin):
+    list_display = ('game_number', 'user', 'score', 'points', 'played_at', 'credited_at')
+    list_filter = ('game_number',)
+    search_fields = ('user__username', 'idempotency_key')
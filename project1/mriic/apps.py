@@ -1,6 +1,12 @@
 from django.apps import AppConfig
+from django.db.backends.signals import connection_created
 
 
 class MriicConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'mriic'
+
+    def ready(self):
+        from .instrumentation import install_query_timer
+
+        connection_created.connect(install_query_timer, dispatch_uid='mriic.install_query_timer')
@@ -0,0 +1,53 @@
+import mimetypes
+import os
+import re
+
+from django.conf import settings
+from django.core.exceptions import SuspiciousFileOperation
+from django.http import Http404
+from django.utils._os import safe_join
+from django.utils.cache import patch_cache_control, patch_vary_headers
+from django.views.static import serve
+
+from .compression import negotiate
+
+# ManifestStaticFilesStorage names files like game4.3f2a9c1b7d4e.js
+HASHED_NAME_RE = re.compile(r'\.[0-9a-f]{12}\.[^./]+$')
+IMMUTABLE_MAX_AGE = 60 * 60 * 24 * 365
+PRECOMPRESSED_SUFFIXES = {'br': '.br', 'gzip': '.gz'}
+
+
+def _precompressed_encodings(path):
+    """Encodings for which compress_static left a copy of ``path`` in STATIC_ROOT."""
+    try:
+        full_path = safe_join(settings.STATIC_ROOT, path)
+    except SuspiciousFileOperation:
+        raise Http404('Invalid path')
+    return tuple(
+        encoding for encoding, suffix in PRECOMPRESSED_SUFFIXES.items()
+        if os.path.isfile(full_path + suffix)
+    )
+
+
+def serve_static(request, path):
+    """Serve collected static files with far-future caching for fingerprinted names.
+
+    Precompressed .br/.gz copies are sent when the client accepts them. Only
+    wired up when SERVE_STATIC is on, for deployments without a front proxy
+    in front of STATIC_ROOT; a proxy should apply the same headers.
+    """
+    encoding = negotiate(request, offered=_precompressed_encodings(path))
+    if encoding is not None:
+        response = serve(request, path + PRECOMPRESSED_SUFFIXES[encoding], document_root=settings.STATIC_ROOT)
+        content_type, _ = mimetypes.guess_type(path)
+        response['Content-Type'] = content_type or 'application/octet-stream'
+        if response.status_code == 200:
+            response['Content-Encoding'] = encoding
+    else:
+        response = serve(request, path, document_root=settings.STATIC_ROOT)
+    patch_vary_headers(response, ('Accept-Encoding',))
+    if HASHED_NAME_RE.search(path):
+        patch_cache_control(response, public=True, max_age=IMMUTABLE_MAX_AGE, immutable=True)
+    else:
+        patch_cache_control(response, public=True, max_age=settings.STATIC_MAX_AGE)
+    return response
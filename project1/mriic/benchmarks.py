@@ -0,0 +1,489 @@
+# Seeded benchmark suite: fixture generation for `manage.py seed_benchmark`,
+# the timed scenarios run by `manage.py benchmark` and the uvicorn load test
+# run by `manage.py benchmark_asgi`. Everything it creates
+# is prefixed with "bench-" so it can be wiped without touching real data.
+import asyncio
+import importlib.util
+import json
+import os
+import random
+import shutil
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter
+from contextlib import ExitStack, contextmanager
+from datetime import timedelta
+from importlib import import_module
+from itertools import islice
+from pathlib import Path
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.db import connections, transaction
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import URLPattern, URLResolver, get_resolver, reverse
+from django.utils import timezone
+from django.utils.crypto import get_random_string
+
+PREFIX = 'bench-'
+BENCH_USERNAME = 'bench-admin'
+QUESTIONS_PER_QUIZ = 5
+CHOICES_PER_QUESTION = 4
+
+# URL names that cannot be timed with a plain GET from a logged-in client
+SKIPPED_URLS = {
+    'logout': 'ends the benchmark session',
+    'game_scores': 'POST-only; timed as "POST game_scores"',
+    'quiz_autosave': 'POST-only; timed as "POST learning:quiz_autosave"',
+}
+
+
+def _batched(iterable, size):
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def wipe():
+    """Delete every benchmark fixture (users cascade to their attempts and progress)."""
+    from learning.models import Lesson, Task
+    get_user_model().objects.filter(username__startswith=PREFIX).delete()
+    Lesson.objects.filter(slug__startswith=PREFIX).delete()
+    Task.objects.filter(title__startswith=PREFIX).delete()
+
+
+def seed(users, lessons, attempts, submissions, tasks, batch_size=5000, rng_seed=21, log=print):
+    """Bulk-insert a realistic dataset; returns the counts actually created.
+
+    The bench-admin account is staff, not a superuser, and has no usable
+    password; the benchmark client signs in with force_login.
+    """
+    from learning.models import Choice, Lesson, PointsLedger, Question, Quiz, QuizAttempt, Task, TaskSubmission
+    from learning.points import award_points_bulk
+
+    rng = random.Random(rng_seed)
+    now = timezone.now()
+    User = get_user_model()
+    password = make_password(None)
+
+    User.objects.create_user(BENCH_USERNAME, 'bench@example.com', password=None, is_staff=True)
+    for batch in _batched((User(username=f'{PREFIX}user-{n}', password=password) for n in range(users)), batch_size):
+        User.objects.bulk_create(batch)
+    user_ids = list(User.objects.filter(username__startswith=PREFIX).values_list('pk', flat=True))
+    log(f'  {len(user_ids)} users')
+
+    with transaction.atomic():
+        lesson_rows = Lesson.objects.bulk_create([
+            Lesson(
+                title=f'Benchmark lesson {n}', slug=f'{PREFIX}lesson-{n}',
+                short_description='Seeded for benchmarks. ' * 4,
+                html_content='<p>Seeded lesson content.</p>' * 200,
+                is_published=n % 10 != 0,
+            )
+            for n in range(lessons)
+        ], batch_size=batch_size)
+        quizzes = Quiz.objects.bulk_create([Quiz(lesson=lesson, title=f'{lesson.title} quiz') for lesson in lesson_rows])
+        questions = Question.objects.bulk_create([
+            Question(quiz=quiz, text=f'Question {n}', order=n) for quiz in quizzes for n in range(QUESTIONS_PER_QUIZ)
+        ], batch_size=batch_size)
+        Choice.objects.bulk_create([
+            Choice(question=question, text=f'Choice {n}', is_correct=n == 0)
+            for question in questions for n in range(CHOICES_PER_QUESTION)
+        ], batch_size=batch_size)
+        task_rows = Task.objects.bulk_create([
+            Task(title=f'{PREFIX}task-{n}', description='Seeded task', is_active=n % 4 == 0) for n in range(tasks)
+        ])
+    log(f'  {len(lesson_rows)} lessons, {len(questions)} questions, {len(task_rows)} tasks')
+
+    quiz_ids = [quiz.pk for quiz in quizzes]
+    for batch in _batched((
+        QuizAttempt(
+            user_id=rng.choice(user_ids),
+            quiz_id=rng.choice(quiz_ids),
+            completed_at=None if i % 9 == 0 else now - timedelta(minutes=i),
+            score_percent=rng.choice((0, 20, 40, 60, 80, 100)),
+            earned_points=rng.randint(0, 100),
+        )
+        for i in range(attempts)
+    ), batch_size):
+        with transaction.atomic():
+            # started_at is auto_now_add; skip the rare same-microsecond clash
+            QuizAttempt.objects.bulk_create(batch, ignore_conflicts=True)
+    log(f'  {attempts} quiz attempts')
+
+    task_ids = [task.pk for task in task_rows]
+    statuses = ['pending'] + ['approved'] * 6 + ['rejected']
+    for batch in _batched((
+        TaskSubmission(
+            task_id=rng.choice(task_ids), user_id=rng.choice(user_ids),
+            status=rng.choice(statuses), notes='Seeded submission',
+        )
+        for _ in range(submissions)
+    ), batch_size):
+        with transaction.atomic():
+            TaskSubmission.objects.bulk_create(batch)
+    log(f'  {submissions} task submissions')
+
+    # Through the ledger, so progress, levels and every leaderboard agree
+    awards = ((user_id, rng.randint(0, 5000), PointsLedger.SOURCE_ADJUSTMENT, None) for user_id in user_ids)
+    for batch in _batched(awards, batch_size):
+        award_points_bulk(batch)
+    log(f'  points for {len(user_ids)} users')
+    return {'users': len(user_ids), 'lessons': lessons, 'attempts': attempts, 'submissions': submissions, 'tasks': tasks}
+
+
+# Scenarios ------------------------------------------------------------------
+
+def url_names(patterns=None, namespace=''):
+    """Every named route in the project URLconf, as ``(name, pattern)`` pairs."""
+    for entry in patterns if patterns is not None else get_resolver().url_patterns:
+        if isinstance(entry, URLResolver):
+            if entry.app_name == 'admin':
+                continue
+            ns = f'{namespace}{entry.namespace}:' if entry.namespace else namespace
+            yield from url_names(entry.url_patterns, ns)
+        elif isinstance(entry, URLPattern) and entry.name:
+            yield f'{namespace}{entry.name}', entry.pattern
+
+
+def sample_kwargs():
+    """Concrete values for the URL parameters used across the project."""
+    from learning.models import Lesson, Quiz, ScormPackage, Task
+
+    lesson = Lesson.objects.filter(slug__startswith=PREFIX, is_published=True).only('slug').order_by('pk').first()
+    package = ScormPackage.objects.only('sha256', 'launch_path').first()
+    return {
+        'slug': lesson.slug if lesson else None,
+        'quiz_id': Quiz.objects.filter(lesson__slug__startswith=PREFIX).values_list('pk', flat=True).first(),
+        'task_id': Task.objects.filter(title__startswith=PREFIX, is_active=True).values_list('pk', flat=True).first(),
+        'number': 1,
+        'digest': package.sha256 if package else None,
+        'path': package.launch_path if package else None,
+    }
+
+
+def http_scenarios():
+    """``(name, callable)`` per GET-able route plus the hot POST endpoints,
+    and ``{name: reason}`` for routes that cannot be benchmarked here."""
+    from learning.models import Question, Quiz
+    from learning.quiz_sessions import start_attempt
+
+    values = sample_kwargs()
+    scenarios, skipped = [], {}
+    for name, pattern in url_names():
+        short = name.split(':')[-1]
+        if short in SKIPPED_URLS:
+            skipped[name] = SKIPPED_URLS[short]
+            continue
+        params = list(getattr(pattern, 'converters', {})) or list(pattern.regex.groupindex)
+        if any(values.get(param) is None for param in params):
+            skipped[name] = 'no sample data for ' + ', '.join(p for p in params if values.get(p) is None)
+            continue
+        url = reverse(name, kwargs={param: values[param] for param in params})
+        scenarios.append((f'GET {name}', lambda client, url=url: client.get(url)))
+
+    if values['quiz_id']:
+        answers = {
+            f'question_{question_id}': choice_id
+            for question_id, choice_id in Question.objects.filter(quiz_id=values['quiz_id'], choices__is_correct=True)
+            .values_list('pk', 'choices__pk')
+        }
+        url = reverse('learning:quiz_take', args=[values['quiz_id']])
+        user = get_user_model().objects.get(username=BENCH_USERNAME)
+        quiz = Quiz.objects.get(pk=values['quiz_id'])
+
+        def submit(client):
+            # A submit closes the session, so each run opens a fresh one first
+            start_attempt(user, quiz)
+            return client.post(url, answers)
+
+        # Autosave first, while the session opened by "GET learning:quiz_take" is still open
+        autosave_url = reverse('learning:quiz_autosave', args=[values['quiz_id']])
+        scenarios.append(('POST learning:quiz_autosave', lambda client: client.post(autosave_url, answers)))
+        scenarios.append(('POST learning:quiz_take', submit))
+    scenarios.append(('POST game_scores', lambda client: client.post(
+        reverse('game_scores'),
+        json.dumps({'events': [{'game': 1, 'points': 1, 'score': 120, 'key': f'bench-{time.perf_counter_ns()}'}]}),
+        content_type='application/json',
+    )))
+    return scenarios, skipped
+
+
+def model_scenarios():
+    from learning.grading import build_answer_key, grade_submission
+    from learning.models import PointsLedger, Quiz, UserProgress
+
+    user = get_user_model().objects.get(username=BENCH_USERNAME)
+    progress, _ = UserProgress.objects.get_or_create(user=user)
+    quiz = Quiz.objects.filter(lesson__slug__startswith=PREFIX).first()
+    answers = {}
+    if quiz:
+        answers = {f'question_{q}': c for q, c in quiz.questions.filter(choices__is_correct=True).values_list('pk', 'choices__pk')}
+    scenarios = [('UserProgress.add_points', lambda client: progress.add_points(5, PointsLedger.SOURCE_ADJUSTMENT))]
+    if quiz:
+        scenarios += [
+            ('grading.grade_submission (cached key)', lambda client: grade_submission(quiz, answers)),
+            ('grading.build_answer_key (cold)', lambda client: build_answer_key(quiz.pk)),
+        ]
+    return scenarios
+
+
+def percentile(samples, fraction):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, round(fraction * (len(ordered) - 1)))]
+
+
+def measure(scenario, client, iterations, warmup):
+    """Time one scenario; returns p50/p95/mean in ms, median query count and last status."""
+    timings, queries, status = [], [], None
+    for n in range(warmup + iterations):
+        with ExitStack() as stack:
+            captures = [stack.enter_context(CaptureQueriesContext(connections[alias])) for alias in settings.DATABASES]
+            started = time.perf_counter()
+            result = scenario(client)
+            elapsed = time.perf_counter() - started
+        status = getattr(result, 'status_code', status)
+        if n >= warmup:
+            timings.append(elapsed * 1000)
+            queries.append(sum(len(capture.captured_queries) for capture in captures))
+    return {
+        'p50_ms': round(percentile(timings, 0.50), 3),
+        'p95_ms': round(percentile(timings, 0.95), 3),
+        'mean_ms': round(statistics.fmean(timings), 3),
+        'queries': int(statistics.median(queries)),
+        'status': status,
+    }
+
+
+def benchmark_host():
+    return next((h.lstrip('.') for h in settings.ALLOWED_HOSTS if h != '*'), 'localhost')
+
+
+def benchmark_client():
+    # A broken page is reported with its 500 status instead of aborting the run
+    client = Client(HTTP_HOST=benchmark_host(), raise_request_exception=False)
+    user = get_user_model().objects.filter(username=BENCH_USERNAME).first()
+    if user is None:
+        raise RuntimeError('Benchmark user missing; run `manage.py seed_benchmark` first')
+    client.force_login(user)
+    return client
+
+
+def compare(results, baseline, tolerance, min_delta_ms):
+    """Regressions against a stored run: slower p95 beyond tolerance (and an
+    absolute noise floor), or any extra SQL query."""
+    regressions = []
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if previous is None:
+            continue
+        limit = previous['p95_ms'] * (1 + tolerance)
+        if current['p95_ms'] > limit and current['p95_ms'] - previous['p95_ms'] > min_delta_ms:
+            regressions.append(f"{name}: p95 {previous['p95_ms']:.1f} ms -> {current['p95_ms']:.1f} ms")
+        if current['queries'] > previous['queries']:
+            regressions.append(f"{name}: {previous['queries']} -> {current['queries']} queries")
+    return regressions
+
+
+# Concurrency under uvicorn --------------------------------------------------
+# `manage.py benchmark_asgi` drives a real server: every simulated client is a
+# different seeded learner with its own session and keep-alive connection.
+
+def load_targets():
+    """Request sequences for the async views, keyed by name; each sequence is
+    ``[(method, path, body), ...]`` and counts as one operation."""
+    from learning.models import Question
+
+    values = sample_kwargs()
+    if values['slug'] is None or values['quiz_id'] is None:
+        raise RuntimeError('Benchmark data missing; run `manage.py seed_benchmark` first')
+    quiz_url = reverse('learning:quiz_take', args=[values['quiz_id']])
+    answers = urlencode({
+        f'question_{question_id}': choice_id
+        for question_id, choice_id in Question.objects.filter(quiz_id=values['quiz_id'], choices__is_correct=True)
+        .values_list('pk', 'choices__pk')
+    }).encode()
+    return {
+        'learning:lesson_list': [('GET', reverse('learning:lesson_list'), b'')],
+        'learning:lesson_detail': [('GET', reverse('learning:lesson_detail', args=[values['slug']]), b'')],
+        'learning:progress': [('GET', reverse('learning:progress'), b'')],
+        'learning:task_list': [('GET', reverse('learning:task_list'), b'')],
+        'games': [('GET', reverse('games'), b'')],
+        'game_play': [('GET', reverse('game_play', args=[values['number']]), b'')],
+        # Open a quiz session, then submit it
+        'learning:quiz_take': [('GET', quiz_url, b''), ('POST', quiz_url, answers)],
+    }
+
+
+def client_sessions(count):
+    """``(cookie_header, csrf_token)`` for ``count`` seeded learners, logged in
+    by writing their sessions directly."""
+    from django.contrib.auth import BACKEND_SESSION_KEY, HASH_SESSION_KEY, SESSION_KEY
+    from django.middleware.csrf import CSRF_ALLOWED_CHARS, CSRF_SECRET_LENGTH
+
+    users = list(get_user_model().objects.filter(username__startswith=f'{PREFIX}user-').order_by('pk')[:count])
+    if len(users) < count:
+        raise RuntimeError(f'Only {len(users)} seeded learners for {count} clients; seed more with --users')
+    store = import_module(settings.SESSION_ENGINE).SessionStore
+    sessions = []
+    for user in users:
+        session = store()
+        session[SESSION_KEY] = str(user.pk)
+        session[BACKEND_SESSION_KEY] = 'django.contrib.auth.backends.ModelBackend'
+        session[HASH_SESSION_KEY] = user.get_session_auth_hash()
+        session.create()
+        token = get_random_string(CSRF_SECRET_LENGTH, CSRF_ALLOWED_CHARS)
+        sessions.append((f'{settings.SESSION_COOKIE_NAME}={session.session_key}; {settings.CSRF_COOKIE_NAME}={token}', token))
+    return sessions
+
+
+def end_sessions(sessions):
+    store = import_module(settings.SESSION_ENGINE).SessionStore
+    for cookie, _ in sessions:
+        store().delete(cookie.split(';')[0].split('=', 1)[1])
+
+
+async def _request(reader, writer, method, path, host, cookie, token, body):
+    """One HTTP/1.1 exchange on a keep-alive connection; returns
+    ``(status, connection_closed)`` after draining the body."""
+    lines = [f'{method} {path} HTTP/1.1', f'Host: {host}', f'Cookie: {cookie}']
+    if method == 'POST':
+        lines += [f'X-CSRFToken: {token}', 'Content-Type: application/x-www-form-urlencoded', f'Content-Length: {len(body)}']
+    writer.write(('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1') + body)
+    await writer.drain()
+    status_line = await reader.readline()
+    if not status_line:
+        raise ConnectionError('Server closed the connection')
+    status = int(status_line.split()[1])
+    length, chunked, closed = 0, False, False
+    while (line := await reader.readline()) not in (b'\r\n', b''):
+        name, _, value = line.decode('latin-1').partition(':')
+        name, value = name.strip().lower(), value.strip().lower()
+        if name == 'content-length':
+            length = int(value)
+        elif name == 'transfer-encoding':
+            chunked = 'chunked' in value
+        elif name == 'connection':
+            closed = value == 'close'
+    if chunked:
+        while size := int((await reader.readline()).split(b';')[0], 16):
+            await reader.readexactly(size + 2)
+        await reader.readline()
+    elif length:
+        await reader.readexactly(length)
+    return status, closed
+
+
+async def _client(address, host, session, steps, until, latencies, statuses):
+    cookie, token = session
+    connection = None
+    while time.perf_counter() < until:
+        started = time.perf_counter()
+        try:
+            for method, path, body in steps:
+                if connection is None:
+                    connection = await asyncio.open_connection(*address)
+                status, closed = await _request(*connection, method, path, host, cookie, token, body)
+                statuses[status] += 1
+                if closed:
+                    connection[1].close()
+                    connection = None
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            statuses['error'] += 1
+            if connection is not None:
+                connection[1].close()
+            connection = None
+            continue
+        latencies.append(time.perf_counter() - started)
+    if connection is not None:
+        connection[1].close()
+
+
+async def _load(address, host, sessions, steps, duration):
+    latencies, statuses = [], Counter()
+    until = time.perf_counter() + duration
+    started = time.perf_counter()
+    await asyncio.gather(*(_client(address, host, session, steps, until, latencies, statuses) for session in sessions))
+    return latencies, statuses, time.perf_counter() - started
+
+
+def run_load(address, sessions, steps, duration, warmup):
+    """Hammer ``address`` with one client per session for ``duration`` seconds
+    (after ``warmup`` untimed seconds); returns throughput and latency."""
+    host = benchmark_host()
+    if warmup:
+        asyncio.run(_load(address, host, sessions, steps, warmup))
+    latencies, statuses, elapsed = asyncio.run(_load(address, host, sessions, steps, duration))
+    return {
+        'ops_per_s': round(len(latencies) / elapsed, 1),
+        'p50_ms': round(percentile(latencies, 0.50) * 1000, 2) if latencies else None,
+        'p95_ms': round(percentile(latencies, 0.95) * 1000, 2) if latencies else None,
+        'operations': len(latencies),
+        'statuses': {str(status): count for status, count in sorted(statuses.items(), key=str)},
+    }
+
+
+def _wait_for_port(address, process, timeout=30):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f'uvicorn exited with status {process.returncode}')
+        try:
+            socket.create_connection(address, timeout=1).close()
+            return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError(f'uvicorn did not listen on {address[0]}:{address[1]} within {timeout}s')
+
+
+@contextmanager
+def uvicorn_server(project_dir, port, workers, app='project1.asgi:application'):
+    """Run ``app`` from ``project_dir`` under uvicorn and yield its address."""
+    if importlib.util.find_spec('uvicorn') is None:
+        raise RuntimeError('uvicorn is not installed; `pip install uvicorn` to run this benchmark')
+    address = ('127.0.0.1', port)
+    process = subprocess.Popen(
+        [sys.executable, '-m', 'uvicorn', app, '--host', address[0], '--port', str(port),
+         '--workers', str(workers), '--no-access-log', '--log-level', 'warning'],
+        cwd=project_dir,
+    )
+    try:
+        _wait_for_port(address, process)
+        yield address
+    finally:
+        process.terminate()
+        try:
+            process.wait(timeout=15)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+
+
+@contextmanager
+def git_checkout(ref):
+    """Check ``ref`` out into a temporary git worktree and yield the project
+    directory inside it. The SQLite database and media directory are linked
+    in, so both trees serve the same seeded data."""
+    base = Path(settings.BASE_DIR)
+    top = Path(subprocess.run(
+        ['git', 'rev-parse', '--show-toplevel'], cwd=base, capture_output=True, text=True, check=True,
+    ).stdout.strip())
+    tmp = tempfile.mkdtemp(prefix='bench-worktree-')
+    tree = Path(tmp) / 'tree'
+    subprocess.run(['git', 'worktree', 'add', '--detach', str(tree), ref], cwd=top, capture_output=True, check=True)
+    try:
+        project = tree / base.relative_to(top)
+        for shared in (Path(settings.DATABASES['default']['NAME']), Path(settings.MEDIA_ROOT)):
+            if shared.exists() and shared.is_relative_to(base) and not (project / shared.relative_to(base)).exists():
+                os.symlink(shared, project / shared.relative_to(base))
+        yield project
+    finally:
+        subprocess.run(['git', 'worktree', 'remove', '--force', str(tree)], cwd=top, capture_output=True)
+        shutil.rmtree(tmp, ignore_errors=True)
@@ -0,0 +1,175 @@
+import time
+from functools import wraps
+
+from asgiref.sync import iscoroutinefunction
+from django.conf import settings
+from django.contrib.messages import get_messages
+from django.core.cache import caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.http import HttpResponse
+from django.utils.cache import patch_vary_headers
+
+from .compression import available_encodings, compress, is_compressible, negotiate
+
+PAGE_CACHE_ALIAS = 'pages'
+SHARED_CACHE_ALIAS = 'shared'
+GENERATION_KEY = 'mriic:page-generation'
+
+
+def page_cache():
+    return caches[PAGE_CACHE_ALIAS]
+
+
+def shared_cache():
+    """The cache every web worker and management command sees the same way."""
+    return caches[SHARED_CACHE_ALIAS]
+
+
+def is_process_local(cache):
+    return isinstance(cache, (LocMemCache, DummyCache))
+
+
+# The page generation lives in the shared cache, so invalidate_pages() called
+# from a management command (the lesson publisher) reaches every web worker
+
+def _generation():
+    cache = shared_cache()
+    generation = cache.get(GENERATION_KEY)
+    if generation is None:
+        # Seeded from the clock so an evicted counter never reuses an old number
+        cache.add(GENERATION_KEY, int(time.time()), timeout=None)
+        generation = cache.get(GENERATION_KEY, 0)
+    return generation
+
+
+async def _ageneration():
+    cache = shared_cache()
+    generation = await cache.aget(GENERATION_KEY)
+    if generation is None:
+        await cache.aadd(GENERATION_KEY, int(time.time()), timeout=None)
+        generation = await cache.aget(GENERATION_KEY, 0)
+    return generation
+
+
+def cache_version(request=None):
+    """Version baked into every page and fragment key; changes with each
+    deploy and whenever invalidate_pages() is called. Read once per
+    ``request`` and kept on it."""
+    version = getattr(request, 'cache_version', None)
+    if version is None:
+        version = f'{settings.DEPLOY_VERSION}.{_generation()}'
+        if request is not None:
+            request.cache_version = version
+    return version
+
+
+async def acache_version(request):
+    """cache_version for async views. Call it before rendering: the context
+    processor then reuses the value instead of reading the shared cache,
+    which may be a database table, from the event loop."""
+    if getattr(request, 'cache_version', None) is None:
+        request.cache_version = f'{settings.DEPLOY_VERSION}.{await _ageneration()}'
+    return request.cache_version
+
+
+def invalidate_pages():
+    """Make every cached page and fragment stale at once, e.g. when the
+    lesson catalog changes."""
+    cache = shared_cache()
+    try:
+        cache.incr(GENERATION_KEY)
+    except ValueError:
+        cache.set(GENERATION_KEY, int(time.time()), timeout=None)
+
+
+def page_cache_key(request):
+    return f'mriic:page:{cache_version(request)}:{request.get_full_path()}'
+
+
+def _cacheable(request, anonymous_only):
+    if request.method not in ('GET', 'HEAD'):
+        return False
+    if anonymous_only and request.user.is_authenticated:
+        return False
+    # Flash messages are rendered into the page and must not be cached
+    return not len(get_messages(request))
+
+
+def _to_cache(response):
+    """Cache entry for a rendered page, with its compressed copies made once up front."""
+    content = response.content
+    entry = {'content': content, 'content_type': response['Content-Type'], 'encoded': {}}
+    if len(content) >= settings.COMPRESSION_MIN_SIZE and is_compressible(entry['content_type']):
+        for encoding in available_encodings():
+            entry['encoded'][encoding] = compress(content, encoding)
+    return entry
+
+
+def _from_cache(request, entry):
+    encoding = negotiate(request, offered=tuple(entry['encoded']))
+    if encoding is None:
+        response = HttpResponse(entry['content'], content_type=entry['content_type'])
+    else:
+        response = HttpResponse(entry['encoded'][encoding], content_type=entry['content_type'])
+        response['Content-Encoding'] = encoding
+        # CompressionMiddleware weakens the ETag added on the way out
+        response.precompressed = True
+    if entry['encoded']:
+        patch_vary_headers(response, ('Accept-Encoding',))
+    return response
+
+
+def cached_page(view_func=None, *, anonymous_only=True, timeout=None):
+    """Cache the whole rendered response of a view.
+
+    With ``anonymous_only`` (the default) logged-in users always get a fresh
+    render, since the navbar shows their account; their pages still reuse the
+    template fragments cached with ``{% cache ... using="pages" %}``.
+    """
+    def store(key, response):
+        if response.status_code == 200 and not response.streaming:
+            page_cache().set(key, _to_cache(response), timeout if timeout is not None else settings.PAGE_CACHE_TIMEOUT)
+
+    def finish(response):
+        if anonymous_only:
+            patch_vary_headers(response, ('Cookie',))
+        return response
+
+    def decorator(view):
+        if iscoroutinefunction(view):
+            @wraps(view)
+            async def async_wrapper(request, *args, **kwargs):
+                # Resolve the user, session and cache version here; the lazy
+                # ones would query the database from the event loop
+                await acache_version(request)
+                if anonymous_only:
+                    request.user = await request.auser()
+                elif hasattr(request, 'session'):
+                    await request.session.akeys()
+                if not _cacheable(request, anonymous_only):
+                    return await view(request, *args, **kwargs)
+                key = page_cache_key(request)
+                cached = page_cache().get(key)
+                if cached is not None:
+                    return finish(_from_cache(request, cached))
+                response = await view(request, *args, **kwargs)
+                store(key, response)
+                return finish(response)
+            return async_wrapper
+
+        @wraps(view)
+        def wrapper(request, *args, **kwargs):
+            if not _cacheable(request, anonymous_only):
+                return view(request, *args, **kwargs)
+            key = page_cache_key(request)
+            cached = page_cache().get(key)
+            if cached is not None:
+                return finish(_from_cache(request, cached))
+            response = view(request, *args, **kwargs)
+            store(key, response)
+            return finish(response)
+        return wrapper
+    if view_func is not None:
+        return decorator(view_func)
+    return decorator
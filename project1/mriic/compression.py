@@ -0,0 +1,53 @@
+import gzip
+import re
+
+from django.utils.text import compress_string
+
+try:
+    import brotli
+except ImportError:  # brotli is optional; gzip is always available
+    brotli = None
+
+COMPRESSIBLE_TYPES = (
+    'text/', 'application/javascript', 'application/json', 'application/xml', 'image/svg+xml',
+)
+COMPRESSIBLE_EXTENSIONS = ('.css', '.js', '.mjs', '.html', '.svg', '.json', '.txt', '.xml', '.map')
+ACCEPTS_BR_RE = re.compile(r'\bbr\b')
+ACCEPTS_GZIP_RE = re.compile(r'\bgzip\b')
+
+
+def available_encodings():
+    """Encodings we can produce, best first."""
+    return ('br', 'gzip') if brotli is not None else ('gzip',)
+
+
+def negotiate(request, offered=None):
+    """Pick the best encoding the client accepts among ``offered``, or ``None``."""
+    accept = request.META.get('HTTP_ACCEPT_ENCODING', '')
+    offered = available_encodings() if offered is None else offered
+    if 'br' in offered and ACCEPTS_BR_RE.search(accept):
+        return 'br'
+    if 'gzip' in offered and ACCEPTS_GZIP_RE.search(accept):
+        return 'gzip'
+    return None
+
+
+def weaken_etag(response):
+    """A strong validator names the identity body byte for byte, so it must
+    become weak once the response carries an encoded one."""
+    etag = response.get('ETag')
+    if etag and etag.startswith('"'):
+        response['ETag'] = 'W/' + etag
+
+
+def compress(content, encoding, pad=False):
+    """Compress bytes. ``pad`` adds Django's random gzip header padding (BREACH mitigation)."""
+    if encoding == 'br':
+        return brotli.compress(content, quality=11 if not pad else 5)
+    if pad:
+        return compress_string(content, max_random_bytes=100)
+    return gzip.compress(content, compresslevel=9, mtime=0)
+
+
+def is_compressible(content_type):
+    return content_type.split(';')[0].strip().startswith(COMPRESSIBLE_TYPES)
@@ -0,0 +1,8 @@
+from .caching import cache_version as _cache_version
+from .images import manifest
+
+
+def cache_version(request):
+    # Fragments that render {% picture %} also key on the derivative manifest,
+    # so new derivatives show up without waiting for a deploy
+    return {'cache_version': _cache_version(request), 'derivatives_version': manifest.version()}
@@ -0,0 +1,232 @@
+# Resized WebP/AVIF derivatives of uploaded and bundled images. A process pool
+# writes them under MEDIA_ROOT/derivatives/ and a JSON manifest lists them for
+# templates. Source keys are "media:<storage name>" for uploads and
+# "static:<path>" for files under STATICFILES_DIRS.
+import hashlib
+import json
+import logging
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from functools import partial
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows; only threads in one process are serialised there
+    fcntl = None
+
+from django.conf import settings
+from PIL import Image, ImageOps, features
+
+DERIVATIVE_DIR = 'derivatives'
+MANIFEST_NAME = 'manifest.json'
+CONTENT_TYPES = {'avif': 'image/avif', 'webp': 'image/webp'}
+
+logger = logging.getLogger(__name__)
+
+
+def derivative_widths():
+    return tuple(getattr(settings, 'IMAGE_DERIVATIVE_WIDTHS', (320, 640, 1024, 1600)))
+
+
+def derivative_formats():
+    """Output formats supported by this Pillow build, best compression first."""
+    return tuple(fmt for fmt in ('avif', 'webp') if features.check(fmt))
+
+
+def derivative_root():
+    return Path(settings.MEDIA_ROOT) / DERIVATIVE_DIR
+
+
+def source_path(key):
+    kind, _, name = key.partition(':')
+    if kind == 'media':
+        return Path(settings.MEDIA_ROOT) / name
+    if kind == 'static':
+        return Path(settings.STATICFILES_DIRS[0]) / name
+    raise ValueError(f'Unknown image source: {key}')
+
+
+def key_for(value):
+    """Manifest key for an ImageField file, a storage name or a /static/ URL."""
+    name = getattr(value, 'name', value)
+    if not name:
+        return None
+    static_prefix = '/' + settings.STATIC_URL.lstrip('/')
+    if name.startswith(static_prefix):
+        return 'static:' + name[len(static_prefix):]
+    return 'media:' + name
+
+
+def render_derivatives(key, path, out_dir, media_root, widths, formats):
+    """Write every width/format variant of one image; runs inside a pool worker,
+    so it takes plain arguments and does not touch Django settings.
+
+    Returns ``(key, entries)``, where entries are dicts of width, format and
+    name (relative to ``media_root``). Widths wider than the original are skipped,
+    but at least one variant at the original width is always produced.
+    """
+    entries = []
+    with Image.open(path) as original:
+        image = ImageOps.exif_transpose(original)
+        if image.mode not in ('RGB', 'RGBA'):
+            image = image.convert('RGBA' if 'A' in image.getbands() else 'RGB')
+        targets = [width for width in widths if width < image.width] or [image.width]
+        stem = Path(path).stem
+        os.makedirs(out_dir, exist_ok=True)
+        for width in targets:
+            height = round(image.height * width / image.width)
+            resized = image.resize((width, height), Image.LANCZOS) if width != image.width else image
+            for fmt in formats:
+                filename = f'{stem}-{width}.{fmt}'
+                resized.save(os.path.join(out_dir, filename), fmt.upper(), quality=60 if fmt == 'avif' else 80)
+                entries.append({
+                    'width': width,
+                    'format': fmt,
+                    'name': os.path.relpath(os.path.join(out_dir, filename), media_root),
+                })
+    return key, entries
+
+
+@contextmanager
+def _locked(path):
+    """Hold an exclusive OS lock on ``path`` across processes."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'a') as handle:
+        if fcntl is not None:
+            fcntl.flock(handle, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(handle, fcntl.LOCK_UN)
+
+
+class DerivativeManifest:
+    """The JSON manifest on disk, reloaded when another process rewrites it."""
+
+    def __init__(self):
+        self.lock = threading.RLock()
+        self.data = {}
+        self.mtime = None
+
+    @property
+    def path(self):
+        return derivative_root() / MANIFEST_NAME
+
+    def _read(self):
+        try:
+            return json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            return {}
+
+    def load(self):
+        try:
+            mtime = self.path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return {}
+        if mtime != self.mtime:
+            with self.lock:
+                self.data = self._read()
+                self.mtime = mtime
+        return self.data
+
+    def get(self, key):
+        return self.load().get(key, [])
+
+    def version(self):
+        """Changes whenever the manifest is rewritten; 0 before the first write."""
+        self.load()
+        return self.mtime or 0
+
+    def update(self, results):
+        """Merge ``{key: entries}`` and rewrite the manifest atomically.
+
+        Web workers and the build command all write it, so the read and the
+        rewrite happen under a file lock; a merge never drops another
+        process's entries.
+        """
+        with self.lock, _locked(self.path.with_suffix('.lock')):
+            data = self._read()
+            for key, entries in results.items():
+                if entries:
+                    data[key] = entries
+                else:
+                    data.pop(key, None)
+            tmp = self.path.with_suffix(f'.{os.getpid()}.{threading.get_ident()}.tmp')
+            tmp.write_text(json.dumps(data, sort_keys=True))
+            os.replace(tmp, self.path)
+            self.data = data
+            self.mtime = self.path.stat().st_mtime_ns
+
+
+manifest = DerivativeManifest()
+
+
+def output_dir(key):
+    # One directory per source so identical file names never collide
+    digest = hashlib.sha1(key.encode()).hexdigest()[:16]
+    return str(derivative_root() / digest)
+
+
+def job_args(key):
+    return key, str(source_path(key)), output_dir(key), str(settings.MEDIA_ROOT), derivative_widths(), derivative_formats()
+
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_executor():
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ProcessPoolExecutor(max_workers=getattr(settings, 'IMAGE_WORKERS', 2))
+        return _executor
+
+
+# Sources queued, or failed, in this process; saving the same file again
+# does not queue it a second time
+_scheduled = set()
+
+
+def _store_result(key, future):
+    try:
+        _, entries = future.result()
+    except Exception:  # a broken upload must not take the web worker down
+        logger.exception('Could not render derivatives of %s', key)
+        return
+    manifest.update({key: entries})
+    with _executor_lock:
+        _scheduled.discard(key)
+
+
+def schedule(value):
+    """Queue derivative generation for an uploaded file without blocking the request.
+
+    Returns None when there is nothing to do or the file was already queued
+    (or failed) in this process.
+    """
+    key = key_for(value)
+    if key is None or not derivative_formats():
+        return None
+    with _executor_lock:
+        if key in _scheduled:
+            return None
+        _scheduled.add(key)
+    future = get_executor().submit(render_derivatives, *job_args(key))
+    future.add_done_callback(partial(_store_result, key))
+    return future
+
+
+def srcset(value, fmt):
+    """``srcset`` attribute value for ``fmt`` variants of ``value``, or ''."""
+    key = key_for(value)
+    if key is None:
+        return ''
+    return ', '.join(
+        f"{settings.MEDIA_URL}{entry['name']} {entry['width']}w"
+        for entry in manifest.get(key) if entry['format'] == fmt
+    )
@@ -0,0 +1,122 @@
+# Per-request timing for RequestTimingMiddleware: SQL through an execute
+# wrapper that every database connection gets once, template rendering through
+# the TimedDjangoTemplates backend. Nothing is recorded outside a sampled
+# request, so both hooks cost a single ContextVar lookup otherwise.
+import re
+import time
+from collections import Counter
+from contextvars import ContextVar
+
+from django.template.backends.django import DjangoTemplates, Template
+
+# "IN (%s, %s, %s)" lists collapse to one placeholder so batches of different
+# sizes still count as the same statement
+PLACEHOLDER_LIST_RE = re.compile(r'%s(?:\s*,\s*%s)+')
+
+_current = ContextVar('request_timings', default=None)
+
+
+class RequestTimings:
+    __slots__ = ('started', 'view_started', 'view_ended', 'queries', 'db_time', 'template_time',
+                 'render_depth', 'statements', 'executions')
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.view_started = self.view_ended = None
+        self.queries = 0
+        self.db_time = 0.0
+        self.template_time = 0.0
+        self.render_depth = 0
+        self.statements = Counter()
+        self.executions = Counter()
+
+    def record_query(self, alias, sql, params, many, elapsed):
+        self.queries += 1
+        self.db_time += elapsed
+        statement = (alias, PLACEHOLDER_LIST_RE.sub('%s', sql))
+        self.statements[statement] += 1
+        if not many:
+            # executemany params may be a one-shot iterator, so only single
+            # statements are checked for exact repeats
+            self.executions[statement + (repr(params),)] += 1
+
+    def repeated_statements(self, threshold):
+        """Statements run ``threshold`` times or more with different parameters
+        (the N+1 shape), and identical statements run more than once."""
+        n_plus_one = [
+            {'alias': alias, 'sql': sql, 'count': count}
+            for (alias, sql), count in self.statements.most_common() if count >= threshold
+        ]
+        duplicates = [
+            {'alias': alias, 'sql': sql, 'params': params, 'count': count}
+            for (alias, sql, params), count in self.executions.most_common() if count > 1
+        ]
+        return n_plus_one, duplicates
+
+
+def current():
+    return _current.get()
+
+
+def start():
+    """Begin recording for this request; returns the token for ``stop``."""
+    return _current.set(RequestTimings())
+
+
+def stop(token):
+    _current.reset(token)
+
+
+class QueryTimer:
+    """``connection.execute_wrapper`` callable feeding the current request's timings."""
+
+    def __init__(self, alias):
+        self.alias = alias
+
+    def __call__(self, execute, sql, params, many, context):
+        timings = _current.get()
+        if timings is None:
+            return execute(sql, params, many, context)
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            timings.record_query(self.alias, sql, params, many, time.perf_counter() - started)
+
+
+def install_query_timer(sender, connection, **kwargs):
+    """``connection_created`` receiver giving each connection one QueryTimer.
+
+    The wrapper stays for the connection's lifetime, whichever thread uses
+    it; installing one per request would stack them on connections shared
+    by concurrent async requests and count every query several times.
+    """
+    if not getattr(connection, 'query_timer_installed', False):
+        connection.execute_wrappers.append(QueryTimer(connection.alias))
+        connection.query_timer_installed = True
+
+
+class TimedTemplate(Template):
+    def render(self, context=None, request=None):
+        timings = _current.get()
+        if timings is None:
+            return super().render(context, request)
+        # Templates rendered from inside another one are already on the clock
+        timings.render_depth += 1
+        started = time.perf_counter()
+        try:
+            return super().render(context, request)
+        finally:
+            timings.render_depth -= 1
+            if not timings.render_depth:
+                timings.template_time += time.perf_counter() - started
+
+
+class TimedDjangoTemplates(DjangoTemplates):
+    """The stock Django backend, with render time reported to the current request."""
+
+    def from_string(self, template_code):
+        return TimedTemplate(self.engine.from_string(template_code), self)
+
+    def get_template(self, template_name):
+        return TimedTemplate(super().get_template(template_name).template, self)
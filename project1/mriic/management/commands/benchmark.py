@@ -0,0 +1,92 @@
+import json
+import logging
+import platform
+
+import django
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from mriic import benchmarks
+
+
+class Command(BaseCommand):
+    help = (
+        'Time every project URL and the model hot paths against `seed_benchmark` data; '
+        'writes p50/p95 latency and SQL query counts as JSON and can fail on regressions'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--iterations', type=int, default=20, help='Timed runs per scenario')
+        parser.add_argument('--warmup', type=int, default=2, help='Untimed runs per scenario first')
+        parser.add_argument('--only', action='append', help='Run scenarios whose name contains this text (repeatable)')
+        parser.add_argument('--output', help="Write the JSON results here; '-' for stdout")
+        parser.add_argument('--baseline', help='Compare against a JSON file from an earlier run')
+        parser.add_argument(
+            '--tolerance',
+            type=float,
+            default=0.25,
+            help='Allowed fractional p95 slowdown against the baseline (default 0.25)',
+        )
+        parser.add_argument(
+            '--min-delta-ms',
+            type=float,
+            default=5.0,
+            help='Ignore p95 slowdowns smaller than this many milliseconds (timer noise)',
+        )
+
+    def handle(self, *args, **options):
+        if options['iterations'] < 1:
+            raise CommandError('--iterations must be positive')
+        try:
+            client = benchmarks.benchmark_client()
+        except RuntimeError as exc:
+            raise CommandError(str(exc))
+        http, skipped = benchmarks.http_scenarios()
+        scenarios = http + benchmarks.model_scenarios()
+        if options['only']:
+            scenarios = [(name, run) for name, run in scenarios if any(part in name for part in options['only'])]
+
+        results = {}
+        # Expected 404/405/500 responses would otherwise log a traceback per iteration
+        request_logger = logging.getLogger('django.request')
+        request_logger.disabled = True
+        try:
+            self.run(scenarios, client, options, results)
+        finally:
+            request_logger.disabled = False
+        for name, reason in skipped.items():
+            self.stderr.write(f'{name:<48} skipped: {reason}')
+
+        report = {
+            'created_at': timezone.now().isoformat(),
+            'python': platform.python_version(),
+            'django': django.get_version(),
+            'iterations': options['iterations'],
+            'results': results,
+            'skipped': skipped,
+        }
+        if options['output']:
+            payload = json.dumps(report, indent=2, sort_keys=True)
+            if options['output'] == '-':
+                self.stdout.write(payload)
+            else:
+                with open(options['output'], 'w') as handle:
+                    handle.write(payload + '\n')
+                self.stderr.write(f"Wrote {options['output']}")
+
+        if options['baseline']:
+            with open(options['baseline']) as handle:
+                baseline = json.load(handle)['results']
+            regressions = benchmarks.compare(results, baseline, options['tolerance'], options['min_delta_ms'])
+            if regressions:
+                for line in regressions:
+                    self.stderr.write(self.style.ERROR(line))
+                raise CommandError(f'{len(regressions)} regression(s) against {options["baseline"]}')
+            self.stderr.write(self.style.SUCCESS(f'No regressions against {options["baseline"]}'))
+
+    def run(self, scenarios, client, options, results):
+        for name, scenario in scenarios:
+            results[name] = stats = benchmarks.measure(scenario, client, options['iterations'], options['warmup'])
+            self.stderr.write(
+                f"{name:<48} p50 {stats['p50_ms']:>9.2f} ms  p95 {stats['p95_ms']:>9.2f} ms  "
+                f"{stats['queries']:>4} queries  {stats['status'] or ''}"
+            )
@@ -0,0 +1,92 @@
+import json
+import platform
+import subprocess
+
+import django
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from mriic import benchmarks
+
+
+class Command(BaseCommand):
+    help = (
+        'Load-test the async views under uvicorn with many concurrent logged-in clients against '
+        '`seed_benchmark` data; with --against, serve a git ref (e.g. the sync views) the same way and '
+        'compare throughput'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--concurrency', type=int, default=20, help='Simultaneous clients, one learner each')
+        parser.add_argument('--duration', type=float, default=10, help='Timed seconds per scenario')
+        parser.add_argument('--warmup', type=float, default=2, help='Untimed seconds per scenario first')
+        parser.add_argument('--workers', type=int, default=1, help='uvicorn worker processes')
+        parser.add_argument('--port', type=int, default=8765, help='Port uvicorn listens on')
+        parser.add_argument('--only', action='append', help='Run scenarios whose name contains this text (repeatable)')
+        parser.add_argument('--against', metavar='REF', help='Also serve this git ref from a temporary worktree')
+        parser.add_argument('--output', help="Write the JSON results here; '-' for stdout")
+
+    def handle(self, *args, **options):
+        if options['concurrency'] < 1 or options['duration'] <= 0:
+            raise CommandError('--concurrency and --duration must be positive')
+        try:
+            targets = benchmarks.load_targets()
+            sessions = benchmarks.client_sessions(options['concurrency'])
+        except RuntimeError as exc:
+            raise CommandError(str(exc))
+        if options['only']:
+            targets = {name: steps for name, steps in targets.items() if any(part in name for part in options['only'])}
+
+        results = {}
+        try:
+            results['current'] = self.serve(settings.BASE_DIR, 'current', targets, sessions, options)
+            if options['against']:
+                with benchmarks.git_checkout(options['against']) as tree:
+                    results[options['against']] = self.serve(tree, options['against'], targets, sessions, options)
+        except subprocess.CalledProcessError as exc:
+            raise CommandError(f'git failed: {exc.stderr.decode().strip() or exc}')
+        except RuntimeError as exc:
+            raise CommandError(str(exc))
+        finally:
+            benchmarks.end_sessions(sessions)
+
+        if options['against']:
+            self.stderr.write(f"\nops/s, current vs {options['against']}:")
+            for name in targets:
+                current, other = results['current'][name]['ops_per_s'], results[options['against']][name]['ops_per_s']
+                ratio = f'{current / other:.2f}x' if other else '-'
+                self.stderr.write(f'{name:<32} {current:>9.1f}  {other:>9.1f}  {ratio:>7}')
+
+        report = {
+            'created_at': timezone.now().isoformat(),
+            'python': platform.python_version(),
+            'django': django.get_version(),
+            'concurrency': options['concurrency'],
+            'duration': options['duration'],
+            'workers': options['workers'],
+            'results': results,
+        }
+        if options['output']:
+            payload = json.dumps(report, indent=2, sort_keys=True)
+            if options['output'] == '-':
+                self.stdout.write(payload)
+            else:
+                with open(options['output'], 'w') as handle:
+                    handle.write(payload + '\n')
+                self.stderr.write(f"Wrote {options['output']}")
+        self.stderr.write(self.style.SUCCESS(f'Ran {len(targets)} scenario(s) with {options["concurrency"]} clients'))
+
+    def serve(self, project_dir, label, targets, sessions, options):
+        self.stderr.write(f'{label}:')
+        results = {}
+        with benchmarks.uvicorn_server(project_dir, options['port'], options['workers']) as address:
+            for name, steps in targets.items():
+                results[name] = stats = benchmarks.run_load(
+                    address, sessions, steps, options['duration'], options['warmup']
+                )
+                statuses = ' '.join(f'{status}:{count}' for status, count in stats['statuses'].items())
+                self.stderr.write(
+                    f"  {name:<30} {stats['ops_per_s']:>9.1f} ops/s  p50 {stats['p50_ms'] or 0:>9.2f} ms  "
+                    f"p95 {stats['p95_ms'] or 0:>9.2f} ms  {statuses}"
+                )
+        return results
@@ -0,0 +1,178 @@
+import re
+import subprocess
+import tempfile
+import urllib.request
+from pathlib import Path
+from urllib.parse import urlparse
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.template.loader import get_template
+from mriic.registry import GAMES, template_for
+
+STYLE_RE = re.compile(r'<style(?P<attrs>[^>]*)>(?P<body>.*?)</style>', re.S | re.I)
+INLINE_SCRIPT_RE = re.compile(r'<script(?P<attrs>(?:(?!\bsrc=)[^>])*)>(?P<body>.*?)</script>', re.S | re.I)
+CDN_SCRIPT_RE = re.compile(r'<script(?P<before>[^>]*?)\ssrc="(?P<url>https?://[^"]+)"(?P<after>[^>]*)>\s*</script>', re.I)
+# Subresource integrity and CORS attributes only make sense for the CDN copy
+CDN_ONLY_ATTRS_RE = re.compile(r'\s(?:integrity|crossorigin|referrerpolicy)(?:="[^"]*")?', re.I)
+# Scripts fetched by the game code itself; --vendor cannot rewrite these
+RUNTIME_CDN_RE = re.compile(r'''['"`](?P<url>https?://[^'"`\s]+\.js)['"`]''')
+STATIC_JS_RE = re.compile(r'''\{% static '(?P<name>[^']+\.js)' %\}''')
+# The Tailwind Play CDN compiles classes in the browser; it is replaced by a
+# stylesheet built from the classes the game actually uses
+TAILWIND_CDN_HOST = 'cdn.tailwindcss.com'
+LOAD_STATIC = '{% load static %}'
+
+
+def vendor_name(url):
+    """Static path for a vendored CDN file, e.g. vendor/three.js/r128/three.min.js."""
+    parsed = urlparse(url)
+    parts = [part for part in parsed.path.split('/') if part]
+    if parts[:2] == ['ajax', 'libs']:
+        parts = parts[2:]
+    if not parts or not parts[-1].endswith('.js'):
+        host = parsed.netloc.split(':')[0]
+        parts = parts + [host.replace('cdn.', '').replace('.com', '') + '.js']
+    return 'vendor/' + '/'.join(parts)
+
+
+class Command(BaseCommand):
+    help = (
+        'Move inline game CSS/JS into static files and optionally vendor CDN scripts. '
+        'Run collectstatic afterwards; ManifestStaticFilesStorage fingerprints the files.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--game',
+            type=int,
+            action='append',
+            help='Game number to process (repeatable); defaults to every game in the registry',
+        )
+        parser.add_argument(
+            '--vendor',
+            action='store_true',
+            help=(
+                'Download CDN scripts into static/vendor/ and point the templates at the local copy; '
+                'the Tailwind CDN is replaced by a stylesheet built with the tailwindcss CLI'
+            ),
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Report what would change without writing any files',
+        )
+
+    def handle(self, *args, **options):
+        self.static_dir = Path(settings.STATICFILES_DIRS[0])
+        self.dry_run = options['dry_run']
+        numbers = options['game'] or [game['number'] for game in GAMES]
+        for number in numbers:
+            path = Path(get_template(template_for(number)).origin.name)
+            source = path.read_text(encoding='utf-8')
+            html = self.extract(number, source)
+            if options['vendor']:
+                html = self.vendor(number, path, html)
+                self.check_runtime_cdn(html)
+            if html == source:
+                self.stdout.write(f'game{number}: nothing to do')
+                continue
+            if not html.startswith(LOAD_STATIC):
+                html = LOAD_STATIC + html
+            if not self.dry_run:
+                path.write_text(html, encoding='utf-8')
+            self.stdout.write(self.style.SUCCESS(
+                f'game{number}: {len(source.encode()) // 1024} KB -> {len(html.encode()) // 1024} KB of HTML'
+            ))
+
+    def write_asset(self, name, content):
+        target = self.static_dir / name
+        if not self.dry_run:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_text(content.strip() + '\n', encoding='utf-8')
+        self.stdout.write(f'  wrote static/{name} ({len(content.encode()) // 1024} KB)')
+
+    def extract(self, number, html):
+        counter = {'css': 0, 'js': 0}
+
+        def asset_name(kind):
+            counter[kind] += 1
+            suffix = f'-{counter[kind]}' if counter[kind] > 1 else ''
+            return f'games/game{number}{suffix}.{kind}'
+
+        def replace_style(match):
+            if '{%' in match.group('body') or '{{' in match.group('body'):
+                return match.group(0)
+            name = asset_name('css')
+            self.write_asset(name, match.group('body'))
+            return f'<link rel="stylesheet" href="{{% static \'{name}\' %}}">'
+
+        def replace_script(match):
+            body = match.group('body')
+            if not body.strip() or '{%' in body or '{{' in body:
+                return match.group(0)
+            name = asset_name('js')
+            self.write_asset(name, body)
+            return f'<script{match.group("attrs")} src="{{% static \'{name}\' %}}"></script>'
+
+        html = STYLE_RE.sub(replace_style, html)
+        return INLINE_SCRIPT_RE.sub(replace_script, html)
+
+    def vendor(self, number, path, html):
+        def replace_cdn(match):
+            url = match.group('url')
+            if urlparse(url).netloc == TAILWIND_CDN_HOST:
+                name = f'games/game{number}.tailwind.css'
+                self.build_tailwind(name, [path] + self.static_scripts(html))
+                return f'<link rel="stylesheet" href="{{% static \'{name}\' %}}">'
+            name = vendor_name(url)
+            target = self.static_dir / name
+            if not target.exists() and not self.dry_run:
+                try:
+                    with urllib.request.urlopen(url, timeout=30) as response:
+                        content = response.read()
+                except OSError as exc:
+                    raise CommandError(f'Could not download {url}: {exc}')
+                target.parent.mkdir(parents=True, exist_ok=True)
+                target.write_bytes(content)
+                self.stdout.write(f'  vendored {url} -> static/{name}')
+            attrs = CDN_ONLY_ATTRS_RE.sub('', match.group('before') + match.group('after'))
+            return f'<script{attrs} src="{{% static \'{name}\' %}}"></script>'
+
+        return CDN_SCRIPT_RE.sub(replace_cdn, html)
+
+    def static_scripts(self, html):
+        return [self.static_dir / match.group('name') for match in STATIC_JS_RE.finditer(html)]
+
+    def build_tailwind(self, name, sources):
+        """Compile the Tailwind utilities used in ``sources`` into static/``name``."""
+        if self.dry_run:
+            self.stdout.write(f'  would build static/{name} with tailwindcss')
+            return
+        binary = getattr(settings, 'TAILWINDCSS_BIN', 'tailwindcss')
+        with tempfile.TemporaryDirectory() as tmp:
+            entry = Path(tmp) / 'input.css'
+            entry.write_text(
+                '@import "tailwindcss" source(none);\n' + ''.join(f'@source "{source}";\n' for source in sources),
+                encoding='utf-8',
+            )
+            try:
+                subprocess.run(
+                    [binary, '--input', str(entry), '--output', str(self.static_dir / name), '--minify'],
+                    check=True, capture_output=True,
+                )
+            except FileNotFoundError:
+                raise CommandError(f'{binary} not found; install the Tailwind CSS CLI or set TAILWINDCSS_BIN')
+            except subprocess.CalledProcessError as exc:
+                raise CommandError(f'tailwindcss failed: {exc.stderr.decode().strip()}')
+        self.stdout.write(f'  built static/{name} with tailwindcss')
+
+    def check_runtime_cdn(self, html):
+        for script in self.static_scripts(html):
+            if not script.exists():
+                continue
+            for match in RUNTIME_CDN_RE.finditer(script.read_text(encoding='utf-8')):
+                self.stderr.write(self.style.WARNING(
+                    f'  {script.relative_to(self.static_dir.parent)} loads {match.group("url")} at runtime; '
+                    'load it with a <script> tag in the template so --vendor can vendor it'
+                ))
@@ -0,0 +1,73 @@
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from learning.models import Lesson, TaskSubmission
+from mriic import images
+
+SOURCES = ('lessons', 'tasks', 'games')
+
+
+class Command(BaseCommand):
+    help = 'Generate resized WebP/AVIF derivatives for lesson covers, task photos and game thumbnails'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--only',
+            choices=SOURCES,
+            action='append',
+            help='Restrict to one kind of source (repeatable)',
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=None,
+            help='Worker processes (defaults to the CPU count)',
+        )
+        parser.add_argument(
+            '--force',
+            action='store_true',
+            help='Regenerate derivatives that are already in the manifest',
+        )
+
+    def iter_keys(self, sources):
+        if 'lessons' in sources:
+            names = Lesson.objects.exclude(cover_image='').exclude(cover_image__isnull=True).values_list('cover_image', flat=True)
+            for name in names.iterator(chunk_size=1000):
+                yield 'media:' + name
+        if 'tasks' in sources:
+            names = TaskSubmission.objects.exclude(photo='').exclude(photo__isnull=True).values_list('photo', flat=True)
+            for name in names.iterator(chunk_size=1000):
+                yield 'media:' + name
+        if 'games' in sources:
+            image_dir = Path(settings.STATICFILES_DIRS[0]) / 'images'
+            for path in sorted(image_dir.glob('game*.png')):
+                yield f'static:images/{path.name}'
+
+    def handle(self, *args, **options):
+        if not images.derivative_formats():
+            raise CommandError('This Pillow build supports neither WebP nor AVIF')
+        sources = options['only'] or SOURCES
+        known = images.manifest.load()
+        keys = [
+            key for key in self.iter_keys(sources)
+            if (options['force'] or key not in known) and images.source_path(key).is_file()
+        ]
+        results, failed = {}, 0
+        with ProcessPoolExecutor(max_workers=options['workers']) as pool:
+            futures = {pool.submit(images.render_derivatives, *images.job_args(key)): key for key in keys}
+            for future in as_completed(futures):
+                try:
+                    key, entries = future.result()
+                except Exception as exc:
+                    failed += 1
+                    self.stderr.write(f'{futures[future]}: {exc}')
+                    continue
+                results[key] = entries
+        images.manifest.update(results)
+        variants = sum(len(entries) for entries in results.values())
+        self.stdout.write(self.style.SUCCESS(
+            f'Generated {variants} derivative(s) for {len(results)} image(s) '
+            f'({", ".join(images.derivative_formats())}); {failed} failed'
+        ))
@@ -0,0 +1,57 @@
+import os
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from mriic.compression import COMPRESSIBLE_EXTENSIONS, available_encodings, compress
+
+SUFFIXES = {'gzip': '.gz', 'br': '.br'}
+
+
+class Command(BaseCommand):
+    help = 'Write .gz (and .br when brotli is installed) copies of collected static files; run after collectstatic'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--min-size',
+            type=int,
+            default=settings.COMPRESSION_MIN_SIZE,
+            help='Skip files smaller than this many bytes',
+        )
+        parser.add_argument(
+            '--force',
+            action='store_true',
+            help='Recompress files even if an up-to-date copy exists',
+        )
+
+    def handle(self, *args, **options):
+        root = Path(settings.STATIC_ROOT)
+        if not root.is_dir():
+            raise CommandError(f'{root} does not exist; run collectstatic first')
+        encodings = available_encodings()
+        written = skipped = saved = 0
+        for dirpath, _, filenames in os.walk(root):
+            for filename in filenames:
+                if not filename.endswith(COMPRESSIBLE_EXTENSIONS):
+                    continue
+                source = Path(dirpath) / filename
+                stat = source.stat()
+                if stat.st_size < options['min_size']:
+                    continue
+                content = None
+                for encoding in encodings:
+                    target = source.with_name(filename + SUFFIXES[encoding])
+                    if not options['force'] and target.exists() and target.stat().st_mtime >= stat.st_mtime:
+                        skipped += 1
+                        continue
+                    if content is None:
+                        content = source.read_bytes()
+                    compressed = compress(content, encoding)
+                    if len(compressed) >= len(content):
+                        continue
+                    target.write_bytes(compressed)
+                    written += 1
+                    saved += len(content) - len(compressed)
+        self.stdout.write(self.style.SUCCESS(
+            f'Wrote {written} compressed file(s) ({", ".join(encodings)}), saving {saved // 1024} KB; {skipped} up to date'
+        ))
@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+from mriic.scoring import flush_pending_scores
+
+
+class Command(BaseCommand):
+    help = 'Credit eco-points for game plays that have not been credited yet'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='Plays credited per transaction',
+        )
+
+    def handle(self, *args, **options):
+        count = flush_pending_scores(batch_size=options['batch_size'])
+        self.stdout.write(
+            self.style.SUCCESS(f'Credited {count} game play(s)')
+        )
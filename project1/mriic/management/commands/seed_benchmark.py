@@ -0,0 +1,60 @@
+import time
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from mriic import benchmarks
+
+
+class Command(BaseCommand):
+    help = (
+        'Seed bench-* users, lessons, quiz attempts and task submissions for `manage.py benchmark`. '
+        'Production-like volumes are e.g. --users 50000 --lessons 500 --attempts 2000000 --submissions 200000'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=5000)
+        parser.add_argument('--lessons', type=int, default=500)
+        parser.add_argument('--attempts', type=int, default=200000)
+        parser.add_argument('--submissions', type=int, default=20000)
+        parser.add_argument('--tasks', type=int, default=200)
+        parser.add_argument('--batch-size', type=int, default=5000, help='Rows per bulk insert')
+        parser.add_argument('--seed', type=int, default=21, help='Random seed, so runs are comparable')
+        parser.add_argument(
+            '--reset',
+            action='store_true',
+            help='Delete existing bench-* data first',
+        )
+        parser.add_argument(
+            '--i-know',
+            action='store_true',
+            help='Seed even though DEBUG is off; only for a throwaway benchmark database',
+        )
+
+    def handle(self, *args, **options):
+        if not settings.DEBUG and not options['i_know']:
+            raise CommandError(
+                'Refusing to seed benchmark data with DEBUG off; pass --i-know if this database is disposable'
+            )
+        if options['reset']:
+            benchmarks.wipe()
+            self.stdout.write('Removed previous benchmark data')
+        elif get_user_model().objects.filter(username=benchmarks.BENCH_USERNAME).exists():
+            raise CommandError('Benchmark data already exists; pass --reset to replace it')
+        if options['tasks'] < 1 or options['lessons'] < 1 or options['users'] < 1:
+            raise CommandError('--users, --lessons and --tasks must be positive')
+        started = time.perf_counter()
+        counts = benchmarks.seed(
+            users=options['users'],
+            lessons=options['lessons'],
+            attempts=options['attempts'],
+            submissions=options['submissions'],
+            tasks=options['tasks'],
+            batch_size=options['batch_size'],
+            rng_seed=options['seed'],
+            log=self.stdout.write,
+        )
+        self.stdout.write(self.style.SUCCESS(
+            'Seeded ' + ', '.join(f'{count} {name}' for name, count in counts.items())
+            + f' in {time.perf_counter() - started:.1f}s'
+        ))
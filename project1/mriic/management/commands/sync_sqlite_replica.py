@@ -0,0 +1,39 @@
+import sqlite3
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS
+
+
+class Command(BaseCommand):
+    help = (
+        'Copy the SQLite primary into the SQLite replica files with the online backup API, '
+        'standing in for replication when trying the read/write router locally'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--database',
+            action='append',
+            help='Replica alias to refresh (repeatable); defaults to every alias in DATABASE_REPLICAS',
+        )
+
+    def handle(self, *args, **options):
+        primary = settings.DATABASES[DEFAULT_DB_ALIAS]
+        if not primary['ENGINE'].endswith('sqlite3'):
+            raise CommandError('The primary database is not SQLite; use the database server\'s own replication')
+        aliases = options['database'] or list(getattr(settings, 'DATABASE_REPLICAS', ()))
+        if not aliases:
+            raise CommandError('No replicas configured; set DATABASE_REPLICA_PATH')
+        for alias in aliases:
+            replica = settings.DATABASES.get(alias)
+            if replica is None or not replica['ENGINE'].endswith('sqlite3'):
+                raise CommandError(f'{alias} is not a SQLite database alias')
+            source = sqlite3.connect(primary['NAME'])
+            target = sqlite3.connect(replica['NAME'])
+            try:
+                source.backup(target)
+            finally:
+                target.close()
+                source.close()
+            self.stdout.write(self.style.SUCCESS(f'Copied {primary["NAME"]} to {alias} ({replica["NAME"]})'))
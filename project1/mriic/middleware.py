@@ -0,0 +1,246 @@
+import json
+import logging
+import random
+import time
+from functools import partial
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.utils.cache import patch_vary_headers
+
+from project1.routers import replica_aliases, track_primary
+
+from . import instrumentation
+from .compression import compress, is_compressible, negotiate, weaken_etag
+
+timing_logger = logging.getLogger('mriic.instrumentation')
+
+
+def _on_event_loop(method):
+    async def hook(*args):
+        return method(*args)
+    return hook
+
+
+class HybridMiddleware:
+    """Base for middleware that runs natively under both WSGI and ASGI, so
+    async views are not pushed through a thread hop by our own layers."""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        return self.handle(request)
+
+    def handle(self, request):
+        raise NotImplementedError
+
+    async def __acall__(self, request):
+        raise NotImplementedError
+
+
+class CompressionMiddleware(HybridMiddleware):
+    """Compress responses on the fly with brotli or gzip above a size threshold.
+
+    Responses that already carry a Content-Encoding are passed through; for
+    cached pages served with their precompressed copy only the ETag is
+    weakened, as for a fresh render.
+    """
+
+    def __init__(self, get_response):
+        super().__init__(get_response)
+        self.min_size = getattr(settings, 'COMPRESSION_MIN_SIZE', 1024)
+
+    def handle(self, request):
+        return self.process_response(request, self.get_response(request))
+
+    async def __acall__(self, request):
+        return self.process_response(request, await self.get_response(request))
+
+    def process_response(self, request, response):
+        if response.has_header('Content-Encoding'):
+            if getattr(response, 'precompressed', False):
+                # Outer view decorators set the ETag from the identity body
+                weaken_etag(response)
+            return response
+        if (
+            response.streaming
+            or response.status_code == 206
+            or len(response.content) < self.min_size
+            or not is_compressible(response.get('Content-Type', ''))
+        ):
+            return response
+        patch_vary_headers(response, ('Accept-Encoding',))
+        encoding = negotiate(request)
+        if encoding is None:
+            return response
+        compressed = compress(response.content, encoding, pad=True)
+        if len(compressed) >= len(response.content):
+            return response
+        response.content = compressed
+        response['Content-Length'] = str(len(compressed))
+        response['Content-Encoding'] = encoding
+        weaken_etag(response)
+        return response
+
+
+class PrimaryStickinessMiddleware(HybridMiddleware):
+    """Read-your-writes for replica routing.
+
+    A request that writes to the primary sets a short-lived cookie; while it
+    is valid that client's reads stay on the primary, so a learner sees their
+    own quiz result even if the replica lags behind.
+    """
+
+    cookie_name = 'primary_pin'
+
+    def __init__(self, get_response):
+        super().__init__(get_response)
+        self.sticky_seconds = getattr(settings, 'REPLICA_STICKY_SECONDS', 15)
+
+    def handle(self, request):
+        if not replica_aliases():
+            return self.get_response(request)
+        with track_primary(pinned=self.pinned(request)) as state:
+            response = self.get_response(request)
+        return self.pin(response, state)
+
+    async def __acall__(self, request):
+        if not replica_aliases():
+            return await self.get_response(request)
+        with track_primary(pinned=self.pinned(request)) as state:
+            response = await self.get_response(request)
+        return self.pin(response, state)
+
+    def pinned(self, request):
+        try:
+            return float(request.COOKIES.get(self.cookie_name, 0)) > time.time()
+        except ValueError:
+            return False
+
+    def pin(self, response, state):
+        if state['wrote']:
+            response.set_cookie(
+                self.cookie_name,
+                str(int(time.time() + self.sticky_seconds)),
+                max_age=self.sticky_seconds,
+                httponly=True,
+                samesite='Lax',
+            )
+        return response
+
+
+class RequestTimingMiddleware(HybridMiddleware):
+    """Time a sample of requests: SQL count and duration on every database,
+    template rendering, the view and the whole request.
+
+    Sampled responses get a ``Server-Timing`` header. Requests slower than
+    SLOW_REQUEST_MS, or that repeat one statement REPEATED_QUERY_THRESHOLD
+    times (an N+1 loop) or run an identical query twice, are logged as JSON
+    to the ``mriic.instrumentation`` logger. Keep it first in MIDDLEWARE.
+    """
+
+    def __init__(self, get_response):
+        super().__init__(get_response)
+        self.sample_rate = getattr(settings, 'REQUEST_TIMING_SAMPLE_RATE', 1.0)
+        self.slow_ms = getattr(settings, 'SLOW_REQUEST_MS', 500)
+        self.repeat_threshold = getattr(settings, 'REPEATED_QUERY_THRESHOLD', 5)
+        self.send_header = getattr(settings, 'SERVER_TIMING_HEADER', True)
+        if self.async_mode:
+            # Coroutine view hooks keep the handler from running them in a thread
+            self.process_view = _on_event_loop(self.process_view)
+            self.process_template_response = _on_event_loop(self.process_template_response)
+
+    def sampled(self):
+        return self.sample_rate and random.random() < self.sample_rate
+
+    def handle(self, request):
+        if not self.sampled():
+            return self.get_response(request)
+        token = instrumentation.start()
+        try:
+            response = self.get_response(request)
+            log = self.report(response, instrumentation.current())
+        finally:
+            instrumentation.stop(token)
+        if log:
+            log(request)
+        return response
+
+    async def __acall__(self, request):
+        if not self.sampled():
+            return await self.get_response(request)
+        # The context, and so the timings, follows the request into the
+        # threads the async ORM runs its queries in
+        token = instrumentation.start()
+        try:
+            response = await self.get_response(request)
+            log = self.report(response, instrumentation.current())
+        finally:
+            instrumentation.stop(token)
+        if log:
+            # Logging may resolve request.user, which queries the database
+            await sync_to_async(log)(request)
+        return response
+
+    def report(self, response, timings):
+        """Add the Server-Timing header; returns a ``log(request)`` callable
+        if the request should be logged."""
+        total_ms = (time.perf_counter() - timings.started) * 1000
+        view_ms = None
+        if timings.view_started is not None:
+            view_ms = ((timings.view_ended or time.perf_counter()) - timings.view_started) * 1000
+        if self.send_header:
+            metrics = [
+                f'db;dur={timings.db_time * 1000:.1f};desc="{timings.queries} queries"',
+                f'tpl;dur={timings.template_time * 1000:.1f}',
+            ]
+            if view_ms is not None:
+                metrics.append(f'view;dur={view_ms:.1f}')
+            metrics.append(f'total;dur={total_ms:.1f}')
+            response['Server-Timing'] = ', '.join(metrics)
+        n_plus_one, duplicates = timings.repeated_statements(self.repeat_threshold)
+        if total_ms >= self.slow_ms or n_plus_one or duplicates:
+            return partial(self.log, response=response, timings=timings, total_ms=total_ms, view_ms=view_ms,
+                           n_plus_one=n_plus_one, duplicates=duplicates)
+        return None
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        timings = instrumentation.current()
+        if timings is not None:
+            timings.view_started = time.perf_counter()
+
+    def process_template_response(self, request, response):
+        # TemplateResponse renders after the view returns; stop the view clock here
+        timings = instrumentation.current()
+        if timings is not None and timings.view_started is not None:
+            timings.view_ended = time.perf_counter()
+        return response
+
+    def log(self, request, response, timings, total_ms, view_ms, n_plus_one, duplicates):
+        match = request.resolver_match
+        record = {
+            'method': request.method,
+            'path': request.path,
+            'view': match.view_name if match else None,
+            'status': response.status_code,
+            'user': request.user.pk if getattr(request, 'user', None) and request.user.is_authenticated else None,
+            'total_ms': round(total_ms, 1),
+            'view_ms': round(view_ms, 1) if view_ms is not None else None,
+            'db_ms': round(timings.db_time * 1000, 1),
+            'template_ms': round(timings.template_time * 1000, 1),
+            'queries': timings.queries,
+            'slow': total_ms >= self.slow_ms,
+            'n_plus_one': [dict(entry, sql=entry['sql'][:500]) for entry in n_plus_one[:5]],
+            'duplicates': [dict(entry, sql=entry['sql'][:500], params=entry['params'][:200]) for entry in duplicates[:5]],
+        }
+        level = logging.WARNING if record['slow'] or n_plus_one else logging.INFO
+        timing_logger.log(level, json.dumps(record), extra={'timing': record})
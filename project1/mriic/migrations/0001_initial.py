@@ -0,0 +1,36 @@
+# Generated by Django 5.2.6 on 2026-10-18 11:03
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='GameScore',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('game_number', models.PositiveSmallIntegerField()),
+                ('score', models.IntegerField(blank=True, help_text='Raw in-game score, kept for analytics', null=True)),
+                ('points', models.PositiveIntegerField(help_text='Eco points awarded, capped by the game registry')),
+                ('idempotency_key', models.CharField(max_length=64)),
+                ('played_at', models.DateTimeField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('credited_at', models.DateTimeField(blank=True, null=True)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='game_scores', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'ordering': ['-played_at'],
+                'indexes': [models.Index(condition=models.Q(('credited_at__isnull', True)), fields=['id'], name='gamescore_uncredited_idx')],
+                'unique_together': {('user', 'idempotency_key')},
+            },
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.6 on 2026-10-18 11:49
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('mriic', '0002_shared_cache_table'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='gamescore',
+            index=models.Index(fields=['user', 'game_number', 'created_at'], name='gamescore_user_game_day_idx'),
+        ),
+    ]
@@ -1,3 +1,28 @@
 from django.db import models
+from django.contrib.auth import get_user_model
 
-# Create your models here.
+User = get_user_model()
+
+
+class GameScore(models.Model):
+    """One reported play of a game; points are credited later in aggregated batches."""
+    user = models.ForeignKey(User, related_name='game_scores', on_delete=models.CASCADE)
+    game_number = models.PositiveSmallIntegerField()
+    score = models.IntegerField(null=True, blank=True, help_text='Raw in-game score, kept for analytics')
+    points = models.PositiveIntegerField(help_text='Eco points awarded, capped by the game registry')
+    idempotency_key = models.CharField(max_length=64)
+    played_at = models.DateTimeField()
+    created_at = models.DateTimeField(auto_now_add=True)
+    credited_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        unique_together = ('user', 'idempotency_key')
+        ordering = ['-played_at']
+        indexes = [
+            models.Index(fields=['id'], condition=models.Q(credited_at__isnull=True), name='gamescore_uncredited_idx'),
+            # Daily play limit per game
+            models.Index(fields=['user', 'game_number', 'created_at'], name='gamescore_user_game_day_idx'),
+        ]
+
+    def __str__(self):
+        return f"Game {self.game_number} by {self.user_id}: {self.points} pts"
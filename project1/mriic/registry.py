@@ -0,0 +1,128 @@
+import hashlib
+import json
+
+# Server-side registry of the playable games. The catalog page renders it and
+# the score API validates submitted plays against it.
+GAMES = [
+    {
+        'number': 1,
+        'name': 'Ozone Defender',
+        'description': 'Defend Earth\'s atmosphere by shooting down harmful greenhouse gases. Protect our ozone layer from depletion!',
+        'duration': '8-12 min',
+        'difficulty': 'Medium',
+        'points': 500,
+        'icon': 'bi-shield-exclamation',
+    },
+    {
+        'number': 2,
+        'name': 'Albatross Ocean Foraging',
+        'description': 'Guide an albatross through the ocean, collecting fish while avoiding plastic waste. Learn about marine ecosystem challenges.',
+        'duration': '5-8 min',
+        'difficulty': 'Easy',
+        'points': 300,
+        'icon': 'bi-water',
+    },
+    {
+        'number': 3,
+        'name': 'Ocean Cleanup Adventure',
+        'description': 'Navigate underwater depths to collect marine debris and rescue sea creatures from pollution. Make a real difference for our oceans!',
+        'duration': '10-15 min',
+        'difficulty': 'Hard',
+        'points': 600,
+        'icon': 'bi-droplet',
+    },
+    {
+        'number': 4,
+        'name': 'EcoSort 3D',
+        'description': 'Sort recyclable materials on a conveyor belt in this 3D puzzle game. Master the art of waste management and recycling!',
+        'duration': '6-10 min',
+        'difficulty': 'Medium',
+        'points': 400,
+        'icon': 'bi-box-seam',
+    },
+    {
+        'number': 5,
+        'name': 'Forest Guardian',
+        'description': 'Explore a beautiful 3D forest environment to rescue trapped animals and clean up environmental hazards. Be the guardian nature needs!',
+        'duration': '12-18 min',
+        'difficulty': 'Hard',
+        'points': 700,
+        'icon': 'bi-tree',
+    },
+    {
+        'number': 6,
+        'name': 'Farm Flow',
+        'description': 'Connect pipes to deliver water to farms in this engaging puzzle game. Learn about sustainable agriculture and water management.',
+        'duration': '5-7 min',
+        'difficulty': 'Easy',
+        'points': 250,
+        'icon': 'bi-flower1',
+    },
+    {
+        'number': 7,
+        'name': 'Environmental Quiz',
+        'description': 'Test your environmental knowledge with challenging questions. Learn fascinating facts about sustainability and climate action!',
+        'duration': '3-5 min',
+        'difficulty': 'Easy',
+        'points': 200,
+        'icon': 'bi-question-circle',
+        'is_quiz': True,
+    },
+    {
+        'number': 8,
+        'name': 'Pet Care Clinic',
+        'description': 'Care for adorable virtual pets by matching their needs with appropriate items. Learn responsibility and animal welfare!',
+        'duration': '4-6 min',
+        'difficulty': 'Easy',
+        'points': 350,
+        'icon': 'bi-heart-pulse',
+    },
+    {
+        'number': 9,
+        'name': 'Eco Challenge Master',
+        'description': 'Complete daily eco-challenges and earn badges for sustainable living. Track your environmental impact and compete with friends!',
+        'duration': '10-20 min',
+        'difficulty': 'Medium',
+        'points': 550,
+        'icon': 'bi-lightning-charge',
+    },
+]
+
+DIFFICULTY_ORDER = {'Easy': 0, 'Medium': 1, 'Hard': 2}
+
+
+def template_for(number):
+    return f'mriic/game{number}.html'
+
+
+def _catalog_entry(game):
+    return {
+        'number': game['number'],
+        'name': game['name'],
+        'description': game['description'],
+        'duration': game['duration'],
+        'difficulty': game['difficulty'],
+        'points': game['points'],
+        'icon': game['icon'],
+        'is_quiz': game.get('is_quiz', False),
+        'url_name': 'game_play',
+        'image': f'/static/images/game{game["number"]}.png',
+        'fallback_image': f'https://picsum.photos/seed/ecoverse-game-{game["number"]}/800/450',
+        'template': template_for(game['number']),
+    }
+
+
+def _catalog_order(game):
+    # Regular games from Easy to Hard, the quiz game last
+    return (game.get('is_quiz', False), DIFFICULTY_ORDER.get(game['difficulty'], 999), game['number'])
+
+
+# Built once at import; views hand this straight to the template
+CATALOG = tuple(_catalog_entry(game) for game in sorted(GAMES, key=_catalog_order))
+CATALOG_VERSION = hashlib.sha1(json.dumps(CATALOG, sort_keys=True).encode()).hexdigest()[:12]
+
+GAMES_BY_NUMBER = {game['number']: game for game in GAMES}
+
+
+def get_game(number):
+    return GAMES_BY_NUMBER.get(number)
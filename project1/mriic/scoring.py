@@ -0,0 +1,193 @@
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from functools import partial
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import connections, transaction
+from django.db.models import Count
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from learning.models import PointsLedger
+from learning.points import award_points_bulk
+
+from .models import GameScore
+from .registry import get_game
+
+MAX_EVENTS_PER_BATCH = 50
+MAX_CLOCK_SKEW = timedelta(minutes=5)
+
+logger = logging.getLogger(__name__)
+
+
+class InvalidScoreEvent(ValueError):
+    pass
+
+
+def clean_event(event, now):
+    """Validate one reported play against the game registry."""
+    if not isinstance(event, dict):
+        raise InvalidScoreEvent('Event must be an object')
+    try:
+        game = get_game(int(event.get('game')))
+    except (TypeError, ValueError):
+        game = None
+    if game is None:
+        raise InvalidScoreEvent('Unknown game')
+    key = str(event.get('key') or '').strip()
+    if not key or len(key) > 64:
+        raise InvalidScoreEvent('key must be 1-64 characters')
+    try:
+        points = int(event.get('points', 0))
+        score = int(event['score']) if event.get('score') is not None else None
+    except (TypeError, ValueError):
+        raise InvalidScoreEvent('points and score must be integers')
+    if points < 0 or points > game['points']:
+        raise InvalidScoreEvent(f"points must be between 0 and {game['points']}")
+    played_at = parse_datetime(str(event.get('played_at') or '')) or now
+    if timezone.is_naive(played_at):
+        played_at = timezone.make_aware(played_at)
+    if played_at > now + MAX_CLOCK_SKEW:
+        played_at = now
+    return {
+        'game_number': game['number'],
+        'score': score,
+        'points': points,
+        'idempotency_key': key,
+        'played_at': played_at,
+    }
+
+
+def daily_play_limit():
+    return getattr(settings, 'GAME_DAILY_PLAY_LIMIT', 20)
+
+
+def plays_today(user, game_numbers, now):
+    """``{game_number: plays stored since local midnight}``, by server time;
+    the reported played_at is the client's word and is not used."""
+    midnight = timezone.localtime(now).replace(hour=0, minute=0, second=0, microsecond=0)
+    return dict(
+        GameScore.objects.filter(user=user, game_number__in=game_numbers, created_at__gte=midnight)
+        .values_list('game_number').annotate(plays=Count('id')).values_list('game_number', 'plays')
+    )
+
+
+def record_scores(user, events):
+    """Store a batch of plays with one INSERT; already seen idempotency keys are skipped.
+
+    New plays beyond GAME_DAILY_PLAY_LIMIT for a game are rejected. Points are
+    not credited here; the write-behind buffer does that in bulk.
+    """
+    now = timezone.now()
+    cleaned, rejected = {}, []
+    for index, event in enumerate(events):
+        try:
+            data = clean_event(event, now)
+        except InvalidScoreEvent as exc:
+            rejected.append({'index': index, 'error': str(exc)})
+            continue
+        cleaned.setdefault(data['idempotency_key'], (index, data))
+    with transaction.atomic():
+        # Concurrent batches from the same learner take turns, so both cannot
+        # pass the daily limit check
+        get_user_model().objects.select_for_update().filter(pk=user.pk).exists()
+        seen = set(
+            GameScore.objects.filter(user=user, idempotency_key__in=list(cleaned))
+            .values_list('idempotency_key', flat=True)
+        )
+        fresh = [(index, data) for key, (index, data) in cleaned.items() if key not in seen]
+        plays = plays_today(user, {data['game_number'] for _, data in fresh}, now)
+        new_scores = []
+        for index, data in fresh:
+            if plays.get(data['game_number'], 0) >= daily_play_limit():
+                rejected.append({'index': index, 'error': 'Daily play limit reached for this game'})
+                continue
+            plays[data['game_number']] = plays.get(data['game_number'], 0) + 1
+            new_scores.append(GameScore(user=user, **data))
+        GameScore.objects.bulk_create(new_scores, ignore_conflicts=True)
+        if new_scores:
+            points_buffer.note(len(new_scores))
+    rejected.sort(key=lambda item: item['index'])
+    return {
+        'accepted': len(new_scores),
+        'duplicates': len(events) - len(rejected) - len(new_scores),
+        'rejected': rejected,
+    }
+
+
+def flush_pending_scores(batch_size=500, max_batches=None):
+    """Credit uncredited plays, one transaction per batch.
+
+    Each batch inserts its ledger rows in bulk and applies one aggregated
+    increment per user. Returns the number of plays credited.
+    """
+    credited = batches = 0
+    while max_batches is None or batches < max_batches:
+        with transaction.atomic():
+            rows = list(
+                GameScore.objects.filter(credited_at__isnull=True)
+                .select_for_update(skip_locked=True)
+                .order_by('id')
+                .values_list('id', 'user_id', 'points')[:batch_size]
+            )
+            if not rows:
+                break
+            award_points_bulk(
+                (user_id, points, PointsLedger.SOURCE_GAME, score_id)
+                for score_id, user_id, points in rows if points
+            )
+            GameScore.objects.filter(id__in=[score_id for score_id, _, _ in rows]).update(credited_at=timezone.now())
+        credited += len(rows)
+        batches += 1
+    return credited
+
+
+# One flush at a time per process, off the request thread
+_flusher = ThreadPoolExecutor(max_workers=1, thread_name_prefix='game-points')
+
+
+def _flush_in_background(max_batches):
+    try:
+        flush_pending_scores(max_batches=max_batches)
+    except Exception:
+        logger.exception('Crediting game points failed; flush_game_points will pick the plays up')
+    finally:
+        connections.close_all()
+
+
+class WriteBehindBuffer:
+    """Counts plays stored since the last flush and flushes once enough have piled up.
+
+    The flush runs on a background thread after the storing transaction
+    commits, so the request that crosses the threshold does not wait for it.
+    The rows themselves live in the database, so nothing is lost if a worker
+    dies before flushing; ``flush_game_points`` picks up whatever is left.
+    """
+
+    def __init__(self, threshold, interval, max_batches=4):
+        self.threshold = threshold
+        self.interval = interval
+        self.max_batches = max_batches
+        self.pending = 0
+        self.last_flush = time.monotonic()
+        self.lock = threading.Lock()
+
+    def note(self, count):
+        with self.lock:
+            self.pending += count
+            now = time.monotonic()
+            due = self.pending >= self.threshold or now - self.last_flush >= self.interval
+            if due:
+                self.pending = 0
+                self.last_flush = now
+        if due:
+            transaction.on_commit(partial(_flusher.submit, _flush_in_background, self.max_batches))
+
+
+points_buffer = WriteBehindBuffer(
+    threshold=getattr(settings, 'GAME_POINTS_FLUSH_THRESHOLD', 200),
+    interval=getattr(settings, 'GAME_POINTS_FLUSH_INTERVAL', 30),
+)
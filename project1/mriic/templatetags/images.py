@@ -0,0 +1,31 @@
+from django import template
+
+from mriic.images import CONTENT_TYPES, derivative_formats, srcset
+
+register = template.Library()
+
+
+@register.inclusion_tag('mriic/picture.html')
+def picture(image, alt='', css_class='', sizes='100vw', fallback=''):
+    """<picture> with AVIF/WebP sources from the derivative manifest and the original as <img>.
+
+    ``image`` is an ImageField file or a /static/ URL.
+    """
+    sources = []
+    for fmt in derivative_formats():
+        value = srcset(image, fmt)
+        if value:
+            sources.append({'type': CONTENT_TYPES[fmt], 'srcset': value})
+    return {
+        'url': getattr(image, 'url', image),
+        'sources': sources,
+        'alt': alt,
+        'css_class': css_class,
+        'sizes': sizes,
+        'fallback': fallback,
+    }
+
+
+@register.filter(name='srcset')
+def srcset_filter(image, fmt='webp'):
+    return srcset(image, fmt)
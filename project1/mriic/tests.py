@@ -1,3 +1,306 @@
-from django.test import TestCase
+import asyncio
+import json
+import tempfile
+import threading
+import time
+from io import StringIO
+from unittest import mock
 
-# Create your tests here.
+from django.contrib import messages
+from django.contrib.auth import get_user_model
+from django.core.cache import caches
+from django.core.cache.backends.db import DatabaseCache
+from django.core.cache.utils import make_template_fragment_key
+from django.core.management import CommandError, call_command
+from django.db.models import Sum
+from django.http import HttpResponse
+from django.shortcuts import render
+from django.test import RequestFactory, TestCase, TransactionTestCase, override_settings
+from django.urls import reverse
+from learning.models import LeaderboardEntry, Lesson, PointsLedger, UserProgress
+from project1.routers import PrimaryReplicaRouter, replica_reads
+
+from .benchmarks import BENCH_USERNAME
+from .caching import cache_version, invalidate_pages
+from .images import DerivativeManifest
+from .middleware import PrimaryStickinessMiddleware
+from .models import GameScore
+from .registry import CATALOG, GAMES, get_game
+from .scoring import WriteBehindBuffer, flush_pending_scores, record_scores
+
+User = get_user_model()
+
+
+def plays(game, count, start=0, points=100):
+    return [{'game': game, 'points': points, 'key': f'play-{game}-{n}'} for n in range(start, start + count)]
+
+
+@override_settings(GAME_DAILY_PLAY_LIMIT=3)
+class GameScoreLimitTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create(username='player')
+
+    def test_plays_over_the_daily_limit_are_rejected(self):
+        result = record_scores(self.user, plays(1, 5))
+        self.assertEqual(result['accepted'], 3)
+        self.assertEqual([item['index'] for item in result['rejected']], [3, 4])
+        self.assertEqual(GameScore.objects.filter(user=self.user, game_number=1).count(), 3)
+
+    def test_limit_spans_batches_and_is_per_game(self):
+        record_scores(self.user, plays(1, 2))
+        result = record_scores(self.user, plays(1, 2, start=2) + plays(2, 2))
+        self.assertEqual(result['accepted'], 3)
+        self.assertEqual(result['rejected'], [{'index': 1, 'error': 'Daily play limit reached for this game'}])
+
+    def test_replayed_keys_do_not_count_against_the_limit(self):
+        record_scores(self.user, plays(1, 3))
+        result = record_scores(self.user, plays(1, 3))
+        self.assertEqual((result['accepted'], result['duplicates'], result['rejected']), (0, 3, []))
+
+    def test_backdated_plays_still_count_today(self):
+        events = [dict(event, played_at='2020-01-01T10:00:00Z') for event in plays(1, 4)]
+        self.assertEqual(record_scores(self.user, events)['accepted'], 3)
+
+
+class WriteBehindTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create(username='player')
+
+    def test_flush_waits_for_commit(self):
+        buffer = WriteBehindBuffer(threshold=2, interval=3600)
+        with self.captureOnCommitCallbacks() as callbacks:
+            buffer.note(1)
+            self.assertEqual(callbacks, [])
+            buffer.note(1)
+        self.assertEqual(len(callbacks), 1)
+        self.assertEqual(buffer.pending, 0)
+
+    def test_flush_credits_each_play_once(self):
+        record_scores(self.user, plays(1, 2, points=120) + plays(2, 1, points=60))
+        self.assertEqual(flush_pending_scores(), 3)
+        self.assertEqual(flush_pending_scores(), 0)
+        self.assertEqual(UserProgress.objects.get(user=self.user).total_points, 300)
+        self.assertFalse(GameScore.objects.filter(credited_at__isnull=True).exists())
+
+
+class GameRegistryTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create(username='player')
+
+    def test_catalog_runs_easy_to_hard_with_the_quiz_last(self):
+        order = {'Easy': 0, 'Medium': 1, 'Hard': 2}
+        regular = [game for game in CATALOG if not game['is_quiz']]
+        self.assertEqual(len(CATALOG), len(GAMES))
+        self.assertTrue(CATALOG[-1]['is_quiz'])
+        self.assertEqual(regular, sorted(regular, key=lambda game: (order[game['difficulty']], game['number'])))
+        self.assertEqual(get_game(4)['name'], 'EcoSort 3D')
+        self.assertIsNone(get_game(len(GAMES) + 1))
+
+    def test_unknown_game_is_a_404(self):
+        self.assertEqual(self.client.get(reverse('game_play', args=[len(GAMES) + 1])).status_code, 404)
+
+    def test_repeat_visits_get_304(self):
+        for url in (reverse('games'), reverse('game_play', args=[3])):
+            with self.subTest(url=url):
+                first = self.client.get(url)
+                self.assertEqual(first.status_code, 200)
+                self.assertIn('Last-Modified', first)
+                self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=first['ETag']).status_code, 304)
+                self.assertEqual(self.client.get(url, HTTP_IF_MODIFIED_SINCE=first['Last-Modified']).status_code, 304)
+
+    def test_catalog_validator_varies_with_the_viewer(self):
+        anonymous = self.client.get(reverse('games'))['ETag']
+        self.client.force_login(self.user)
+        response = self.client.get(reverse('games'), HTTP_IF_NONE_MATCH=anonymous)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], anonymous)
+
+
+LOCMEM_CACHES = {
+    'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'},
+    'shared': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'shared'},
+    'pages': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'pages'},
+}
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class PageCacheTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create(username='visitor')
+
+    def setUp(self):
+        caches['pages'].clear()
+        patcher = mock.patch('mriic.views.render', wraps=render)
+        self.render = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_anonymous_pages_render_once(self):
+        first = self.client.get(reverse('home'))
+        second = self.client.get(reverse('home'))
+        self.assertEqual(self.render.call_count, 1)
+        self.assertEqual(second.content, first.content)
+        self.assertIn('Cookie', second['Vary'])
+
+    def test_invalidate_pages_renders_again(self):
+        self.client.get(reverse('about'))
+        invalidate_pages()
+        self.client.get(reverse('about'))
+        self.assertEqual(self.render.call_count, 2)
+
+    def test_logged_in_pages_render_fresh_around_cached_fragments(self):
+        self.client.force_login(self.user)
+        self.client.get(reverse('home'))
+        response = self.client.get(reverse('home'))
+        self.assertEqual(self.render.call_count, 2)
+        self.assertContains(response, 'visitor')
+        for fragment in ('hero', 'footer'):
+            key = make_template_fragment_key(fragment, [cache_version()])
+            self.assertIsNotNone(caches['pages'].get(key), fragment)
+
+    def test_flash_messages_are_never_cached(self):
+        self.client.get(reverse('home'))
+        with mock.patch('mriic.caching.get_messages', return_value=[messages.Message(messages.INFO, 'Saved')]):
+            self.client.get(reverse('home'))
+        self.assertEqual(self.render.call_count, 2)
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class CachedPageEncodingTests(TestCase):
+    def test_cached_encoded_copy_has_the_same_validator_as_a_fresh_render(self):
+        url = reverse('game_play', args=[1])
+        fresh = self.client.get(url, HTTP_ACCEPT_ENCODING='gzip')
+        cached = self.client.get(url, HTTP_ACCEPT_ENCODING='gzip')
+        self.assertEqual(fresh['Content-Encoding'], 'gzip')
+        self.assertEqual(cached['Content-Encoding'], 'gzip')
+        self.assertTrue(fresh['ETag'].startswith('W/"'))
+        self.assertEqual(cached['ETag'], fresh['ETag'])
+        identity = self.client.get(url)
+        self.assertNotIn('Content-Encoding', identity)
+        self.assertEqual('W/' + identity['ETag'], cached['ETag'])
+        revalidated = self.client.get(url, HTTP_ACCEPT_ENCODING='gzip', HTTP_IF_NONE_MATCH=cached['ETag'])
+        self.assertEqual(revalidated.status_code, 304)
+
+
+class SeedBenchmarkTests(TestCase):
+    def seed(self, **options):
+        call_command('seed_benchmark', users=5, lessons=2, attempts=10, submissions=5, tasks=2, stdout=StringIO(),
+                     **options)
+
+    def test_refuses_without_debug(self):
+        with self.assertRaisesMessage(CommandError, '--i-know'):
+            self.seed()
+        self.assertFalse(User.objects.exists())
+
+    def test_points_go_through_the_ledger(self):
+        self.seed(i_know=True)
+        admin = User.objects.get(username=BENCH_USERNAME)
+        self.assertEqual((admin.is_staff, admin.is_superuser, admin.has_usable_password()), (True, False, False))
+        ledger = dict(PointsLedger.objects.values_list('user').annotate(total=Sum('delta')))
+        self.assertEqual(len(ledger), 6)
+        self.assertEqual(dict(UserProgress.objects.values_list('user', 'total_points')), ledger)
+        self.assertEqual(
+            dict(LeaderboardEntry.objects.filter(board=LeaderboardEntry.BOARD_GLOBAL).values_list('user', 'points')),
+            ledger,
+        )
+
+
+@override_settings(DATABASE_REPLICAS=['replica'], REPLICA_STICKY_SECONDS=15)
+class PrimaryStickinessTests(TransactionTestCase):
+    """The router only picks the alias here; no query reaches "replica".
+
+    Not a TestCase: reads inside its wrapping transaction always stay on the
+    primary.
+    """
+
+    def serve(self, work=lambda: None, **cookies):
+        routed = []
+
+        def view(request):
+            work()
+            with replica_reads():
+                routed.append(PrimaryReplicaRouter().db_for_read(Lesson))
+            return HttpResponse()
+
+        request = RequestFactory().get('/')
+        request.COOKIES.update(cookies)
+        response = PrimaryStickinessMiddleware(view)(request)
+        return routed[0], response.cookies.get(PrimaryStickinessMiddleware.cookie_name)
+
+    def test_a_write_pins_the_client_for_its_next_reads(self):
+        routed, pin = self.serve(lambda: Lesson.objects.create(title='Soil', slug='soil', short_description=''))
+        # Reads later in the same request follow the write to the primary too
+        self.assertEqual(routed, 'default')
+        self.assertEqual(pin['max-age'], 15)
+        routed, _ = self.serve(primary_pin=pin.value)
+        self.assertEqual(routed, 'default')
+
+    def test_reads_return_to_the_replica_once_the_pin_expires(self):
+        self.assertEqual(self.serve(primary_pin=str(int(time.time()) - 1))[0], 'replica')
+        self.assertEqual(self.serve(primary_pin='garbage')[0], 'replica')
+        self.assertEqual(self.serve()[0], 'replica')
+
+    def test_shared_cache_writes_do_not_pin(self):
+        shared = DatabaseCache('mriic_shared_cache', {})
+        routed, pin = self.serve(lambda: shared.set('autosave', {'question_1': '2'}))
+        self.assertEqual(routed, 'replica')
+        self.assertIsNone(pin)
+        self.assertEqual(shared.get('autosave'), {'question_1': '2'})
+
+
+@override_settings(REQUEST_TIMING_SAMPLE_RATE=1.0, SERVER_TIMING_HEADER=True)
+class RequestTimingTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create(username='learner')
+        Lesson.objects.create(title='Soil', slug='soil', short_description='')
+
+    def queries(self, response):
+        return response['Server-Timing'].split('desc="')[1].split(' ')[0]
+
+    async def test_concurrent_async_requests_count_only_their_own_queries(self):
+        await self.async_client.aforce_login(self.user)
+        url = reverse('learning:lesson_detail', args=['soil'])
+        await self.async_client.get(url)  # warm the shared cache
+        alone = self.queries(await self.async_client.get(url))
+        responses = await asyncio.gather(*(self.async_client.get(url) for _ in range(8)))
+        self.assertEqual([self.queries(response) for response in responses], [alone] * 8)
+
+
+    @override_settings(SLOW_REQUEST_MS=0)
+    def test_timed_requests_are_logged_with_their_fields_and_duration(self):
+        self.client.force_login(self.user)
+        with self.assertLogs('mriic.instrumentation', 'INFO') as logs:
+            response = self.client.get(reverse('learning:lesson_detail', args=['soil']))
+        [record] = logs.records
+        timing = record.timing
+        self.assertEqual(json.loads(record.getMessage()), timing)
+        self.assertEqual(record.levelname, 'WARNING')
+        self.assertEqual(
+            {key: timing[key] for key in ('method', 'path', 'view', 'status', 'user', 'slow')},
+            {'method': 'GET', 'path': '/learn/lessons/soil/', 'view': 'learning:lesson_detail', 'status': 200,
+             'user': self.user.pk, 'slow': True},
+        )
+        self.assertGreater(timing['total_ms'], 0)
+        self.assertGreaterEqual(timing['total_ms'], timing['view_ms'])
+        self.assertEqual(str(timing['queries']), self.queries(response))
+
+class DerivativeManifestTests(TestCase):
+    def test_concurrent_writers_keep_each_others_entries(self):
+        # Separate instances stand in for separate worker processes
+        with tempfile.TemporaryDirectory() as root, override_settings(MEDIA_ROOT=root):
+            writers = [DerivativeManifest() for _ in range(4)]
+
+            def write(number, manifest):
+                for n in range(25):
+                    manifest.update({f'photo-{number}-{n}.jpg': [{'width': 320}]})
+
+            threads = [threading.Thread(target=write, args=pair) for pair in enumerate(writers)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            self.assertEqual(len(DerivativeManifest().load()), 100)
@@ -0,0 +1,30 @@
+# Async views must not leave anything for the template to load lazily: a
+# query from the event loop raises SynchronousOnlyOperation. load_viewer
+# resolves what every page needs about the visitor (the user, their session
+# and the progress row the navbar shows) through the async ORM up front, along
+# with the cache version the templates key their fragments on.
+from functools import wraps
+
+from .caching import acache_version
+
+
+async def aload_viewer(request):
+    from learning.models import UserProgress
+
+    user = await request.auser()
+    if user.is_authenticated:
+        progress = await UserProgress.objects.select_related('current_level').filter(user=user).afirst()
+        # Cached even when missing, so {% if user.progress %} stays off the database
+        type(user).progress.related.set_cached_value(user, progress)
+    request.user = user
+    await acache_version(request)
+    return user
+
+
+def load_viewer(view_func):
+    """Decorator for async views that render the site chrome; apply it outermost."""
+    @wraps(view_func)
+    async def wrapper(request, *args, **kwargs):
+        await aload_viewer(request)
+        return await view_func(request, *args, **kwargs)
+    return wrapper
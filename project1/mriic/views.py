@@ -1,10 +1,28 @@
+import hashlib
+import json
+import os
+from datetime import datetime, timezone
+from functools import lru_cache
+
 from django.shortcuts import render
-from django.http import Http404
+from django.http import Http404, JsonResponse
+from django.contrib.messages import get_messages
+from django.template.loader import get_template
+from django.views.decorators.http import condition, require_POST
+from . import images
+from .caching import cached_page
+from .registry import CATALOG, CATALOG_VERSION, get_game, template_for
+from .scoring import MAX_EVENTS_PER_BATCH, record_scores
+from .viewer import load_viewer
+
+CATALOG_TEMPLATES = ('mriic/games.html', 'mriic/base.html', 'mriic/navbar.html', 'mriic/footer.html')
 
 # Create your views here.
+@cached_page
 def home(request):
     return render(request, 'mriic/home.html')
 
+@cached_page
 def about(request):
     return render(request, 'mriic/about.html')
 
@@ -15,137 +33,88 @@ def game2(request):
     return render(request, 'mriic/game2.html', {'title': 'EcoVerse 3D Mini Game'})
 
 
-def games(request):
-    # Actual game data with descriptions and details
-    games_data = [
-        {
-            'number': 1,
-            'name': 'Ozone Defender',
-            'description': 'Defend Earth\'s atmosphere by shooting down harmful greenhouse gases. Protect our ozone layer from depletion!',
-            'duration': '8-12 min',
-            'difficulty': 'Medium',
-            'points': 500,
-            'icon': 'bi-shield-exclamation',
-        },
-        {
-            'number': 2,
-            'name': 'Albatross Ocean Foraging',
-            'description': 'Guide an albatross through the ocean, collecting fish while avoiding plastic waste. Learn about marine ecosystem challenges.',
-            'duration': '5-8 min',
-            'difficulty': 'Easy',
-            'points': 300,
-            'icon': 'bi-water',
-        },
-        {
-            'number': 3,
-            'name': 'Ocean Cleanup Adventure',
-            'description': 'Navigate underwater depths to collect marine debris and rescue sea creatures from pollution. Make a real difference for our oceans!',
-            'duration': '10-15 min',
-            'difficulty': 'Hard',
-            'points': 600,
-            'icon': 'bi-droplet',
-        },
-        {
-            'number': 4,
-            'name': 'EcoSort 3D',
-            'description': 'Sort recyclable materials on a conveyor belt in this 3D puzzle game. Master the art of waste management and recycling!',
-            'duration': '6-10 min',
-            'difficulty': 'Medium',
-            'points': 400,
-            'icon': 'bi-box-seam',
-        },
-        {
-            'number': 5,
-            'name': 'Forest Guardian',
-            'description': 'Explore a beautiful 3D forest environment to rescue trapped animals and clean up environmental hazards. Be the guardian nature needs!',
-            'duration': '12-18 min',
-            'difficulty': 'Hard',
-            'points': 700,
-            'icon': 'bi-tree',
-        },
-        {
-            'number': 6,
-            'name': 'Farm Flow',
-            'description': 'Connect pipes to deliver water to farms in this engaging puzzle game. Learn about sustainable agriculture and water management.',
-            'duration': '5-7 min',
-            'difficulty': 'Easy',
-            'points': 250,
-            'icon': 'bi-flower1',
-        },
-        {
-            'number': 7,
-            'name': 'Environmental Quiz',
-            'description': 'Test your environmental knowledge with challenging questions. Learn fascinating facts about sustainability and climate action!',
-            'duration': '3-5 min',
-            'difficulty': 'Easy',
-            'points': 200,
-            'icon': 'bi-question-circle',
-            'is_quiz': True,
-        },
-        {
-            'number': 8,
-            'name': 'Pet Care Clinic',
-            'description': 'Care for adorable virtual pets by matching their needs with appropriate items. Learn responsibility and animal welfare!',
-            'duration': '4-6 min',
-            'difficulty': 'Easy',
-            'points': 350,
-            'icon': 'bi-heart-pulse',
-        },
-        {
-            'number': 9,
-            'name': 'Eco Challenge Master',
-            'description': 'Complete daily eco-challenges and earn badges for sustainable living. Track your environmental impact and compete with friends!',
-            'duration': '10-20 min',
-            'difficulty': 'Medium',
-            'points': 550,
-            'icon': 'bi-lightning-charge',
-        },
-    ]
-    
-    # Separate quiz from regular games and sort by difficulty
-    quiz_game = None
-    regular_games = []
-    
-    for game in games_data:
-        if game.get('is_quiz', False):
-            quiz_game = game
-        else:
-            regular_games.append(game)
-    
-    # Sort regular games by difficulty: Easy -> Medium -> Hard
-    difficulty_order = {'Easy': 0, 'Medium': 1, 'Hard': 2}
-    regular_games.sort(key=lambda x: (difficulty_order.get(x['difficulty'], 999), x['number']))
-    
-    # Add quiz back to the end if it exists
-    if quiz_game:
-        regular_games.append(quiz_game)
-    
-    games_list = []
-    for game in regular_games:
-        local_img = f'/static/images/game{game["number"]}.png'
-        fallback_img = f'https://picsum.photos/seed/ecoverse-game-{game["number"]}/800/450'
-        
-        games_list.append({
-            'number': game['number'],
-            'name': game['name'],
-            'description': game['description'],
-            'duration': game['duration'],
-            'difficulty': game['difficulty'],
-            'points': game['points'],
-            'icon': game['icon'],
-            'is_quiz': game.get('is_quiz', False),
-            'url_name': 'game_play',
-            'image': local_img,
-            'fallback_image': fallback_img,
-            'template': f'mriic/game{game["number"]}.html',
-        })
-    
-    return render(request, 'mriic/games.html', {'games': games_list})
-
-
-def game_play(request, number: int):
-    if number < 1 or number > 9:
+@lru_cache(maxsize=None)
+def _template_path(name):
+    return get_template(name).origin.name
+
+
+def _template_stamp(*template_names):
+    """(latest mtime, etag fragment) of the template files a page is rendered from."""
+    stats = [os.stat(_template_path(name)) for name in template_names]
+    latest = max(stat.st_mtime for stat in stats)
+    stamp = '-'.join(f'{stat.st_mtime_ns:x}{stat.st_size:x}' for stat in stats)
+    return latest, hashlib.sha1(stamp.encode()).hexdigest()[:16]
+
+
+def _viewer_tag(request):
+    # The navbar differs per user, so the validator has to as well
+    return f'u{request.user.pk}' if request.user.is_authenticated else 'anon'
+
+
+def _has_pending_messages(request):
+    # len() does not mark messages as consumed, unlike iterating them
+    return len(get_messages(request)) > 0
+
+
+def games_etag(request):
+    if _has_pending_messages(request):
+        return None
+    _, stamp = _template_stamp(*CATALOG_TEMPLATES)
+    return f'"games-{CATALOG_VERSION}-{stamp}-{images.manifest.version():x}-{_viewer_tag(request)}"'
+
+
+def games_last_modified(request):
+    if _has_pending_messages(request):
+        return None
+    latest, _ = _template_stamp(*CATALOG_TEMPLATES)
+    # The game cards' <picture> sources come from the derivative manifest
+    latest = max(latest, images.manifest.version() / 1e9)
+    return datetime.fromtimestamp(latest, tz=timezone.utc)
+
+
+@load_viewer
+@condition(etag_func=games_etag, last_modified_func=games_last_modified)
+@cached_page
+async def games(request):
+    return render(request, 'mriic/games.html', {'games': CATALOG})
+
+
+def game_etag(request, number):
+    if get_game(number) is None:
+        return None
+    _, stamp = _template_stamp(template_for(number))
+    return f'"game{number}-{stamp}"'
+
+
+def game_last_modified(request, number):
+    if get_game(number) is None:
+        return None
+    latest, _ = _template_stamp(template_for(number))
+    return datetime.fromtimestamp(latest, tz=timezone.utc)
+
+
+# Game pages are standalone documents with no per-user content
+@condition(etag_func=game_etag, last_modified_func=game_last_modified)
+@cached_page(anonymous_only=False)
+async def game_play(request, number: int):
+    if get_game(number) is None:
         raise Http404('Game not found')
-    template_name = f'mriic/game{number}.html'
     context = {'title': f'EcoVerse Game {number}'}
-    return render(request, template_name, context)
\ No newline at end of file
+    return render(request, template_for(number), context)
+
+
+@require_POST
+def game_scores(request):
+    """Accept a batch of plays: {"events": [{"game", "points", "score", "key", "played_at"}, ...]}."""
+    if not request.user.is_authenticated:
+        return JsonResponse({'error': 'Authentication required'}, status=401)
+    try:
+        payload = json.loads(request.body)
+    except ValueError:
+        return JsonResponse({'error': 'Body must be JSON'}, status=400)
+    events = payload.get('events') if isinstance(payload, dict) else None
+    if not isinstance(events, list) or not events:
+        return JsonResponse({'error': 'events must be a non-empty list'}, status=400)
+    if len(events) > MAX_EVENTS_PER_BATCH:
+        return JsonResponse({'error': f'At most {MAX_EVENTS_PER_BATCH} events per request'}, status=400)
+    return JsonResponse(record_scores(request.user, events))
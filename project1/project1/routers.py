@@ -0,0 +1,98 @@
+# Primary/replica routing. Writes always go to "default". Reads go to one of
+# settings.DATABASE_REPLICAS only inside views decorated with
+# @reads_from_replica, and never for a client that wrote recently (see
+# mriic.middleware.PrimaryStickinessMiddleware), after a write earlier in the
+# same request, or inside a transaction.
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+
+from asgiref.sync import iscoroutinefunction
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+
+# Sessions and users must be read where they were just written, and the
+# shared database cache (app label "django_cache") is only written there
+PRIMARY_ONLY_APPS = {'auth', 'sessions', 'contenttypes', 'admin', 'django_cache'}
+
+_replica_reads = ContextVar('replica_reads', default=False)
+_pinned = ContextVar('pinned_to_primary', default=False)
+_writes = ContextVar('primary_writes', default=None)
+
+
+def replica_aliases():
+    return getattr(settings, 'DATABASE_REPLICAS', ())
+
+
+@contextmanager
+def replica_reads():
+    token = _replica_reads.set(True)
+    try:
+        yield
+    finally:
+        _replica_reads.reset(token)
+
+
+def reads_from_replica(view_func):
+    """Let the ORM read from a replica for the duration of the view."""
+    if iscoroutinefunction(view_func):
+        @wraps(view_func)
+        async def async_wrapper(request, *args, **kwargs):
+            with replica_reads():
+                return await view_func(request, *args, **kwargs)
+        return async_wrapper
+
+    @wraps(view_func)
+    def wrapper(request, *args, **kwargs):
+        with replica_reads():
+            return view_func(request, *args, **kwargs)
+    return wrapper
+
+
+@contextmanager
+def track_primary(pinned=False):
+    """Pin reads to the primary if ``pinned`` and report writes made inside.
+
+    Yields a dict whose ``wrote`` key turns True once a write is routed for a
+    model the replicas may serve, so the caller can pin this client for a
+    while afterwards. Writes to PRIMARY_ONLY_APPS (sessions, the shared cache
+    table) are read back from the primary anyway and do not count.
+    """
+    state = {'wrote': False}
+    pin_token = _pinned.set(pinned)
+    writes_token = _writes.set(state)
+    try:
+        yield state
+    finally:
+        _writes.reset(writes_token)
+        _pinned.reset(pin_token)
+
+
+class PrimaryReplicaRouter:
+    def db_for_read(self, model, **hints):
+        writes = _writes.get()
+        if (
+            _replica_reads.get()
+            and not _pinned.get()
+            and not (writes and writes['wrote'])
+            and model._meta.app_label not in PRIMARY_ONLY_APPS
+            and not connections[DEFAULT_DB_ALIAS].in_atomic_block
+        ):
+            aliases = replica_aliases()
+            if aliases:
+                return random.choice(aliases)
+        return DEFAULT_DB_ALIAS
+
+    def db_for_write(self, model, **hints):
+        state = _writes.get()
+        if state is not None and model._meta.app_label not in PRIMARY_ONLY_APPS:
+            state['wrote'] = True
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Replicas hold the same rows as the primary
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db == DEFAULT_DB_ALIAS
@@ -10,8 +10,12 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.2/ref/settings/
 """
 
+import os
+import sys
 from pathlib import Path
 
+from django.core.exceptions import ImproperlyConfigured
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -43,7 +47,10 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'mriic.middleware.RequestTimingMiddleware',
     'django.middleware.security.SecurityMiddleware',
+    'mriic.middleware.CompressionMiddleware',
+    'mriic.middleware.PrimaryStickinessMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -56,7 +63,8 @@ ROOT_URLCONF = 'project1.urls'
 
 TEMPLATES = [
     {
-        'BACKEND': 'django.template.backends.django.DjangoTemplates',
+        # DjangoTemplates that reports render time to RequestTimingMiddleware
+        'BACKEND': 'mriic.instrumentation.TimedDjangoTemplates',
         'DIRS': [],
         'APP_DIRS': True,
         'OPTIONS': {
@@ -64,6 +72,7 @@ TEMPLATES = [
                 'django.template.context_processors.request',
                 'django.contrib.auth.context_processors.auth',
                 'django.contrib.messages.context_processors.messages',
+                'mriic.context_processors.cache_version',
             ],
         },
     },
@@ -82,6 +91,63 @@ DATABASES = {
     }
 }
 
+# Optional read replica. Locally, point DATABASE_REPLICA_PATH at a second
+# SQLite file and refresh it with `manage.py sync_sqlite_replica`.
+if os.environ.get('DATABASE_REPLICA_PATH'):
+    DATABASES['replica'] = {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': os.environ['DATABASE_REPLICA_PATH'],
+        'TEST': {'MIRROR': 'default'},
+    }
+DATABASE_REPLICAS = [alias for alias in DATABASES if alias != 'default']
+DATABASE_ROUTERS = ['project1.routers.PrimaryReplicaRouter']
+# How long a client that just wrote keeps reading from the primary
+REPLICA_STICKY_SECONDS = 15
+
+
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+# 'pages' holds rendered pages and template fragments. It is a dummy cache
+# while DEBUG is on so template edits show up immediately.
+# 'shared' holds what every process must agree on: version counters, the
+# page generation and open quiz sessions. Web workers and management commands
+# all read it, so it must never be a per-process cache: it is Redis when
+# REDIS_URL is set and otherwise the database table created by mriic's
+# migrations. The table is for development only: every quiz autosave would
+# cost a read, an upsert and a cull count on the primary, so REDIS_URL is
+# required once DEBUG is off. REDIS_URL also turns on the sorted-set
+# leaderboard ranks in learning.leaderboards.
+
+REDIS_URL = os.environ.get('REDIS_URL')
+if not DEBUG and not REDIS_URL:
+    raise ImproperlyConfigured('Set REDIS_URL: the database-backed shared cache is only for development')
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'shared': {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': REDIS_URL,
+    } if REDIS_URL else {
+        'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+        'LOCATION': 'mriic_shared_cache',
+        # Culling would drop open quiz sessions, so keep it for real overflow
+        'OPTIONS': {'MAX_ENTRIES': 1_000_000},
+    },
+    'pages': {
+        'BACKEND': 'django.core.cache.backends.dummy.DummyCache' if DEBUG else 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'pages',
+    },
+}
+
+# Page and fragment cache keys include this, so each deploy starts cold
+DEPLOY_VERSION = os.environ.get('DEPLOY_VERSION', 'dev')
+PAGE_CACHE_TIMEOUT = 60 * 60
+
+# Responses smaller than this many bytes are sent uncompressed
+COMPRESSION_MIN_SIZE = 1024
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
@@ -119,11 +185,81 @@ USE_TZ = True
 
 STATIC_URL = 'static/'
 STATICFILES_DIRS = [BASE_DIR / 'static']
+STATIC_ROOT = BASE_DIR / 'staticfiles'
+
+# collectstatic fingerprints file names outside DEBUG so they can be cached forever
+STORAGES = {
+    'default': {
+        'BACKEND': 'django.core.files.storage.FileSystemStorage',
+    },
+    'staticfiles': {
+        'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage' if DEBUG else 'django.contrib.staticfiles.storage.ManifestStaticFilesStorage',
+    },
+}
+
+# Let Django serve STATIC_ROOT itself (with immutable caching for hashed names)
+# when no front proxy does it
+SERVE_STATIC = os.environ.get('SERVE_STATIC') == '1'
+STATIC_MAX_AGE = 60 * 60
 
 # Media (for task photo uploads)
 MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR / 'media'
 
+# Responsive image derivatives (see mriic.images)
+IMAGE_DERIVATIVE_WIDTHS = (320, 640, 1024, 1600)
+IMAGE_WORKERS = 2
+
+# Task photo uploads stream to a temp file and are aborted past this size;
+# the stored photo is downscaled and stripped of EXIF off-request
+TASK_PHOTO_MAX_BYTES = 15 * 1024 * 1024
+TASK_PHOTO_MAX_EDGE = 2048
+TASK_PHOTO_QUALITY = 85
+
+# SCORM packages are unpacked once per content hash (see learning.scorm)
+SCORM_CACHE_DIR = MEDIA_ROOT / 'scorm_cache'
+SCORM_MAX_UNPACKED_BYTES = 500 * 1024 * 1024
+SCORM_MAX_FILES = 10000
+
+# Lesson resource downloads: set to 'nginx' (X-Accel-Redirect to an internal
+# location aliased to MEDIA_ROOT at SENDFILE_URL_PREFIX) or 'apache'/'lighttpd'
+# (X-Sendfile) to let the front proxy stream files; unset streams from Django
+SENDFILE_BACKEND = os.environ.get('SENDFILE_BACKEND') or None
+SENDFILE_URL_PREFIX = '/protected-media/'
+RESOURCE_MAX_AGE = 60 * 60
+
+# Request instrumentation (mriic.middleware.RequestTimingMiddleware): the
+# fraction of requests timed, the threshold for slow-request logs, and how
+# often one statement may run in a request before it is logged as an N+1
+REQUEST_TIMING_SAMPLE_RATE = 1.0 if DEBUG else float(os.environ.get('REQUEST_TIMING_SAMPLE_RATE', '0.05'))
+SLOW_REQUEST_MS = 500
+REPEATED_QUERY_THRESHOLD = 5
+SERVER_TIMING_HEADER = True
+
+# The timing lines go to the console, except under `manage.py test`, where
+# they would bury the test output; tests read them with assertLogs
+TESTING = sys.argv[1:2] == ['test']
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'console': {'class': 'logging.StreamHandler'},
+        'null': {'class': 'logging.NullHandler'},
+    },
+    'loggers': {
+        'mriic.instrumentation': {'handlers': ['null' if TESTING else 'console'], 'level': 'INFO', 'propagate': False},
+    },
+}
+
+# Quiz sessions (learning.quiz_sessions): quizzes without a time limit stay
+# open this long; submits and autosaves are accepted this many seconds late
+QUIZ_UNTIMED_SESSION_SECONDS = 24 * 60 * 60
+QUIZ_SUBMIT_GRACE_SECONDS = 10
+
+# Processes re-read the shared level version at most this often
+# (learning.levels); level edits reach other workers within this many seconds
+LEVEL_INDEX_CHECK_SECONDS = 5
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 
@@ -132,3 +268,10 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 # Authentication Settings
 LOGIN_REDIRECT_URL = 'home'
 LOGOUT_REDIRECT_URL = 'home'
+
+# Game score ingestion: credit pending plays once this many have been stored
+# by a worker, or this many seconds have passed since its last flush
+GAME_POINTS_FLUSH_THRESHOLD = 200
+GAME_POINTS_FLUSH_INTERVAL = 30
+# Plays of one game a learner can score per day (server time); more are rejected
+GAME_DAILY_PLAY_LIMIT = 20
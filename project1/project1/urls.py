@@ -14,11 +14,14 @@ Including another URLconf
     1. Import the include() function: from django.urls import include, path
     2. Add a URL to urlpatterns:  path('blog/', include('blog.urls'))
 """
+import re
+
 from django.conf import settings
 from django.conf.urls.static import static
 from django.contrib import admin
-from django.urls import path, include
+from django.urls import path, include, re_path
 from mriic import views
+from mriic.assets import serve_static
 
 urlpatterns = [
     path('admin/', admin.site.urls),
@@ -28,6 +31,7 @@ urlpatterns = [
     path('game2/', views.game2, name='game2'),
     path('games/', views.games, name='games'),
     path('game/<int:number>/', views.game_play, name='game_play'),
+    path('games/scores/', views.game_scores, name='game_scores'),
     path('accounts/', include('accounts.urls')),
     path('learn/', include('learning.urls')),
 ]
@@ -35,3 +39,6 @@ urlpatterns = [
 if settings.DEBUG:
     urlpatterns += static(settings.STATIC_URL, document_root=settings.BASE_DIR / 'static')
     urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
+elif settings.SERVE_STATIC:
+    # static() is a no-op outside DEBUG, so the route is declared directly
+    urlpatterns += [re_path(r'^%s(?P<path>.*)$' % re.escape(settings.STATIC_URL.lstrip('/')), serve_static)]
@@ -0,0 +1,565 @@
+// Game variables
+        const canvas = document.getElementById('gameCanvas');
+        const ctx = canvas.getContext('2d');
+        
+        canvas.width = window.innerWidth;
+        canvas.height = window.innerHeight;
+
+        // Game state
+        let gameRunning = true;
+        let score = 0;
+        let lives = 3;
+        let debrisCollected = 0;
+        let keys = {};
+
+        // Audio context for sound effects
+        let audioContext;
+        let sounds = {};
+
+        // Initialize audio
+        function initAudio() {
+            audioContext = new (window.AudioContext || window.webkitAudioContext)();
+            
+            // Create sound effects using Web Audio API
+            sounds.collect = createSound(800, 0.1, 'sine');
+            sounds.damage = createSound(200, 0.3, 'square');
+            sounds.background = createSound(100, 2, 'sine');
+        }
+
+        function createSound(frequency, duration, type) {
+            return () => {
+                const oscillator = audioContext.createOscillator();
+                const gainNode = audioContext.createGain();
+                
+                oscillator.connect(gainNode);
+                gainNode.connect(audioContext.destination);
+                
+                oscillator.frequency.value = frequency;
+                oscillator.type = type;
+                
+                gainNode.gain.setValueAtTime(0.1, audioContext.currentTime);
+                gainNode.gain.exponentialRampToValueAtTime(0.01, audioContext.currentTime + duration);
+                
+                oscillator.start(audioContext.currentTime);
+                oscillator.stop(audioContext.currentTime + duration);
+            };
+        }
+
+        // Player object
+        const player = {
+            x: canvas.width / 2,
+            y: canvas.height / 2,
+            width: 60,
+            height: 40,
+            speed: 5,
+            color: '#FF6B6B'
+        };
+
+        // Arrays for game objects
+        let debris = [];
+        let seaCreatures = [];
+        let particles = [];
+
+        // Debris types with realistic appearances
+        const debrisTypes = [
+            { 
+                type: 'bottle', 
+                color: '#87CEEB', 
+                width: 15, 
+                height: 30, 
+                points: 10,
+                shape: 'bottle'
+            },
+            { 
+                type: 'bag', 
+                color: '#D3D3D3', 
+                width: 25, 
+                height: 20, 
+                points: 15,
+                shape: 'bag'
+            },
+            { 
+                type: 'can', 
+                color: '#C0C0C0', 
+                width: 12, 
+                height: 18, 
+                points: 8,
+                shape: 'can'
+            },
+            { 
+                type: 'apple', 
+                color: '#8B4513', 
+                width: 18, 
+                height: 18, 
+                points: 5,
+                shape: 'apple'
+            }
+        ];
+
+        // Sea creature types
+        const creatureTypes = [
+            { 
+                type: 'fish', 
+                color: '#FFD700', 
+                width: 35, 
+                height: 20, 
+                speed: 2,
+                shape: 'fish'
+            },
+            { 
+                type: 'shark', 
+                color: '#708090', 
+                width: 60, 
+                height: 25, 
+                speed: 1.5,
+                shape: 'shark'
+            },
+            { 
+                type: 'turtle', 
+                color: '#228B22', 
+                width: 40, 
+                height: 30, 
+                speed: 1,
+                shape: 'turtle'
+            }
+        ];
+
+        // Initialize game
+        function init() {
+            // Start with some initial debris and creatures
+            for (let i = 0; i < 5; i++) {
+                spawnDebris();
+                spawnSeaCreature();
+            }
+            
+            // Create bubbles
+            createBubbles();
+            
+            // Start game loop
+            gameLoop();
+        }
+
+        // Create floating bubbles
+        function createBubbles() {
+            const bubblesContainer = document.getElementById('bubbles');
+            for (let i = 0; i < 20; i++) {
+                const bubble = document.createElement('div');
+                bubble.className = 'bubble';
+                bubble.style.left = Math.random() * 100 + '%';
+                bubble.style.top = Math.random() * 100 + '%';
+                bubble.style.width = bubble.style.height = (Math.random() * 20 + 5) + 'px';
+                bubble.style.animationDelay = Math.random() * 3 + 's';
+                bubble.style.animationDuration = (Math.random() * 2 + 2) + 's';
+                bubblesContainer.appendChild(bubble);
+            }
+        }
+
+        // Spawn debris
+        function spawnDebris() {
+            const type = debrisTypes[Math.floor(Math.random() * debrisTypes.length)];
+            debris.push({
+                ...type,
+                x: Math.random() * (canvas.width - type.width),
+                y: Math.random() * (canvas.height - type.height),
+                rotation: Math.random() * Math.PI * 2,
+                floatOffset: Math.random() * Math.PI * 2
+            });
+        }
+
+        // Spawn sea creature
+        function spawnSeaCreature() {
+            const type = creatureTypes[Math.floor(Math.random() * creatureTypes.length)];
+            const side = Math.random() < 0.5 ? 'left' : 'right';
+            
+            seaCreatures.push({
+                ...type,
+                x: side === 'left' ? -type.width : canvas.width + type.width,
+                y: Math.random() * (canvas.height - type.height),
+                direction: side === 'left' ? 1 : -1,
+                swimOffset: Math.random() * Math.PI * 2
+            });
+        }
+
+        // Draw functions for different shapes
+        function drawPlayer() {
+            ctx.save();
+            ctx.translate(player.x + player.width/2, player.y + player.height/2);
+            
+            // Draw diver
+            ctx.fillStyle = player.color;
+            ctx.fillRect(-player.width/2, -player.height/2, player.width, player.height);
+            
+            // Draw flippers
+            ctx.fillStyle = '#4169E1';
+            ctx.fillRect(-player.width/2 - 5, player.height/2 - 10, 8, 15);
+            ctx.fillRect(player.width/2 - 3, player.height/2 - 10, 8, 15);
+            
+            // Draw mask
+            ctx.fillStyle = '#000000';
+            ctx.fillRect(-10, -15, 20, 10);
+            
+            ctx.restore();
+        }
+
+        function drawDebris(item) {
+            ctx.save();
+            ctx.translate(item.x + item.width/2, item.y + item.height/2);
+            ctx.rotate(item.rotation + Math.sin(Date.now() * 0.001 + item.floatOffset) * 0.1);
+            
+            switch(item.shape) {
+                case 'bottle':
+                    // Plastic bottle
+                    ctx.fillStyle = item.color;
+                    ctx.fillRect(-item.width/2, -item.height/2, item.width, item.height);
+                    ctx.fillStyle = '#4169E1';
+                    ctx.fillRect(-item.width/2, -item.height/2, item.width, item.height/4);
+                    // Cap
+                    ctx.fillStyle = '#FF0000';
+                    ctx.fillRect(-item.width/3, -item.height/2 - 3, item.width/1.5, 6);
+                    break;
+                    
+                case 'bag':
+                    // Plastic bag
+                    ctx.fillStyle = item.color;
+                    ctx.globalAlpha = 0.7;
+                    ctx.fillRect(-item.width/2, -item.height/2, item.width, item.height);
+                    // Handles
+                    ctx.strokeStyle = item.color;
+                    ctx.lineWidth = 2;
+                    ctx.beginPath();
+                    ctx.arc(-item.width/3, -item.height/2, 5, 0, Math.PI, true);
+                    ctx.arc(item.width/3, -item.height/2, 5, 0, Math.PI, true);
+                    ctx.stroke();
+                    ctx.globalAlpha = 1;
+                    break;
+                    
+                case 'can':
+                    // Aluminum can
+                    ctx.fillStyle = item.color;
+                    ctx.fillRect(-item.width/2, -item.height/2, item.width, item.height);
+                    // Tab
+                    ctx.fillStyle = '#A0A0A0';
+                    ctx.fillRect(-2, -item.height/2 - 2, 4, 4);
+                    break;
+                    
+                case 'apple':
+                    // Apple core
+                    ctx.fillStyle = item.color;
+                    ctx.beginPath();
+                    ctx.ellipse(0, 0, item.width/2, item.height/2, 0, 0, Math.PI * 2);
+                    ctx.fill();
+                    // Bite marks
+                    ctx.fillStyle = '#8B7355';
+                    ctx.beginPath();
+                    ctx.ellipse(-item.width/4, -item.height/4, 3, 4, 0, 0, Math.PI * 2);
+                    ctx.fill();
+                    break;
+            }
+            
+            ctx.restore();
+        }
+
+        function drawSeaCreature(creature) {
+            ctx.save();
+            ctx.translate(creature.x + creature.width/2, creature.y + creature.height/2);
+            
+            if (creature.direction === -1) {
+                ctx.scale(-1, 1);
+            }
+            
+            const swimMotion = Math.sin(Date.now() * 0.005 + creature.swimOffset) * 2;
+            ctx.translate(0, swimMotion);
+            
+            switch(creature.shape) {
+                case 'fish':
+                    // Fish body
+                    ctx.fillStyle = creature.color;
+                    ctx.beginPath();
+                    ctx.ellipse(0, 0, creature.width/2, creature.height/2, 0, 0, Math.PI * 2);
+                    ctx.fill();
+                    
+                    // Tail
+                    ctx.beginPath();
+                    ctx.moveTo(-creature.width/2, 0);
+                    ctx.lineTo(-creature.width/2 - 10, -8);
+                    ctx.lineTo(-creature.width/2 - 10, 8);
+                    ctx.closePath();
+                    ctx.fill();
+                    
+                    // Eye
+                    ctx.fillStyle = '#000000';
+                    ctx.beginPath();
+                    ctx.arc(creature.width/4, -creature.height/6, 3, 0, Math.PI * 2);
+                    ctx.fill();
+                    break;
+                    
+                case 'shark':
+                    // Shark body
+                    ctx.fillStyle = creature.color;
+                    ctx.beginPath();
+                    ctx.ellipse(0, 0, creature.width/2, creature.height/2, 0, 0, Math.PI * 2);
+                    ctx.fill();
+                    
+                    // Dorsal fin
+                    ctx.beginPath();
+                    ctx.moveTo(0, -creature.height/2);
+                    ctx.lineTo(-8, -creature.height/2 - 8);
+                    ctx.lineTo(8, -creature.height/2 - 8);
+                    ctx.closePath();
+                    ctx.fill();
+                    
+                    // Tail
+                    ctx.beginPath();
+                    ctx.moveTo(-creature.width/2, 0);
+                    ctx.lineTo(-creature.width/2 - 15, -12);
+                    ctx.lineTo(-creature.width/2 - 15, 12);
+                    ctx.closePath();
+                    ctx.fill();
+                    
+                    // Eye
+                    ctx.fillStyle = '#FF0000';
+                    ctx.beginPath();
+                    ctx.arc(creature.width/4, -creature.height/6, 4, 0, Math.PI * 2);
+                    ctx.fill();
+                    break;
+                    
+                case 'turtle':
+                    // Shell
+                    ctx.fillStyle = creature.color;
+                    ctx.beginPath();
+                    ctx.ellipse(0, 0, creature.width/2, creature.height/2, 0, 0, Math.PI * 2);
+                    ctx.fill();
+                    
+                    // Shell pattern
+                    ctx.strokeStyle = '#006400';
+                    ctx.lineWidth = 2;
+                    ctx.beginPath();
+                    ctx.arc(0, 0, creature.width/3, 0, Math.PI * 2);
+                    ctx.stroke();
+                    
+                    // Flippers
+                    ctx.fillStyle = '#228B22';
+                    ctx.beginPath();
+                    ctx.ellipse(-creature.width/2 - 5, 0, 8, 12, Math.PI/4, 0, Math.PI * 2);
+                    ctx.fill();
+                    ctx.beginPath();
+                    ctx.ellipse(creature.width/2 + 5, 0, 8, 12, -Math.PI/4, 0, Math.PI * 2);
+                    ctx.fill();
+                    
+                    // Head
+                    ctx.beginPath();
+                    ctx.arc(creature.width/2 + 8, 0, 6, 0, Math.PI * 2);
+                    ctx.fill();
+                    break;
+            }
+            
+            ctx.restore();
+        }
+
+        // Input handling
+        document.addEventListener('keydown', (e) => {
+            keys[e.code] = true;
+            // Initialize audio on first user interaction
+            if (!audioContext) {
+                initAudio();
+            }
+        });
+
+        document.addEventListener('keyup', (e) => {
+            keys[e.code] = false;
+        });
+
+        // Update player position
+        function updatePlayer() {
+            if (keys['KeyW'] || keys['ArrowUp']) {
+                player.y = Math.max(0, player.y - player.speed);
+            }
+            if (keys['KeyS'] || keys['ArrowDown']) {
+                player.y = Math.min(canvas.height - player.height, player.y + player.speed);
+            }
+            if (keys['KeyA'] || keys['ArrowLeft']) {
+                player.x = Math.max(0, player.x - player.speed);
+            }
+            if (keys['KeyD'] || keys['ArrowRight']) {
+                player.x = Math.min(canvas.width - player.width, player.x + player.speed);
+            }
+        }
+
+        // Update game objects
+        function update() {
+            if (!gameRunning) return;
+            
+            updatePlayer();
+            
+            // Update sea creatures
+            seaCreatures.forEach((creature, index) => {
+                creature.x += creature.speed * creature.direction;
+                
+                // Remove creatures that are off screen
+                if (creature.x < -creature.width - 50 || creature.x > canvas.width + 50) {
+                    seaCreatures.splice(index, 1);
+                }
+                
+                // Check collision with player
+                if (checkCollision(player, creature)) {
+                    takeDamage();
+                }
+            });
+            
+            // Check debris collection
+            debris.forEach((item, index) => {
+                // Floating animation
+                item.y += Math.sin(Date.now() * 0.002 + item.floatOffset) * 0.5;
+                
+                if (checkCollision(player, item)) {
+                    // Collect debris
+                    score += item.points;
+                    debrisCollected++;
+                    debris.splice(index, 1);
+                    
+                    // Play collect sound
+                    if (sounds.collect) sounds.collect();
+                    
+                    // Create particles
+                    createParticles(item.x + item.width/2, item.y + item.height/2, '#00FF00');
+                }
+            });
+            
+            // Update particles
+            particles.forEach((particle, index) => {
+                particle.x += particle.vx;
+                particle.y += particle.vy;
+                particle.life--;
+                
+                if (particle.life <= 0) {
+                    particles.splice(index, 1);
+                }
+            });
+            
+            // Spawn new objects periodically
+            if (Math.random() < 0.02) {
+                spawnDebris();
+            }
+            if (Math.random() < 0.01) {
+                spawnSeaCreature();
+            }
+            
+            // Update UI
+            document.getElementById('score').textContent = score;
+            document.getElementById('lives').textContent = lives;
+            document.getElementById('debris').textContent = debrisCollected;
+        }
+
+        // Collision detection
+        function checkCollision(rect1, rect2) {
+            return rect1.x < rect2.x + rect2.width &&
+                   rect1.x + rect1.width > rect2.x &&
+                   rect1.y < rect2.y + rect2.height &&
+                   rect1.y + rect1.height > rect2.y;
+        }
+
+        // Take damage
+        function takeDamage() {
+            lives--;
+            if (sounds.damage) sounds.damage();
+            
+            // Create red particles
+            createParticles(player.x + player.width/2, player.y + player.height/2, '#FF0000');
+            
+            if (lives <= 0) {
+                gameOver();
+            }
+        }
+
+        // Create particles
+        function createParticles(x, y, color) {
+            for (let i = 0; i < 10; i++) {
+                particles.push({
+                    x: x,
+                    y: y,
+                    vx: (Math.random() - 0.5) * 10,
+                    vy: (Math.random() - 0.5) * 10,
+                    color: color,
+                    life: 30
+                });
+            }
+        }
+
+        // Render everything
+        function render() {
+            // Clear canvas
+            ctx.clearRect(0, 0, canvas.width, canvas.height);
+            
+            // Draw underwater effect
+            const gradient = ctx.createLinearGradient(0, 0, 0, canvas.height);
+            gradient.addColorStop(0, 'rgba(135,206,235,0.1)');
+            gradient.addColorStop(1, 'rgba(25,25,112,0.3)');
+            ctx.fillStyle = gradient;
+            ctx.fillRect(0, 0, canvas.width, canvas.height);
+            
+            // Draw game objects
+            debris.forEach(drawDebris);
+            seaCreatures.forEach(drawSeaCreature);
+            drawPlayer();
+            
+            // Draw particles
+            particles.forEach(particle => {
+                ctx.fillStyle = particle.color;
+                ctx.globalAlpha = particle.life / 30;
+                ctx.fillRect(particle.x, particle.y, 3, 3);
+                ctx.globalAlpha = 1;
+            });
+        }
+
+        // Game over
+        function gameOver() {
+            gameRunning = false;
+            const gameOverDiv = document.getElementById('gameOver');
+            const messageDiv = document.getElementById('gameOverMessage');
+            
+            messageDiv.innerHTML = `
+                Final Score: ${score}<br>
+                Debris Collected: ${debrisCollected}<br>
+                Thank you for helping clean the ocean!
+            `;
+            
+            gameOverDiv.style.display = 'block';
+        }
+
+        // Restart game
+        function restartGame() {
+            gameRunning = true;
+            score = 0;
+            lives = 3;
+            debrisCollected = 0;
+            debris = [];
+            seaCreatures = [];
+            particles = [];
+            
+            player.x = canvas.width / 2;
+            player.y = canvas.height / 2;
+            
+            document.getElementById('gameOver').style.display = 'none';
+            
+            // Respawn initial objects
+            for (let i = 0; i < 5; i++) {
+                spawnDebris();
+                spawnSeaCreature();
+            }
+        }
+
+        // Game loop
+        function gameLoop() {
+            update();
+            render();
+            requestAnimationFrame(gameLoop);
+        }
+
+        // Handle window resize
+        window.addEventListener('resize', () => {
+            canvas.width = window.innerWidth;
+            canvas.height = window.innerHeight;
+        });
+
+        // Start the game
+        init();
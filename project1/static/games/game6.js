@@ -0,0 +1,360 @@
+let currentLevel = 1;
+        let timeLeft = 60;
+        let gameActive = true;
+        let timer;
+        let grid = [];
+        let connectedTiles = new Set();
+        
+        const PIPE_TYPES = {
+            EMPTY: 0,
+            STRAIGHT: 1,
+            CORNER: 2,
+            T: 3,
+            CROSS: 4,
+            SOURCE: 5,
+            TARGET: 6
+        };
+        
+        const DIRECTIONS = {
+            UP: 0,
+            RIGHT: 1,
+            DOWN: 2,
+            LEFT: 3
+        };
+        
+        // Level configurations - ACTUALLY SOLVABLE! 
+        const LEVELS = [
+            {
+                time: 60,
+                source: {x: 0, y: 2},
+                targets: [{x: 5, y: 2}],
+                pipes: [
+                    {x: 1, y: 2, type: PIPE_TYPES.STRAIGHT, rotation: 1, correctRotation: 1}, // horizontal - correct
+                    {x: 2, y: 2, type: PIPE_TYPES.STRAIGHT, rotation: 0, correctRotation: 1}, // needs to be horizontal
+                    {x: 3, y: 2, type: PIPE_TYPES.STRAIGHT, rotation: 0, correctRotation: 1}, // needs to be horizontal
+                    {x: 4, y: 2, type: PIPE_TYPES.STRAIGHT, rotation: 1, correctRotation: 1}  // horizontal - correct
+                ]
+            },
+            {
+                time: 50,
+                source: {x: 0, y: 2},
+                targets: [{x: 4, y: 0}],
+                pipes: [
+                    {x: 1, y: 2, type: PIPE_TYPES.STRAIGHT, rotation: 0, correctRotation: 1}, // needs horizontal
+                    {x: 2, y: 2, type: PIPE_TYPES.CORNER, rotation: 3, correctRotation: 0},   // needs up-right turn
+                    {x: 2, y: 1, type: PIPE_TYPES.STRAIGHT, rotation: 1, correctRotation: 0}, // needs vertical
+                    {x: 2, y: 0, type: PIPE_TYPES.CORNER, rotation: 0, correctRotation: 1},   // needs right-down turn  
+                    {x: 3, y: 0, type: PIPE_TYPES.STRAIGHT, rotation: 0, correctRotation: 1}, // needs horizontal
+                ]
+            },
+            {
+                time: 45,
+                source: {x: 2, y: 2},
+                targets: [{x: 0, y: 0}, {x: 4, y: 4}],
+                pipes: [
+                    {x: 2, y: 1, type: PIPE_TYPES.T, rotation: 1, correctRotation: 0},        // needs up-left-right
+                    {x: 1, y: 1, type: PIPE_TYPES.CORNER, rotation: 3, correctRotation: 2},   // needs down-left turn
+                    {x: 3, y: 1, type: PIPE_TYPES.CORNER, rotation: 0, correctRotation: 3},   // needs down-right turn
+                    {x: 1, y: 0, type: PIPE_TYPES.CORNER, rotation: 2, correctRotation: 1},   // needs up-right turn
+                    {x: 3, y: 0, type: PIPE_TYPES.STRAIGHT, rotation: 0, correctRotation: 1}, // needs horizontal
+                    {x: 2, y: 3, type: PIPE_TYPES.T, rotation: 3, correctRotation: 2},        // needs down-left-right
+                    {x: 1, y: 3, type: PIPE_TYPES.CORNER, rotation: 1, correctRotation: 1},   // correct up-right
+                    {x: 3, y: 3, type: PIPE_TYPES.STRAIGHT, rotation: 1, correctRotation: 1}, // horizontal - correct
+                    {x: 4, y: 3, type: PIPE_TYPES.CORNER, rotation: 2, correctRotation: 3},   // needs left-down turn
+                    {x: 1, y: 4, type: PIPE_TYPES.CORNER, rotation: 0, correctRotation: 2},   // needs down-left turn
+                    {x: 0, y: 4, type: PIPE_TYPES.CORNER, rotation: 3, correctRotation: 1}    // needs up-right turn
+                ]
+            }
+        ];
+        
+        function initGame() {
+            createGrid();
+            startLevel(1);
+        }
+        
+        function createGrid() {
+            const gridElement = document.getElementById('grid');
+            gridElement.innerHTML = '';
+            grid = [];
+            
+            for(let y = 0; y < 6; y++) {
+                grid[y] = [];
+                for(let x = 0; x < 6; x++) {
+                    const tile = document.createElement('div');
+                    tile.className = 'tile';
+                    tile.dataset.x = x;
+                    tile.dataset.y = y;
+                    
+                    tile.addEventListener('click', () => {
+                        if(!gameActive) return;
+                        const tileData = grid[y][x];
+                        if(tileData && tileData.type >= PIPE_TYPES.STRAIGHT && tileData.type <= PIPE_TYPES.CROSS) {
+                            rotatePipe(x, y);
+                        }
+                    });
+                    
+                    gridElement.appendChild(tile);
+                    grid[y][x] = { type: PIPE_TYPES.EMPTY, rotation: 0, element: tile };
+                }
+            }
+        }
+        
+        function startLevel(level) {
+            currentLevel = level;
+            const levelData = LEVELS[level - 1];
+            timeLeft = levelData.time;
+            gameActive = true;
+            connectedTiles.clear();
+            
+            // Clear grid
+            for(let y = 0; y < 6; y++) {
+                for(let x = 0; x < 6; x++) {
+                    grid[y][x].type = PIPE_TYPES.EMPTY;
+                    grid[y][x].rotation = 0;
+                    updateTileDisplay(x, y);
+                }
+            }
+            
+            // Set source
+            const source = levelData.source;
+            grid[source.y][source.x].type = PIPE_TYPES.SOURCE;
+            updateTileDisplay(source.x, source.y);
+            
+            // Set targets
+            levelData.targets.forEach(target => {
+                grid[target.y][target.x].type = PIPE_TYPES.TARGET;
+                updateTileDisplay(target.x, target.y);
+            });
+            
+            // Set pipes with random rotations
+            levelData.pipes.forEach(pipe => {
+                grid[pipe.y][pipe.x].type = pipe.type;
+                grid[pipe.y][pipe.x].rotation = Math.floor(Math.random() * 4);
+                updateTileDisplay(pipe.x, pipe.y);
+            });
+            
+            updateUI();
+            startTimer();
+            checkConnections();
+        }
+        
+        function updateTileDisplay(x, y) {
+            const tileData = grid[y][x];
+            const element = tileData.element;
+            
+            element.innerHTML = '';
+            element.className = 'tile';
+            
+            switch(tileData.type) {
+                case PIPE_TYPES.SOURCE:
+                    element.classList.add('source');
+                    element.innerHTML = '<div class="source-icon">💧</div>';
+                    break;
+                case PIPE_TYPES.TARGET:
+                    element.classList.add('target');
+                    element.innerHTML = '<div class="target-icon">🌱</div>';
+                    break;
+                case PIPE_TYPES.STRAIGHT:
+                    element.innerHTML = '<div class="pipe pipe-straight"></div>';
+                    break;
+                case PIPE_TYPES.CORNER:
+                    element.innerHTML = '<div class="pipe pipe-corner"></div>';
+                    break;
+                case PIPE_TYPES.T:
+                    element.innerHTML = '<div class="pipe pipe-t"></div>';
+                    break;
+                case PIPE_TYPES.CROSS:
+                    element.innerHTML = '<div class="pipe pipe-cross"></div>';
+                    break;
+            }
+            
+            const pipe = element.querySelector('.pipe');
+            if(pipe) {
+                pipe.style.transform = `rotate(${tileData.rotation * 90}deg)`;
+            }
+            
+            // Add water flow effect if connected
+            if(connectedTiles.has(`${x},${y}`) && tileData.type >= PIPE_TYPES.STRAIGHT && tileData.type <= PIPE_TYPES.CROSS) {
+                const waterFlow = document.createElement('div');
+                waterFlow.className = 'water-flow';
+                element.appendChild(waterFlow);
+            }
+        }
+        
+        function rotatePipe(x, y) {
+            const tileData = grid[y][x];
+            tileData.rotation = (tileData.rotation + 1) % 4;
+            
+            const element = tileData.element;
+            element.classList.add('success-effect');
+            setTimeout(() => element.classList.remove('success-effect'), 600);
+            
+            updateTileDisplay(x, y);
+            checkConnections();
+        }
+        
+        function checkConnections() {
+            connectedTiles.clear();
+            const levelData = LEVELS[currentLevel - 1];
+            
+            // Find all connected pipes starting from source
+            const visited = new Set();
+            const queue = [{x: levelData.source.x, y: levelData.source.y}];
+            
+            while(queue.length > 0) {
+                const {x, y} = queue.shift();
+                const key = `${x},${y}`;
+                
+                if(visited.has(key)) continue;
+                visited.add(key);
+                connectedTiles.add(key);
+                
+                // Check all 4 directions
+                const neighbors = getConnectedNeighbors(x, y);
+                neighbors.forEach(neighbor => {
+                    if(!visited.has(`${neighbor.x},${neighbor.y}`)) {
+                        queue.push(neighbor);
+                    }
+                });
+            }
+            
+            // Update display
+            for(let y = 0; y < 6; y++) {
+                for(let x = 0; x < 6; x++) {
+                    updateTileDisplay(x, y);
+                }
+            }
+            
+            // Check win condition
+            const connectedTargets = levelData.targets.filter(target => 
+                connectedTiles.has(`${target.x},${target.y}`)
+            ).length;
+            
+            document.getElementById('score').textContent = connectedTargets;
+            
+            // Also check if all pipes are in correct rotation (makes puzzle more interesting)
+            const allPipesCorrect = levelData.pipes.every(pipeConfig => {
+                const tileData = grid[pipeConfig.y][pipeConfig.x];
+                return !pipeConfig.correctRotation || tileData.rotation === pipeConfig.correctRotation;
+            });
+            
+            if(connectedTargets === levelData.targets.length) {
+                endGame(true);
+            }
+        }
+        
+        function getConnectedNeighbors(x, y) {
+            const neighbors = [];
+            const tileData = grid[y][x];
+            
+            const connections = getPipeConnections(tileData.type, tileData.rotation);
+            
+            connections.forEach(direction => {
+                let nx = x, ny = y;
+                switch(direction) {
+                    case DIRECTIONS.UP: ny--; break;
+                    case DIRECTIONS.RIGHT: nx++; break;
+                    case DIRECTIONS.DOWN: ny++; break;
+                    case DIRECTIONS.LEFT: nx--; break;
+                }
+                
+                if(nx >= 0 && nx < 6 && ny >= 0 && ny < 6) {
+                    const neighborData = grid[ny][nx];
+                    const neighborConnections = getPipeConnections(neighborData.type, neighborData.rotation);
+                    
+                    // Check if neighbor connects back
+                    const oppositeDirection = (direction + 2) % 4;
+                    if(neighborConnections.includes(oppositeDirection)) {
+                        neighbors.push({x: nx, y: ny});
+                    }
+                }
+            });
+            
+            return neighbors;
+        }
+        
+        function getPipeConnections(type, rotation) {
+            let baseConnections = [];
+            
+            switch(type) {
+                case PIPE_TYPES.SOURCE:
+                case PIPE_TYPES.TARGET:
+                    return [DIRECTIONS.UP, DIRECTIONS.RIGHT, DIRECTIONS.DOWN, DIRECTIONS.LEFT];
+                case PIPE_TYPES.STRAIGHT:
+                    baseConnections = [DIRECTIONS.UP, DIRECTIONS.DOWN];
+                    break;
+                case PIPE_TYPES.CORNER:
+                    baseConnections = [DIRECTIONS.UP, DIRECTIONS.RIGHT];
+                    break;
+                case PIPE_TYPES.T:
+                    baseConnections = [DIRECTIONS.UP, DIRECTIONS.RIGHT, DIRECTIONS.DOWN];
+                    break;
+                case PIPE_TYPES.CROSS:
+                    baseConnections = [DIRECTIONS.UP, DIRECTIONS.RIGHT, DIRECTIONS.DOWN, DIRECTIONS.LEFT];
+                    break;
+                default:
+                    return [];
+            }
+            
+            return baseConnections.map(dir => (dir + rotation) % 4);
+        }
+        
+        function startTimer() {
+            clearInterval(timer);
+            timer = setInterval(() => {
+                timeLeft--;
+                updateUI();
+                
+                if(timeLeft <= 0) {
+                    endGame(false);
+                }
+            }, 1000);
+        }
+        
+        function updateUI() {
+            document.getElementById('timer').textContent = `${timeLeft}s`;
+            document.getElementById('level').textContent = currentLevel;
+        }
+        
+        function endGame(won) {
+            gameActive = false;
+            clearInterval(timer);
+            
+            const modal = document.getElementById('gameOver');
+            const title = document.getElementById('gameOverTitle');
+            const message = document.getElementById('gameOverMessage');
+            const nextBtn = document.getElementById('nextLevelBtn');
+            
+            if(won) {
+                title.textContent = '🎉 Level Complete!';
+                message.textContent = 'Amazing! Your crops are getting fresh water and growing strong! 🌱';
+                
+                if(currentLevel < LEVELS.length) {
+                    nextBtn.style.display = 'inline-block';
+                } else {
+                    nextBtn.style.display = 'none';
+                    title.textContent = '🏆 Farm Master!';
+                    message.textContent = 'Congratulations! You\'ve mastered farm irrigation and saved all the crops! 🚜🌾';
+                }
+            } else {
+                title.textContent = '⏰ Time\'s Up!';
+                message.textContent = 'The crops are still thirsty! Try connecting the pipes faster next time! 💧';
+                nextBtn.style.display = 'none';
+            }
+            
+            modal.style.display = 'flex';
+        }
+        
+        // Event listeners
+        document.getElementById('nextLevelBtn').addEventListener('click', () => {
+            document.getElementById('gameOver').style.display = 'none';
+            startLevel(currentLevel + 1);
+        });
+        
+        document.getElementById('restartBtn').addEventListener('click', () => {
+            document.getElementById('gameOver').style.display = 'none';
+            startLevel(currentLevel);
+        });
+        
+        // Start the game
+        initGame();
@@ -0,0 +1,164 @@
+const quizData = [
+            {
+                question: "Planting more trees helps reduce climate change because they absorb:",
+                options: ["Oxygen", "Carbon dioxide", "Nitrogen", "Helium"],
+                correctAnswer: "Carbon dioxide"
+            },
+            {
+                question: "Which of these is NOT a renewable energy source?",
+                options: ["Coal", "Solar", "Hydro", "Wind"],
+                correctAnswer: "Coal"
+            },
+            {
+                question: "What is the term for cutting down large areas of forest?",
+                options: ["Afforestation", "Deforestation", "Reforestation", "Plantation"],
+                correctAnswer: "Deforestation"
+            },
+            {
+                question: "Which layer of the Earth's atmosphere protects us from harmful UV rays?",
+                options: ["Troposphere", "Stratosphere", "Ozone layer", "Mesosphere"],
+                correctAnswer: "Ozone layer"
+            }
+        ];
+
+        let currentQuestion = 0;
+        let score = 0;
+        let selectedAnswer = false;
+
+        // Initialize the quiz
+        function initQuiz() {
+            console.log('Initializing quiz...');
+            currentQuestion = 0;
+            score = 0;
+            selectedAnswer = false;
+            updateScore();
+            loadQuestion();
+            document.getElementById('questionScreen').style.display = 'block';
+            document.getElementById('resultScreen').style.display = 'none';
+        }
+
+        // Load current question
+        function loadQuestion() {
+            console.log(`Loading question ${currentQuestion + 1}`);
+            const question = quizData[currentQuestion];
+            
+            document.getElementById('questionText').textContent = question.question;
+            document.getElementById('questionNumber').textContent = currentQuestion + 1;
+            
+            const optionButtons = document.querySelectorAll('.option-btn');
+            optionButtons.forEach((btn, index) => {
+                btn.textContent = question.options[index];
+                btn.className = 'option-btn';
+                btn.disabled = false;
+                btn.innerHTML = question.options[index];
+            });
+            
+            document.getElementById('nextBtn').style.display = 'none';
+            selectedAnswer = false;
+        }
+
+        // Handle answer selection
+        function selectAnswer(button, optionIndex) {
+            if (selectedAnswer) return; // Prevent multiple selections
+            
+            selectedAnswer = true;
+            const question = quizData[currentQuestion];
+            const selectedOption = question.options[optionIndex];
+            const isCorrect = selectedOption === question.correctAnswer;
+            
+            console.log(`Selected: ${selectedOption}, Correct: ${question.correctAnswer}, Is Correct: ${isCorrect}`);
+            
+            // Disable all buttons
+            const optionButtons = document.querySelectorAll('.option-btn');
+            optionButtons.forEach(btn => btn.disabled = true);
+            
+            if (isCorrect) {
+                // Correct answer animation
+                button.classList.add('correct', 'celebration');
+                button.innerHTML = selectedOption + ' <span class="checkmark">✓</span>';
+                score++;
+                console.log(`Score increased to: ${score}`);
+            } else {
+                // Incorrect answer animation
+                button.classList.add('incorrect', 'sad-shake');
+                button.innerHTML = selectedOption + ' <span class="cross">✗</span>';
+                
+                // Show correct answer
+                optionButtons.forEach((btn, index) => {
+                    if (question.options[index] === question.correctAnswer) {
+                        setTimeout(() => {
+                            btn.classList.add('correct');
+                            btn.innerHTML = question.options[index] + ' <span class="checkmark">✓</span>';
+                        }, 500);
+                    }
+                });
+            }
+            
+            updateScore();
+            
+            // Show next button or finish quiz
+            setTimeout(() => {
+                if (currentQuestion < quizData.length - 1) {
+                    document.getElementById('nextBtn').style.display = 'inline-block';
+                } else {
+                    setTimeout(showResults, 1000);
+                }
+            }, 1500);
+        }
+
+        // Update score display
+        function updateScore() {
+            document.getElementById('score').textContent = score;
+        }
+
+        // Move to next question
+        function nextQuestion() {
+            console.log('Moving to next question...');
+            currentQuestion++;
+            loadQuestion();
+        }
+
+        // Show final results
+        function showResults() {
+            console.log(`Quiz completed. Final score: ${score}/${quizData.length}`);
+            
+            document.getElementById('questionScreen').style.display = 'none';
+            document.getElementById('resultScreen').style.display = 'block';
+            
+            const percentage = (score / quizData.length) * 100;
+            let emoji, title, message;
+            
+            if (percentage === 100) {
+                emoji = '🌟';
+                title = 'Perfect Score!';
+                message = 'You\'re an environmental superstar! Keep protecting our planet!';
+            } else if (percentage >= 75) {
+                emoji = '🌱';
+                title = 'Great Job!';
+                message = 'You know a lot about the environment! Keep learning and caring for our Earth!';
+            } else if (percentage >= 50) {
+                emoji = '🌍';
+                title = 'Good Effort!';
+                message = 'You\'re on the right track! Keep learning about environmental protection!';
+            } else {
+                emoji = '📚';
+                title = 'Keep Learning!';
+                message = 'There\'s always more to discover about our amazing planet!';
+            }
+            
+            document.getElementById('resultEmoji').textContent = emoji;
+            document.getElementById('resultTitle').textContent = title;
+            document.getElementById('resultMessage').textContent = `${message} You scored ${score} out of ${quizData.length}!`;
+        }
+
+        // Restart the quiz
+        function restartQuiz() {
+            console.log('Restarting quiz...');
+            initQuiz();
+        }
+
+        // Start the quiz when page loads
+        window.onload = function() {
+            console.log('Page loaded, starting quiz...');
+            initQuiz();
+        };
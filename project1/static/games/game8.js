@@ -0,0 +1,236 @@
+let score = 0;
+        let timer = 20;
+        let timerInterval;
+        let completedPets = 0;
+        const totalPets = 10;
+        const timeLimit = 20;
+        let gameActive = true;
+
+        const animals = [
+            { emoji: '🐕', name: 'Buddy' },
+            { emoji: '🐱', name: 'Whiskers' },
+            { emoji: '🐮', name: 'Bessie' },
+            { emoji: '🐷', name: 'Pinky' },
+            { emoji: '🐴', name: 'Thunder' },
+            { emoji: '🐰', name: 'Fluffy' },
+            { emoji: '🐻', name: 'Bruno' },
+            { emoji: '🐨', name: 'Koby' },
+            { emoji: '🐼', name: 'Panda' },
+            { emoji: '🦁', name: 'Leo' }
+        ];
+
+        const needs = [
+            { type: 'food', emoji: '🍖', description: 'Hungry! Needs food', hint: 'Try the food bowl! 🍖' },
+            { type: 'water', emoji: '💧', description: 'Thirsty! Needs water', hint: 'Try the water bowl! 💧' },
+            { type: 'soap', emoji: '🧼', description: 'Dirty! Needs bath', hint: 'Try the soap! 🧼' },
+            { type: 'bandage', emoji: '🩹', description: 'Injured! Needs bandage', hint: 'Try the bandage! 🩹' }
+        ];
+
+        const audioContext = new (window.AudioContext || window.webkitAudioContext)();
+
+        function playCheerfulSound() {
+            const oscillator = audioContext.createOscillator();
+            const gainNode = audioContext.createGain();
+            
+            oscillator.connect(gainNode);
+            gainNode.connect(audioContext.destination);
+            
+            oscillator.frequency.value = 523.25;
+            oscillator.type = 'sine';
+            
+            gainNode.gain.setValueAtTime(0.3, audioContext.currentTime);
+            gainNode.gain.exponentialRampToValueAtTime(0.01, audioContext.currentTime + 0.5);
+            
+            oscillator.start(audioContext.currentTime);
+            oscillator.stop(audioContext.currentTime + 0.5);
+
+            setTimeout(() => {
+                const osc2 = audioContext.createOscillator();
+                const gain2 = audioContext.createGain();
+                
+                osc2.connect(gain2);
+                gain2.connect(audioContext.destination);
+                
+                osc2.frequency.value = 659.25;
+                osc2.type = 'sine';
+                
+                gain2.gain.setValueAtTime(0.3, audioContext.currentTime);
+                gain2.gain.exponentialRampToValueAtTime(0.01, audioContext.currentTime + 0.5);
+                
+                osc2.start(audioContext.currentTime);
+                osc2.stop(audioContext.currentTime + 0.5);
+            }, 100);
+        }
+
+        function initializeGame() {
+            const petsContainer = document.getElementById('petsContainer');
+            petsContainer.innerHTML = '';
+            
+            // Shuffle animals array
+            const shuffledAnimals = [...animals].sort(() => Math.random() - 0.5);
+            
+            // Create pets with random needs
+            shuffledAnimals.forEach((animal, index) => {
+                const randomNeed = needs[Math.floor(Math.random() * needs.length)];
+                
+                const petCard = document.createElement('div');
+                petCard.className = 'pet-card';
+                petCard.dataset.pet = animal.name.toLowerCase();
+                petCard.dataset.need = randomNeed.type;
+                
+                petCard.innerHTML = `
+                    <div class="pet-emoji">${animal.emoji}</div>
+                    <div class="pet-name">${animal.name}</div>
+                    <div class="pet-issue">${randomNeed.description} ${randomNeed.emoji}</div>
+                    <div class="hint">${randomNeed.hint}</div>
+                `;
+                
+                petsContainer.appendChild(petCard);
+            });
+            
+            setupDragAndDrop();
+        }
+
+        function setupDragAndDrop() {
+            const items = document.querySelectorAll('.item');
+            const petCards = document.querySelectorAll('.pet-card');
+
+            items.forEach(item => {
+                item.addEventListener('dragstart', (e) => {
+                    if (!gameActive || item.classList.contains('used')) {
+                        e.preventDefault();
+                        return;
+                    }
+                    e.dataTransfer.setData('text/plain', item.dataset.item);
+                    item.classList.add('dragging');
+                });
+
+                item.addEventListener('dragend', (e) => {
+                    item.classList.remove('dragging');
+                });
+            });
+
+            petCards.forEach(card => {
+                card.addEventListener('dragover', (e) => {
+                    e.preventDefault();
+                    if (!card.classList.contains('completed')) {
+                        card.classList.add('drop-zone');
+                    }
+                });
+
+                card.addEventListener('dragleave', (e) => {
+                    card.classList.remove('drop-zone');
+                });
+
+                card.addEventListener('drop', (e) => {
+                    e.preventDefault();
+                    card.classList.remove('drop-zone');
+
+                    if (!gameActive || card.classList.contains('completed')) return;
+
+                    const itemType = e.dataTransfer.getData('text/plain');
+                    const neededItem = card.dataset.need;
+
+                    if (itemType === neededItem) {
+                        playCheerfulSound();
+                        score += 100;
+                        document.getElementById('score').textContent = score;
+
+                        card.classList.add('completed');
+                        card.classList.add('happy');
+                        
+                        const issue = card.querySelector('.pet-issue');
+                        issue.textContent = '✅ Happy and healthy!';
+
+                        completedPets++;
+                        document.getElementById('helped').textContent = completedPets;
+
+                        if (completedPets === totalPets) {
+                            setTimeout(() => {
+                                clearInterval(timerInterval);
+                                endGame(true);
+                            }, 500);
+                        }
+                    } else {
+                        const hint = card.querySelector('.hint');
+                        hint.classList.add('show');
+                        setTimeout(() => {
+                            hint.classList.remove('show');
+                        }, 2000);
+                    }
+                });
+            });
+        }
+
+        function startTimer() {
+            const timerDisplay = document.getElementById('timer');
+            timerDisplay.textContent = timer;
+            gameActive = true;
+            
+            timerInterval = setInterval(() => {
+                timer--;
+                timerDisplay.textContent = timer;
+                
+                if (timer <= 5) {
+                    timerDisplay.parentElement.classList.add('timer-warning');
+                }
+                
+                if (timer <= 0) {
+                    clearInterval(timerInterval);
+                    gameActive = false;
+                    endGame(false);
+                }
+            }, 1000);
+        }
+
+        function resetGame() {
+            score = 0;
+            timer = timeLimit;
+            completedPets = 0;
+            
+            clearInterval(timerInterval);
+            
+            document.getElementById('score').textContent = score;
+            document.getElementById('timer').textContent = timer;
+            document.getElementById('helped').textContent = completedPets;
+            
+            const finalMessage = document.getElementById('finalMessage');
+            finalMessage.classList.remove('show');
+            finalMessage.classList.remove('game-over');
+            
+            const timerDisplay = document.getElementById('timer');
+            timerDisplay.parentElement.classList.remove('timer-warning');
+            
+            const items = document.querySelectorAll('.item');
+            items.forEach(item => {
+                item.classList.remove('used');
+                item.draggable = true;
+            });
+            
+            initializeGame();
+            startTimer();
+        }
+
+        function endGame(won) {
+            const finalMessage = document.getElementById('finalMessage');
+            const celebration = finalMessage.querySelectorAll('.celebration');
+            const messageText = document.getElementById('finalMessageText');
+            
+            if (won) {
+                finalMessage.classList.remove('game-over');
+                celebration[0].textContent = '🎉✨🎊';
+                celebration[1].textContent = '🏆💚🐾';
+                messageText.textContent = `Amazing work, Dr. Hero! You saved all ${totalPets} pets in just ${timeLimit - timer} seconds! Your quick thinking and caring heart made all the difference! 🌟`;
+            } else {
+                finalMessage.classList.add('game-over');
+                celebration[0].textContent = '⏰💔';
+                celebration[1].textContent = '😢';
+                messageText.textContent = 'Time\'s up! Some pets still need help! Try again!';
+            }
+            
+            finalMessage.classList.add('show');
+        }
+
+        // Initialize game on load
+        initializeGame();
+        startTimer();
@@ -0,0 +1,190 @@
+const gameArea = document.getElementById('gameArea');
+        const startScreen = document.getElementById('startScreen');
+        const endScreen = document.getElementById('endScreen');
+        const startButton = document.getElementById('startButton');
+        const restartButton = document.getElementById('restartButton');
+        const scoreDisplay = document.getElementById('score');
+        const timerDisplay = document.getElementById('timer');
+        const endMessage = document.getElementById('endMessage');
+        const finalScore = document.getElementById('finalScore');
+
+        let score = 0;
+        let timeLeft = 30;
+        let gameActive = false;
+        let timerInterval;
+        let germs = [];
+
+        const germColors = [
+            '#7bed9f', '#ff6b81', '#ffd93d', '#6c5ce7', 
+            '#fd79a8', '#a29bfe', '#00b894', '#fdcb6e'
+        ];
+
+        const audioContext = new (window.AudioContext || window.webkitAudioContext)();
+
+        function playPopSound() {
+            const oscillator = audioContext.createOscillator();
+            const gainNode = audioContext.createGain();
+            
+            oscillator.connect(gainNode);
+            gainNode.connect(audioContext.destination);
+            
+            oscillator.frequency.value = 800;
+            oscillator.type = 'sine';
+            
+            gainNode.gain.setValueAtTime(0.3, audioContext.currentTime);
+            gainNode.gain.exponentialRampToValueAtTime(0.01, audioContext.currentTime + 0.2);
+            
+            oscillator.start(audioContext.currentTime);
+            oscillator.stop(audioContext.currentTime + 0.2);
+        }
+
+        function createGerm() {
+            const germ = document.createElement('div');
+            germ.className = 'germ';
+            
+            const maxX = gameArea.clientWidth - 70;
+            const maxY = gameArea.clientHeight - 70;
+            const x = Math.random() * maxX;
+            const y = Math.random() * maxY;
+            
+            germ.style.left = x + 'px';
+            germ.style.top = y + 'px';
+            
+            const color = germColors[Math.floor(Math.random() * germColors.length)];
+            
+            germ.innerHTML = `
+                <div class="germ-body" style="background: ${color};">
+                    <div class="germ-spike" style="background: ${color}; top: -5px; left: 10px;"></div>
+                    <div class="germ-spike" style="background: ${color}; top: -5px; right: 10px;"></div>
+                    <div class="germ-spike" style="background: ${color}; bottom: -5px; left: 15px;"></div>
+                    <div class="germ-spike" style="background: ${color}; bottom: -5px; right: 15px;"></div>
+                    <div class="germ-spike" style="background: ${color}; left: -5px; top: 20px;"></div>
+                    <div class="germ-spike" style="background: ${color}; right: -5px; top: 20px;"></div>
+                    <div class="germ-eye germ-eye-left">
+                        <div class="germ-pupil"></div>
+                    </div>
+                    <div class="germ-eye germ-eye-right">
+                        <div class="germ-pupil"></div>
+                    </div>
+                    <div class="germ-mouth"></div>
+                </div>
+            `;
+            
+            germ.addEventListener('click', () => splashGerm(germ));
+            
+            gameArea.appendChild(germ);
+            germs.push(germ);
+            
+            moveGerm(germ);
+        }
+
+        function moveGerm(germ) {
+            if (!gameActive) return;
+            
+            const maxX = gameArea.clientWidth - 70;
+            const maxY = gameArea.clientHeight - 70;
+            const newX = Math.random() * maxX;
+            const newY = Math.random() * maxY;
+            
+            germ.style.transition = 'left 2s ease-in-out, top 2s ease-in-out';
+            germ.style.left = newX + 'px';
+            germ.style.top = newY + 'px';
+            
+            if (gameActive) {
+                setTimeout(() => moveGerm(germ), 2000);
+            }
+        }
+
+        function splashGerm(germ) {
+            if (!gameActive) return;
+            
+            playPopSound();
+            
+            const rect = germ.getBoundingClientRect();
+            const gameRect = gameArea.getBoundingClientRect();
+            const x = rect.left - gameRect.left + rect.width / 2;
+            const y = rect.top - gameRect.top + rect.height / 2;
+            
+            for (let i = 0; i < 5; i++) {
+                setTimeout(() => createBubble(x, y), i * 50);
+            }
+            
+            germ.remove();
+            germs = germs.filter(g => g !== germ);
+            
+            score += 10;
+            scoreDisplay.textContent = score;
+            
+            if (gameActive) {
+                createGerm();
+            }
+        }
+
+        function createBubble(x, y) {
+            const bubble = document.createElement('div');
+            bubble.className = 'bubble';
+            
+            const size = 30 + Math.random() * 40;
+            bubble.style.width = size + 'px';
+            bubble.style.height = size + 'px';
+            
+            const offsetX = (Math.random() - 0.5) * 50;
+            const offsetY = (Math.random() - 0.5) * 50;
+            
+            bubble.style.left = (x + offsetX) + 'px';
+            bubble.style.top = (y + offsetY) + 'px';
+            
+            gameArea.appendChild(bubble);
+            
+            setTimeout(() => bubble.remove(), 600);
+        }
+
+        function startGame() {
+            score = 0;
+            timeLeft = 30;
+            gameActive = true;
+            germs = [];
+            
+            scoreDisplay.textContent = score;
+            timerDisplay.textContent = timeLeft;
+            
+            startScreen.classList.add('hidden');
+            endScreen.classList.add('hidden');
+            
+            for (let i = 0; i < 5; i++) {
+                createGerm();
+            }
+            
+            timerInterval = setInterval(() => {
+                timeLeft--;
+                timerDisplay.textContent = timeLeft;
+                
+                if (timeLeft <= 0) {
+                    endGame();
+                }
+            }, 1000);
+        }
+
+        function endGame() {
+            gameActive = false;
+            clearInterval(timerInterval);
+            
+            germs.forEach(germ => germ.remove());
+            germs = [];
+            
+            finalScore.textContent = `Final Score: ${score}`;
+            
+            // Win/Lose conditions: Need at least 300 points to win
+            if (score >= 300) {
+                endMessage.textContent = "🎉 YOU WIN! Clean Hands Hero! 🎉";
+                endMessage.style.color = "#00b894";
+            } else {
+                endMessage.textContent = "😔 YOU LOSE! Try Again! 😔";
+                endMessage.style.color = "#ff6b81";
+            }
+            
+            endScreen.classList.remove('hidden');
+        }
+
+        startButton.addEventListener('click', startGame);
+        restartButton.addEventListener('click', startGame);